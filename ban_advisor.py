@@ -0,0 +1,161 @@
+"""
+밴 단계 위협도 순위.
+
+상대가 (챔피언, 라인)을 고른다고 가정했을 때 우리 팀 조합 점수가 얼마나 떨어지는지를
+매치업 데이터를 상대 관점으로 뒤집어 계산합니다.
+
+- 이미 고른 아군: 상대 후보가 카운터 항목으로 추가됐을 때의 슬롯 점수 감소 (score_slot과 같은 규칙)
+- 아직 비어 있는 아군 라인: 후보 파일의 그 라인 카운터 목록(lane_batch) 평균으로 본 기대 감소
+  (나머지 상대 라인은 모두 50%로 채워진다고 가정)
+- 상대 시너지: 이미 고른 상대 챔피언들과의 시너지 평균이 50%보다 높은 만큼
+
+후보 축 배열(lane_batch)과 점수 캐시(score_slot)를 추천 계산과 함께 쓰고,
+챔피언별 최대 위협도만 힙으로 상위 K개를 고릅니다.
+"""
+
+import heapq
+from dataclasses import dataclass
+
+from common import LANES
+from matchup_tensor import FLAG_INCLUDE, KIND_COUNTER, KIND_SYNERGY, LANE_INDEX
+from scoring_engine import DraftState
+
+BAN_THREAT_LIMIT_DEFAULT = 10
+
+
+@dataclass(frozen=True)
+class BanThreat:
+    """
+    밴 후보 하나.
+    threat = ally_drop + enemy_synergy (클수록 밴 우선)
+    """
+    name: str
+    lane: str
+    threat: float
+    ally_drop: float
+    enemy_synergy: float
+
+
+class BanAdvisor:
+    """ScoringEngine 하나에 묶인 밴 후보 계산기."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        # (후보 ID, 후보 라인, 아군 라인) → 빈 아군 라인의 평균 승률 (임계값 표가 바뀌면 비움)
+        self._lane_means = {}
+        self._lane_means_decisions = None
+
+    def rank(self, draft: DraftState, limit=BAN_THREAT_LIMIT_DEFAULT):
+        """위협도가 높은 순서로 최대 limit개의 BanThreat를 반환합니다."""
+        if not draft.lane_weights:
+            return []
+        engine = self.engine
+        tensor = engine.tensor
+        decisions = engine.decisions(draft.min_games, draft.pick_rate_override)
+        if decisions is not self._lane_means_decisions:
+            self._lane_means = {}
+            self._lane_means_decisions = decisions
+        included_score = decisions.included_score
+        synergy_weights = draft.lane_weights["synergy"]
+        counter_weights = draft.lane_weights["counter"]
+
+        # 이미 고른 아군: (ID, 라인, 카운터 합, 카운터 가중치 합)
+        allies = []
+        for slot in draft.allies:
+            member = self._member(slot)
+            if member is None:
+                continue
+            _score, details = engine.score_slot(draft, slot)
+            counter_weight_sum = details["counter_weight_sum"]
+            allies.append((*member, details["counter_score"] * counter_weight_sum, counter_weight_sum))
+        enemies = [member for member in map(self._member, draft.enemies) if member is not None]
+
+        taken_ally_lanes = {slot.selected_lane for slot in draft.allies if slot.canonical_name and slot.selected_lane}
+        open_ally_lanes = [LANE_INDEX[lane] for lane in LANES if lane not in taken_ally_lanes]
+        taken_enemy_lanes = {slot.selected_lane for slot in draft.enemies if slot.canonical_name and slot.selected_lane}
+        # 빈 아군 라인의 기대 카운터 가중치 합: 후보 라인을 뺀 나머지 상대 라인이 모두 채워진다고 가정
+        open_lane_weight = {
+            (ally_lane, lane_idx): sum(
+                counter_weights[ally_lane][enemy_lane] for enemy_lane in range(len(LANES)) if enemy_lane != lane_idx
+            )
+            for ally_lane in open_ally_lanes
+            for lane_idx in range(len(LANES))
+        }
+
+        excluded = engine.champion_ids(
+            list(draft.banned) + [name for slot in draft.slots() for name in (slot.display_name, slot.canonical_name)]
+        )
+
+        best = {}
+        for lane in LANES:
+            if lane in taken_enemy_lanes:
+                continue
+            lane_idx = LANE_INDEX[lane]
+            for cid in range(tensor.champion_count):
+                if cid in excluded or not tensor.has_data(cid, lane_idx):
+                    continue
+                ally_drop = 0.0
+                for ally_id, ally_lane, counter_sum, counter_weight_sum in allies:
+                    weight = counter_weights[ally_lane][lane_idx]
+                    if weight <= 0:
+                        continue
+                    score = included_score(KIND_COUNTER, cid, lane_idx, ally_id, ally_lane)
+                    if score is None:
+                        continue
+                    before = counter_sum / counter_weight_sum if counter_weight_sum > 0 else 0.0
+                    after = (counter_sum + score * weight) / (counter_weight_sum + weight)
+                    ally_drop += before - after
+                for ally_lane in open_ally_lanes:
+                    weight = counter_weights[ally_lane][lane_idx]
+                    if weight <= 0:
+                        continue
+                    mean = self._lane_mean(decisions, cid, lane_idx, ally_lane)
+                    if mean is None:
+                        continue
+                    # 나머지 상대에게는 50%라고 보고 후보가 더해졌을 때의 감소
+                    ally_drop += (50.0 - mean) * weight / (open_lane_weight[ally_lane, lane_idx] + weight)
+
+                synergy_sum = 0.0
+                synergy_weight_sum = 0.0
+                for enemy_id, enemy_lane in enemies:
+                    weight = synergy_weights[lane_idx][enemy_lane]
+                    if weight <= 0:
+                        continue
+                    score = included_score(KIND_SYNERGY, enemy_id, enemy_lane, cid, lane_idx)
+                    if score is None:
+                        continue
+                    synergy_sum += score * weight
+                    synergy_weight_sum += weight
+                enemy_synergy = synergy_sum / synergy_weight_sum - 50.0 if synergy_weight_sum > 0 else 0.0
+
+                threat = ally_drop + enemy_synergy
+                # 챔피언마다 가장 위협적인 라인만 남김
+                current = best.get(cid)
+                if current is None or threat > current[0]:
+                    best[cid] = (threat, lane, ally_drop, enemy_synergy)
+
+        top = heapq.nlargest(limit, best.items(), key=lambda item: item[1][0])
+        return [
+            BanThreat(tensor.data_names[cid], lane, threat, ally_drop, enemy_synergy)
+            for cid, (threat, lane, ally_drop, enemy_synergy) in top
+        ]
+
+    def _member(self, slot):
+        if slot.excluded or not slot.canonical_name:
+            return None
+        cid = self.engine.tensor.champion_id(slot.canonical_name)
+        lane_idx = LANE_INDEX.get(slot.selected_lane)
+        if cid is None or lane_idx is None:
+            return None
+        return cid, lane_idx
+
+    def _lane_mean(self, decisions, champion_id, lane_idx, ally_lane_idx):
+        """후보 파일의 ally_lane 카운터 목록에서 아군 관점 승률 평균 (반영되는 항목만). 없으면 None."""
+        key = (champion_id, lane_idx, ally_lane_idx)
+        if key in self._lane_means:
+            return self._lane_means[key]
+        _candidate_ids, scores, flags = decisions.lane_batch(KIND_COUNTER, champion_id, lane_idx, ally_lane_idx)
+        included = [score for score, cell_flags in zip(scores, flags) if cell_flags & FLAG_INCLUDE]
+        mean = sum(included) / len(included) if included else None
+        self._lane_means[key] = mean
+        return mean
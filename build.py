@@ -2,10 +2,17 @@ import os
 
 import PyInstaller.__main__  # type: ignore[import-not-found]
 
+from champion_data import BUNDLE_FILENAME, pack_data_directory
+
 base_dir = os.path.dirname(os.path.abspath(__file__))
 with open(os.path.join(base_dir, "VERSION"), encoding="utf-8") as f:
     version = f.read().strip()
 
+# data/*.json을 묶음 파일 하나로 만들어 exe에는 그 파일만 넣습니다
+bundle_path = os.path.join(base_dir, BUNDLE_FILENAME)
+packed = pack_data_directory(os.path.join(base_dir, "data"), bundle_path)
+print(f"Packed {packed} champion data files into {BUNDLE_FILENAME}")
+
 # Define arguments
 args = [
     "lobby_manager.py",
@@ -13,7 +20,7 @@ args = [
     "--noconsole",
     f"--name=TtimoTtabbong_{version}",
     "--add-data=VERSION;.",
-    "--add-data=data;data",
+    f"--add-data={BUNDLE_FILENAME};.",
     "--add-data=champion_aliases.json;.",
     "--add-data=ignored_champions.json;.",
     "--add-data=credits.json;.",
@@ -0,0 +1,562 @@
+"""
+챔피언 데이터 묶음(bundle) 파일을 만들고 읽습니다.
+
+data/*_{lane}.json 261개를 파일 하나로 합쳐 앱 시작 시 디렉터리 순회와
+들여쓰기된 JSON 파싱 비용을 줄이고, PyInstaller 빌드에 넣을 파일 수와 크기를 줄입니다.
+
+파일 구조:
+    MAGIC(8) | index 길이(uint32, little endian) | index(JSON) | 데이터 영역
+데이터 영역에는 파일별 zlib 압축 JSON 블록과, 매치업 숫자 배열(MatchupTable)이
+고정 레이아웃(little endian, 8바이트 정렬)으로 들어 있습니다.
+index의 offset은 모두 데이터 영역 시작 기준입니다.
+
+    {"files": {파일명: [offset, 길이]},
+     "mtimes": {파일명: 원본 JSON 수정 시각},
+     "matchups": {"rows": [[stem, lane], ...], "columns": [이름, ...],
+                  "arrays": {kind: {필드: [offset, 개수]}}}}
+
+앱은 묶음 파일을 mmap으로 열어 매치업 배열을 복사 없이 조회하므로,
+실제로 읽은 페이지만 메모리에 올라옵니다.
+
+데이터 스키마:
+    v1 (schema_version 없음): 승률/픽률/게임 수가 화면 표시용 문자열 ("51.20", "12,345", "N/A")
+    v2 (schema_version: 2)   : 같은 필드를 숫자로 저장 (값이 없으면 null)
+읽는 쪽은 두 버전을 모두 받으며, 묶음 파일에는 항상 v2로 변환해 저장합니다.
+
+사용법:
+    python champion_data.py pack [data 디렉터리] [출력 파일]
+    python champion_data.py migrate [data 디렉터리]   (v1 JSON 파일을 v2로 바꿔 다시 저장)
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+
+from common import LANES, resolve_resource_path
+from matchup_tensor import (
+    KIND_COUNTER,
+    LANE_COUNT,
+    LANE_INDEX,
+    MatchupTable,
+    MatchupTensor,
+    compile_matchup_table,
+    GAMES_TYPECODE,
+    RATE_TYPECODE,
+)
+
+BUNDLE_FILENAME = "champion_data.bundle"
+BUNDLE_MAGIC = b"LLHDATA2"
+DATA_DIRNAME = "data"
+
+SCHEMA_VERSION = 2
+SCHEMA_VERSION_KEY = "schema_version"
+# 숫자로 저장하는 항목 필드
+_INT_FIELDS = ("games",)
+_FLOAT_FIELDS = ("win_rate", "popularity", "pick_rate", "win_rate_diff", "delta_1", "delta_2")
+
+_HEADER = struct.Struct("<8sI")
+_ALIGNMENT = 8
+_FIELD_TYPECODES = {"games": GAMES_TYPECODE, "pick_rate": RATE_TYPECODE, "win_rate": RATE_TYPECODE}
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class BundleFormatError(ValueError):
+    """묶음 파일 형식이 올바르지 않을 때 발생합니다."""
+
+
+def to_int(value):
+    """'12,345' → 12345. 숫자로 읽을 수 없으면 None."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    try:
+        return int(str(value).replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def to_float(value):
+    """'51.20%' → 51.2. 숫자로 읽을 수 없으면 ('N/A' 등) None."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).replace(",", "").replace("%", "").strip())
+    except ValueError:
+        return None
+
+
+def schema_version(payload) -> int:
+    if isinstance(payload, dict):
+        version = payload.get(SCHEMA_VERSION_KEY)
+        if isinstance(version, int):
+            return version
+    return 1
+
+
+def migrate_entry(entry):
+    """매치업 항목 하나를 v2(숫자 필드)로 변환한 복사본을 반환합니다."""
+    migrated = dict(entry)
+    for field in _INT_FIELDS:
+        if field in migrated:
+            migrated[field] = to_int(migrated[field])
+    for field in _FLOAT_FIELDS:
+        if field in migrated:
+            migrated[field] = to_float(migrated[field])
+    return migrated
+
+
+def migrate_payload(payload):
+    """챔피언 데이터 파일 payload를 v2로 변환합니다. 이미 v2 이상이면 그대로 반환합니다."""
+    if not isinstance(payload, dict) or schema_version(payload) >= SCHEMA_VERSION:
+        return payload
+    migrated = {}
+    for kind, kind_payload in payload.items():
+        if not isinstance(kind_payload, dict):
+            migrated[kind] = kind_payload
+            continue
+        migrated[kind] = {
+            lane: {
+                name: migrate_entry(entry) if isinstance(entry, dict) else entry
+                for name, entry in lane_payload.items()
+            } if isinstance(lane_payload, dict) else lane_payload
+            for lane, lane_payload in kind_payload.items()
+        }
+    migrated[SCHEMA_VERSION_KEY] = SCHEMA_VERSION
+    return migrated
+
+
+def migrate_data_directory(data_dir) -> int:
+    """data 디렉터리의 v1 JSON 파일을 v2로 바꿔 다시 저장하고, 변환한 파일 수를 반환합니다."""
+    migrated_count = 0
+    for filename in sorted(os.listdir(data_dir)):
+        if not filename.endswith(".json"):
+            continue
+        path = os.path.join(data_dir, filename)
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if schema_version(payload) >= SCHEMA_VERSION:
+            continue
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(migrate_payload(payload), handle, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, path)
+        migrated_count += 1
+    return migrated_count
+
+
+def load_data_directory(data_dir, progress=None):
+    """
+    data 디렉터리의 JSON 파일들을 {파일명: payload}로 읽습니다.
+    progress(done, total, message)가 주어지면 파일마다 호출합니다.
+    """
+    payloads = {}
+    if not os.path.isdir(data_dir):
+        return payloads
+    filenames = [name for name in sorted(os.listdir(data_dir)) if name.endswith(".json")]
+    for done, filename in enumerate(filenames, start=1):
+        try:
+            with open(os.path.join(data_dir, filename), "r", encoding="utf-8") as handle:
+                payloads[filename] = json.load(handle)
+        except Exception as e:
+            print(f"Failed to load {filename}: {e}")
+        if progress:
+            progress(done, len(filenames), filename)
+    return payloads
+
+
+def data_file_mtimes(data_dir):
+    """data 디렉터리 JSON 파일들의 {파일명: 수정 시각}."""
+    mtimes = {}
+    if not os.path.isdir(data_dir):
+        return mtimes
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                mtimes[entry.name] = entry.stat().st_mtime
+    return mtimes
+
+
+def _array_bytes(values, typecode):
+    packed = array(typecode, values)
+    if not _NATIVE_LITTLE_ENDIAN:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def pack_data_directory(data_dir, output_path) -> int:
+    """data 디렉터리의 JSON 파일들을 묶음 파일 하나로 저장하고, 담긴 파일 수를 반환합니다."""
+    payloads = load_data_directory(data_dir)
+
+    chunks = []
+    position = 0
+
+    def append(chunk):
+        nonlocal position
+        start = position
+        chunks.append(chunk)
+        position += len(chunk)
+        return start
+
+    files = {}
+    for filename, payload in payloads.items():
+        payload = migrate_payload(payload)
+        compact = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        block = zlib.compress(compact.encode("utf-8"), 9)
+        files[filename] = [append(block), len(block)]
+
+    table = compile_matchup_table(payloads)
+    arrays = {}
+    for kind, field, values in table.iter_arrays():
+        padding = -position % _ALIGNMENT
+        if padding:
+            append(b"\0" * padding)
+        arrays.setdefault(kind, {})[field] = [append(_array_bytes(values, _FIELD_TYPECODES[field])), len(values)]
+
+    mtimes = data_file_mtimes(data_dir)
+    index = {
+        "files": files,
+        "mtimes": {filename: mtimes[filename] for filename in files if filename in mtimes},
+        "matchups": {"rows": table.rows, "columns": table.columns, "arrays": arrays},
+    }
+    index_bytes = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # 데이터 영역이 8바이트 경계에서 시작하도록 index 뒤를 공백으로 채움 (JSON으로는 무해)
+    index_bytes += b" " * (-(_HEADER.size + len(index_bytes)) % _ALIGNMENT)
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(_HEADER.pack(BUNDLE_MAGIC, len(index_bytes)))
+        handle.write(index_bytes)
+        for chunk in chunks:
+            handle.write(chunk)
+    os.replace(tmp_path, output_path)
+    return len(files)
+
+
+class DataBundle:
+    """
+    묶음 파일을 mmap으로 엽니다.
+    JSON 블록은 요청 시 압축을 풀고, 매치업 배열은 매핑된 버퍼를 그대로 노출합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._mapped = None
+        with open(path, "rb") as handle:
+            try:
+                self._mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # 빈 파일
+                raise BundleFormatError(f"bundle is empty: {path}") from exc
+
+        try:
+            header = self._mapped[:_HEADER.size]
+            if len(header) != _HEADER.size:
+                raise BundleFormatError(f"bundle header is truncated: {path}")
+            magic, index_length = _HEADER.unpack(header)
+            if magic != BUNDLE_MAGIC:
+                raise BundleFormatError(f"not a champion data bundle: {path}")
+            try:
+                index = json.loads(self._mapped[_HEADER.size:_HEADER.size + index_length])
+                files = index["files"]
+            except (UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError) as exc:
+                raise BundleFormatError(f"bundle index is corrupted: {path}") from exc
+        except BundleFormatError:
+            self.close()
+            raise
+
+        self._data_start = _HEADER.size + index_length
+        self.index = {name: (self._data_start + int(start), int(length)) for name, (start, length) in files.items()}
+        self._matchups = index.get("matchups") or {}
+        self.mtimes = index.get("mtimes") or {}
+
+    def close(self):
+        if self._mapped is None or self._mapped.closed:
+            return
+        try:
+            self._mapped.close()
+        except BufferError:
+            # MatchupTable이 아직 버퍼를 참조 중이면 프로세스 종료 시 해제됨
+            pass
+
+    def __contains__(self, filename):
+        return filename in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def filenames(self):
+        return list(self.index)
+
+    def read(self, filename):
+        """파일 하나의 JSON payload를 반환합니다. 없으면 None."""
+        if filename not in self.index:
+            return None
+        start, length = self.index[filename]
+        return json.loads(zlib.decompress(self._mapped[start:start + length]))
+
+    def read_all(self):
+        """모든 파일을 {파일명: payload}로 반환합니다."""
+        return {filename: self.read(filename) for filename in self.index}
+
+    def matchup_table(self) -> MatchupTable:
+        """매치업 배열을 mmap 위의 memoryview로 감싼 MatchupTable을 반환합니다 (복사 없음)."""
+        buffer = memoryview(self._mapped)
+        fields = {"games": {}, "pick_rate": {}, "win_rate": {}}
+        try:
+            for kind, kind_arrays in self._matchups["arrays"].items():
+                for field, (start, count) in kind_arrays.items():
+                    typecode = _FIELD_TYPECODES[field]
+                    begin = self._data_start + int(start)
+                    end = begin + int(count) * array(typecode).itemsize
+                    if end > len(buffer):
+                        raise BundleFormatError(f"matchup array {kind}.{field} is truncated: {self.path}")
+                    view = buffer[begin:end].cast(typecode)
+                    if not _NATIVE_LITTLE_ENDIAN:
+                        view = array(typecode, view)
+                        view.byteswap()
+                    fields[field][kind] = view
+            return MatchupTable(
+                self._matchups["rows"],
+                self._matchups["columns"],
+                fields["games"],
+                fields["pick_rate"],
+                fields["win_rate"],
+                self.mtimes,
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            if isinstance(exc, BundleFormatError):
+                raise
+            raise BundleFormatError(f"bundle matchup section is corrupted: {self.path}") from exc
+
+
+def find_bundle_path():
+    """배포/개발 환경에서 묶음 파일 경로를 찾습니다. 없으면 None."""
+    path = resolve_resource_path(BUNDLE_FILENAME)
+    return path if os.path.exists(path) else None
+
+
+def open_bundle():
+    path = find_bundle_path()
+    if not path:
+        return None
+    try:
+        return DataBundle(path)
+    except (OSError, BundleFormatError) as exc:
+        print(f"Failed to open data bundle {path}: {exc}")
+        return None
+
+
+def load_matchup_table(progress=None) -> MatchupTable:
+    """
+    매치업 테이블을 불러옵니다.
+    묶음 파일이 있으면 mmap으로 매핑하고, 없으면 data 디렉터리의 JSON 파일을 읽어 컴파일합니다.
+    progress(done, total, message)로 진행 상황을 알립니다.
+    """
+    bundle = open_bundle()
+    if bundle is not None:
+        try:
+            table = bundle.matchup_table()
+            if progress:
+                progress(1, 1, BUNDLE_FILENAME)
+            return table
+        except BundleFormatError as exc:
+            print(f"Failed to map data bundle {bundle.path}: {exc}")
+            bundle.close()
+    data_dir = resolve_resource_path(DATA_DIRNAME)
+    table = compile_matchup_table(load_data_directory(data_dir, progress))
+    table.mtimes = data_file_mtimes(data_dir)
+    return table
+
+
+class DataCatalog:
+    """
+    로딩 시 텐서와 함께 한 번 만드는 데이터 파일 목록. 조회는 모두 O(1)입니다.
+
+    - has_file(ID, 라인 인덱스): 데이터 파일이 있는지
+    - lane_games(ID): 라인별 카운터 games 합 (LANES 순서, 파일이 없는 라인은 None)
+    - pick_games(ID): 라인별 같은 라인 상대와의 카운터 games 합 (라인 배정용, 없으면 0)
+    - best_lane(ID): 카운터 games 합이 가장 큰 라인 (동률이면 LANES 순서, 파일이 없으면 None)
+    - mtime(ID, 라인 인덱스): 원본 JSON 파일의 수정 시각 (모르면 None)
+    """
+
+    def __init__(self, tensor=None):
+        if tensor is None:
+            tensor = MatchupTensor()
+        self.tensor = tensor
+        table = tensor.table
+        stride = table.row_stride
+        games = table.games[KIND_COUNTER]
+
+        count = tensor.champion_count
+        self._available = bytearray(count * LANE_COUNT)
+        self._lane_games = [(None,) * LANE_COUNT] * count
+        self._pick_games = [(0,) * LANE_COUNT] * count
+        self._best_lane = [None] * count
+        self._mtimes = {}
+        for cid in range(count):
+            lane_totals = []
+            pick_totals = []
+            for lane_idx in range(LANE_COUNT):
+                row = tensor.row_index(cid, lane_idx)
+                if row < 0:
+                    lane_totals.append(None)
+                    pick_totals.append(0)
+                    continue
+                self._available[cid * LANE_COUNT + lane_idx] = 1
+                # 상대 라인별 games 합 (MatchupTensor.lane_games_total과 같은 규칙)
+                per_lane = [
+                    sum(value for value in games[row * stride + other_lane:(row + 1) * stride:LANE_COUNT] if value > 0)
+                    for other_lane in range(LANE_COUNT)
+                ]
+                lane_totals.append(sum(per_lane))
+                pick_totals.append(per_lane[lane_idx])
+            self._lane_games[cid] = tuple(lane_totals)
+            self._pick_games[cid] = tuple(pick_totals)
+            present = [lane_idx for lane_idx, total in enumerate(lane_totals) if total is not None]
+            if present:
+                self._best_lane[cid] = LANES[max(present, key=lambda lane_idx: (lane_totals[lane_idx], -lane_idx))]
+
+        for row, (stem, lane) in enumerate(table.rows):
+            cid = tensor.row_champion[row]
+            mtime = table.mtimes.get(f"{stem}_{lane}.json")
+            if cid is not None and mtime is not None and tensor.row_index(cid, LANE_INDEX[lane]) == row:
+                self._mtimes[cid * LANE_COUNT + LANE_INDEX[lane]] = mtime
+
+    def has_file(self, champion_id, lane_idx) -> bool:
+        if champion_id is None or lane_idx is None:
+            return False
+        return bool(self._available[champion_id * LANE_COUNT + lane_idx])
+
+    def lane_games(self, champion_id):
+        if champion_id is None:
+            return (None,) * LANE_COUNT
+        return self._lane_games[champion_id]
+
+    def pick_games(self, champion_id):
+        if champion_id is None:
+            return (0,) * LANE_COUNT
+        return self._pick_games[champion_id]
+
+    def best_lane(self, champion_id):
+        if champion_id is None:
+            return None
+        return self._best_lane[champion_id]
+
+    def mtime(self, champion_id, lane_idx):
+        if champion_id is None or lane_idx is None:
+            return None
+        return self._mtimes.get(champion_id * LANE_COUNT + lane_idx)
+
+
+class DataStore:
+    """
+    매치업 데이터 로딩 상태를 관리합니다.
+
+    - start(): 백그라운드 스레드에서 로딩 시작
+    - tensor: 지금 바로 쓸 수 있는 텐서 (로딩이 끝나기 전에는 빈 텐서 → 조회 결과 없음)
+    - catalog: 텐서와 같이 만든 DataCatalog (파일 존재/라인별 판수/최다 라인)
+    - wait(timeout): 로딩이 끝날 때까지 대기 (끝났으면 True)
+    - add_progress_listener(callback): callback(done, total, message)를 로딩 스레드에서 호출
+    - add_ready_listener(callback): 로딩이 끝나면(실패 포함) 로딩 스레드에서 한 번 호출
+    """
+
+    def __init__(self, resolve_name, loader=load_matchup_table):
+        self._resolve_name = resolve_name
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread = None
+        self._catalog = DataCatalog()
+        self._progress_listeners = []
+        self._ready_listeners = []
+        self.progress = (0, 0)
+        self.error = None
+
+    @property
+    def tensor(self) -> MatchupTensor:
+        return self._catalog.tensor
+
+    @property
+    def catalog(self) -> DataCatalog:
+        return self._catalog
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(self, timeout=None) -> bool:
+        return self._ready.wait(timeout)
+
+    def add_progress_listener(self, callback):
+        with self._lock:
+            self._progress_listeners.append(callback)
+
+    def add_ready_listener(self, callback):
+        with self._lock:
+            if not self._ready.is_set():
+                self._ready_listeners.append(callback)
+                return
+        callback(self)
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return self._thread
+            self._thread = threading.Thread(target=self.load, name="champion-data-loader", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def _report_progress(self, done, total, message):
+        self.progress = (done, total)
+        with self._lock:
+            listeners = list(self._progress_listeners)
+        for callback in listeners:
+            callback(done, total, message)
+
+    def load(self):
+        """데이터를 읽어 텐서를 교체합니다. (start()가 호출하지만 직접 호출해도 됨)"""
+        try:
+            table = self._loader(self._report_progress)
+            # 텐서와 카탈로그는 완성된 뒤 한 번에 교체하므로 읽는 쪽은 빈 것 또는 완성된 것만 봅니다
+            self._catalog = DataCatalog(MatchupTensor(table, self._resolve_name))
+            print(f"Preloaded {len(table.rows)} champion data files.")
+        except Exception as e:
+            self.error = e
+            print(f"Error during data preload: {e}")
+        finally:
+            with self._lock:
+                self._ready.set()
+                listeners, self._ready_listeners = self._ready_listeners, []
+            for callback in listeners:
+                callback(self)
+
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else None
+    if command == "migrate":
+        data_dir = argv[2] if len(argv) > 2 else DATA_DIRNAME
+        count = migrate_data_directory(data_dir)
+        print(f"Migrated {count} files in {data_dir} to schema v{SCHEMA_VERSION}")
+        return 0
+    if command != "pack":
+        print(__doc__)
+        return 1
+    data_dir = argv[2] if len(argv) > 2 else DATA_DIRNAME
+    output_path = argv[3] if len(argv) > 3 else BUNDLE_FILENAME
+    count = pack_data_directory(data_dir, output_path)
+    size_kb = os.path.getsize(output_path) / 1024
+    print(f"Packed {count} files into {output_path} ({size_kb:,.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -36,6 +36,35 @@ def resolve_resource_path(*path_parts: str) -> str:
 
     return candidates[0]
 
+
+def parse_int(value):
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+        if not value:
+            return 0
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_float(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+        if not value:
+            return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
 class AutocompletePopup:
     def __init__(self, entry_widget, values_provider, on_select=None, max_results=8):
         self.entry = entry_widget
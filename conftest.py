@@ -0,0 +1,43 @@
+"""
+엔진 테스트(matchup_tensor, scoring_engine, ban_advisor, draft_optimizer) 공용 fixture.
+
+각 테스트 모듈에는 데이터(payload)와 슬롯 구성만 두고,
+이름 변환 함수와 DraftState 생성, 기본 라인 가중치는 여기서 공유합니다.
+"""
+
+import pytest
+
+from scoring_engine import DraftState
+from weight_settings_tab import build_lane_weight_matrices
+
+# 테스트 데이터에 나오는 챔피언 (데이터 이름 → canonical 이름)
+TEST_CHAMPIONS = (
+    "Garen", "Darius", "Amumu", "Viego", "Vi", "Lee Sin", "Ahri", "Zed",
+    "Jinx", "Ezreal", "Nami", "Leona", "Lulu",
+)
+_CANONICAL_NAMES = {name.lower(): name.replace(" ", "") for name in TEST_CHAMPIONS}
+
+
+@pytest.fixture
+def resolve_name():
+    """데이터의 챔피언 이름을 canonical 이름으로 (모르는 이름은 None)."""
+    def resolve(name):
+        return _CANONICAL_NAMES.get(name.lower())
+    return resolve
+
+
+@pytest.fixture
+def lane_weights():
+    """기본 라인 가중치. 모듈에서 같은 이름의 fixture로 바꿀 수 있습니다."""
+    return build_lane_weight_matrices({})
+
+
+@pytest.fixture
+def make_draft(lane_weights):
+    """make_draft(allies, enemies, **overrides) -> DraftState (미드, 최소 900판, 픽률 1.5% 기준)."""
+    def make(allies=(), enemies=(), **overrides):
+        values = dict(allies=tuple(allies), enemies=tuple(enemies), my_lane="middle",
+                      min_games=900, pick_rate_override=1.5, lane_weights=lane_weights)
+        values.update(overrides)
+        return DraftState(**values)
+    return make
@@ -489,7 +489,7 @@ class CounterSynergyTab:
             for name, details in champions.items():
                 if self.app.is_champion_ignored(name):
                     continue
-                if self.app.parse_float(details.get("popularity")) >= min_popularity:
+                if details["popularity"] >= min_popularity:
                     filtered_data[lane][name] = details
 
         self.all_data = filtered_data
@@ -510,7 +510,7 @@ class CounterSynergyTab:
             for name, details in champions.items():
                 if self.app.is_champion_ignored(name):
                     continue
-                if self.app.parse_float(details.get("pick_rate")) >= min_pick_rate:
+                if details["pick_rate"] >= min_pick_rate:
                     filtered_data[lane][name] = details
 
         self.synergy_data = filtered_data
@@ -526,15 +526,15 @@ class CounterSynergyTab:
             for item in tree.get_children():
                 tree.delete(item)
             
-            for name, details in sorted(data_dict.items(), key=lambda item: float(item[1].get('win_rate_diff', 0.0)), reverse=False):
-                games = self.app.parse_int(details.get("games"))
+            for name, details in sorted(data_dict.items(), key=lambda item: item[1].get("win_rate_diff", 0.0), reverse=False):
+                games = details["games"]
                 is_low = games < threshold
                 display_name = f"{WARNING_ICON} {name}" if is_low else name
                 tag = "low_games" if is_low else "normal_games"
                 tree.insert("", "end", values=(
                     display_name,
-                    details["popularity"],
-                    details.get("win_rate", "0.00")
+                    f"{details['popularity']:.2f}",
+                    f"{details.get('win_rate', 0.0):.2f}"
                 ), tags=(tag,))
 
     def update_synergy_GUI(self):
@@ -546,19 +546,19 @@ class CounterSynergyTab:
 
             sorted_entries = sorted(
                 data_dict.items(),
-                key=lambda item: self.app.parse_float(item[1].get("win_rate")),
+                key=lambda item: item[1]["win_rate"],
                 reverse=True
             )
 
             for name, details in sorted_entries:
-                games = self.app.parse_int(details.get("games"))
+                games = details["games"]
                 is_low = games < threshold
                 display_name = f"{WARNING_ICON} {name}" if is_low else name
                 tag = "low_games" if is_low else "normal_games"
                 tree.insert("", "end", values=(
                     display_name,
-                    details.get("pick_rate", "0.00"),
-                    details.get("win_rate", "0.00")
+                    f"{details.get('pick_rate', 0.0):.2f}",
+                    f"{details.get('win_rate', 0.0):.2f}"
                 ), tags=(tag,))
 
     def update_lane_visibility(self):
@@ -0,0 +1,256 @@
+"""
+남은 아군 슬롯 조합 추천.
+
+비어 있는 아군 슬롯들에 (라인, 챔피언)을 함께 배정해 우리 팀 조합 점수(아군 슬롯 점수 합)가
+가장 높은 배정안을 찾습니다. 슬롯 점수 규칙은 ScoringEngine.score_slot과 같습니다.
+
+후보별 고정 기여(이미 고른 아군과의 시너지, 상대 카운터)와 고정 아군이 받는 시너지는
+탐색 전에 한 번만 숫자로 계산하고, 빔 서치 중에는 새로 고른 챔피언끼리의 시너지만 더합니다.
+라인마다 단독 기여가 높은 후보만 남기고(가지치기), 단계마다 상위 beam_width개 부분 배정만 유지합니다.
+최종 배정안은 ScoringEngine으로 다시 계산해 화면의 슬롯/팀 점수와 같은 값을 보고합니다.
+"""
+
+import heapq
+from dataclasses import dataclass, replace
+
+from common import LANES
+from matchup_tensor import KIND_COUNTER, KIND_SYNERGY, LANE_INDEX
+from scoring_engine import DraftState
+
+OPTIMIZER_BEAM_WIDTH = 48
+OPTIMIZER_CANDIDATES_PER_LANE = 48
+
+# 슬롯 점수 누적값 인덱스 (시너지 합, 시너지 가중치 합, 카운터 합, 카운터 가중치 합)
+_SYN, _SYN_W, _CNT, _CNT_W = range(4)
+
+
+@dataclass(frozen=True)
+class DraftPlan:
+    """
+    남은 슬롯 배정안 하나.
+    assignments: ((슬롯 번호, 라인, 챔피언 이름, 슬롯 점수), ...)
+    team_total/team_average/complete: ScoringEngine.team_stats("allies") 결과
+    """
+    assignments: tuple
+    team_total: float
+    team_average: float
+    complete: bool
+
+
+def _slot_score(sums):
+    # 가중치 합으로 나눠서 정규화 (ScoringEngine.score_slot과 같은 규칙)
+    synergy = sums[_SYN] / sums[_SYN_W] if sums[_SYN_W] > 0 else 0.0
+    counter = sums[_CNT] / sums[_CNT_W] if sums[_CNT_W] > 0 else 0.0
+    return synergy + counter
+
+
+class RemainingSlotsOptimizer:
+    """ScoringEngine 하나에 묶인 남은 슬롯 조합 탐색기."""
+
+    def __init__(self, engine, beam_width=OPTIMIZER_BEAM_WIDTH, candidates_per_lane=OPTIMIZER_CANDIDATES_PER_LANE):
+        self.engine = engine
+        self.beam_width = beam_width
+        self.candidates_per_lane = candidates_per_lane
+
+    def open_slots(self, draft: DraftState):
+        """
+        배정할 [(빈 아군 슬롯, 라인 인덱스), ...].
+        이미 선택된 아군 라인은 제외하고, 빈 슬롯의 라인 선택값을 우선 사용합니다.
+        """
+        taken = {slot.selected_lane for slot in draft.allies if slot.canonical_name and slot.selected_lane}
+        empty_slots = [slot for slot in draft.allies if not slot.canonical_name]
+        free_lanes = [lane for lane in LANES if lane not in taken]
+        assigned = {}
+        for slot in empty_slots:
+            if slot.lane_choice in free_lanes and slot.lane_choice not in assigned.values():
+                assigned[slot.index] = slot.lane_choice
+        remaining = [lane for lane in free_lanes if lane not in assigned.values()]
+        for slot in empty_slots:
+            if slot.index not in assigned and remaining:
+                assigned[slot.index] = remaining.pop(0)
+        return [(slot, LANE_INDEX[assigned[slot.index]]) for slot in empty_slots if slot.index in assigned]
+
+    def optimize(self, draft: DraftState, plan_count=3):
+        """
+        팀 조합 점수가 높은 순서로 최대 plan_count개의 DraftPlan을 반환합니다.
+        밴/무시/이미 선택된 챔피언은 후보에서 빠지며, 점수가 생기는 후보가 없는 라인이 있으면 빈 목록입니다.
+        """
+        if not draft.lane_weights:
+            return []
+        open_slots = self.open_slots(draft)
+        if not open_slots:
+            return []
+
+        engine = self.engine
+        tensor = engine.tensor
+        decisions = engine.decisions(draft.min_games, draft.pick_rate_override)
+        included_score = decisions.included_score
+        synergy_weights = draft.lane_weights["synergy"]
+        counter_weights = draft.lane_weights["counter"]
+
+        # 시너지를 주는 고정 아군 / 카운터 대상 상대 (제외 체크된 슬롯은 빠짐)
+        friends = self._members(draft.allies)
+        enemies = self._members(draft.enemies)
+        # 점수가 바뀌는 고정 아군 (자기 데이터가 있어야 점수가 생김)
+        scored_friends = [(cid, lane_idx) for cid, lane_idx in friends if tensor.has_data(cid, lane_idx)]
+        friend_base = [
+            self._base_sums(included_score, synergy_weights, counter_weights, cid, lane_idx,
+                            [friend for friend in friends if friend != (cid, lane_idx)], enemies)
+            for cid, lane_idx in scored_friends
+        ]
+
+        excluded = self._excluded_ids(draft)
+        lanes = [lane_idx for _slot, lane_idx in open_slots]
+        candidates = [
+            self._lane_candidates(included_score, synergy_weights, counter_weights, lane_idx,
+                                  excluded, friends, enemies, scored_friends, friend_base)
+            for lane_idx in lanes
+        ]
+        if not all(candidates):
+            return []
+
+        pair_cache = {}
+
+        def synergy_from(giver, giver_lane, receiver, receiver_lane):
+            key = (giver, giver_lane, receiver, receiver_lane)
+            value = pair_cache.get(key)
+            if value is None:
+                weight = synergy_weights[receiver_lane][giver_lane]
+                score = included_score(KIND_SYNERGY, giver, giver_lane, receiver, receiver_lane) if weight > 0 else None
+                value = (score * weight, weight) if score is not None else (0.0, 0.0)
+                pair_cache[key] = value
+            return value
+
+        fixed_total = sum(_slot_score(sums) for sums in friend_base)
+        # 부분 배정: (팀 점수, 고른 후보 ID 튜플, 후보별 누적값, 고정 아군 누적값)
+        beam = [(fixed_total, (), (), tuple(tuple(sums) for sums in friend_base))]
+        for depth, lane_idx in enumerate(lanes):
+            expanded = []
+            for _total, picked, pick_sums, fixed_sums in beam:
+                for cid, base, to_friends in candidates[depth]:
+                    if cid in picked:
+                        continue
+                    own = list(base)
+                    new_pick_sums = []
+                    for prior_depth, prior in enumerate(picked):
+                        prior_lane = lanes[prior_depth]
+                        gained, weight = synergy_from(prior, prior_lane, cid, lane_idx)
+                        own[_SYN] += gained
+                        own[_SYN_W] += weight
+                        given, given_weight = synergy_from(cid, lane_idx, prior, prior_lane)
+                        prior_sums = pick_sums[prior_depth]
+                        if given_weight:
+                            prior_sums = (prior_sums[_SYN] + given, prior_sums[_SYN_W] + given_weight,
+                                          prior_sums[_CNT], prior_sums[_CNT_W])
+                        new_pick_sums.append(prior_sums)
+                    new_pick_sums.append(tuple(own))
+                    new_fixed_sums = fixed_sums
+                    if to_friends:
+                        updated = list(fixed_sums)
+                        for friend_pos, given, given_weight in to_friends:
+                            sums = updated[friend_pos]
+                            updated[friend_pos] = (sums[_SYN] + given, sums[_SYN_W] + given_weight, sums[_CNT], sums[_CNT_W])
+                        new_fixed_sums = tuple(updated)
+                    total = sum(_slot_score(sums) for sums in new_pick_sums) + sum(_slot_score(sums) for sums in new_fixed_sums)
+                    expanded.append((total, picked + (cid,), tuple(new_pick_sums), new_fixed_sums))
+            if not expanded:
+                return []
+            beam = heapq.nlargest(self.beam_width, expanded, key=lambda state: state[0])
+
+        plans = [self._plan(draft, open_slots, picked) for _total, picked, _sums, _fixed in beam[:plan_count]]
+        plans.sort(key=lambda plan: plan.team_total, reverse=True)
+        return plans
+
+    def _members(self, slots):
+        members = []
+        for slot in slots:
+            if slot.excluded or not slot.canonical_name:
+                continue
+            cid = self.engine.tensor.champion_id(slot.canonical_name)
+            lane_idx = LANE_INDEX.get(slot.selected_lane)
+            if cid is not None and lane_idx is not None:
+                members.append((cid, lane_idx))
+        return members
+
+    def _excluded_ids(self, draft: DraftState):
+        names = list(draft.banned) + list(draft.ignored)
+        for slot in draft.slots():
+            names.extend((slot.display_name, slot.canonical_name))
+        return self.engine.champion_ids(names)
+
+    @staticmethod
+    def _base_sums(included_score, synergy_weights, counter_weights, cid, lane_idx, friends, enemies):
+        """(cid, lane)이 고정 아군/상대로부터 받는 누적값."""
+        sums = [0.0, 0.0, 0.0, 0.0]
+        synergy_row = synergy_weights[lane_idx]
+        counter_row = counter_weights[lane_idx]
+        for friend_id, friend_lane in friends:
+            weight = synergy_row[friend_lane]
+            if weight <= 0:
+                continue
+            score = included_score(KIND_SYNERGY, friend_id, friend_lane, cid, lane_idx)
+            if score is not None:
+                sums[_SYN] += score * weight
+                sums[_SYN_W] += weight
+        for enemy_id, enemy_lane in enemies:
+            weight = counter_row[enemy_lane]
+            if weight <= 0:
+                continue
+            score = included_score(KIND_COUNTER, enemy_id, enemy_lane, cid, lane_idx)
+            if score is not None:
+                sums[_CNT] += score * weight
+                sums[_CNT_W] += weight
+        return sums
+
+    def _lane_candidates(self, included_score, synergy_weights, counter_weights, lane_idx,
+                         excluded, friends, enemies, scored_friends, friend_base):
+        """
+        라인 하나의 후보 [(후보 ID, 받는 누적값, [(고정 아군 위치, 주는 시너지, 가중치), ...]), ...].
+        단독 기여(자기 점수 + 고정 아군 점수 변화)가 높은 candidates_per_lane개만 남깁니다.
+        """
+        tensor = self.engine.tensor
+        scored = []
+        for cid in range(tensor.champion_count):
+            if cid in excluded or not tensor.has_data(cid, lane_idx):
+                continue
+            base = self._base_sums(included_score, synergy_weights, counter_weights, cid, lane_idx, friends, enemies)
+            gain = _slot_score(base)
+            to_friends = []
+            for friend_pos, (friend_id, friend_lane) in enumerate(scored_friends):
+                weight = synergy_weights[friend_lane][lane_idx]
+                if weight <= 0:
+                    continue
+                score = included_score(KIND_SYNERGY, cid, lane_idx, friend_id, friend_lane)
+                if score is None:
+                    continue
+                to_friends.append((friend_pos, score * weight, weight))
+                sums = friend_base[friend_pos]
+                changed = (sums[_SYN] + score * weight, sums[_SYN_W] + weight, sums[_CNT], sums[_CNT_W])
+                gain += _slot_score(changed) - _slot_score(sums)
+            if gain > 0:
+                scored.append((gain, cid, tuple(base), tuple(to_friends)))
+        top = heapq.nlargest(self.candidates_per_lane, scored, key=lambda item: item[0])
+        return [(cid, base, to_friends) for _gain, cid, base, to_friends in top]
+
+    def _plan(self, draft: DraftState, open_slots, picked):
+        """고른 후보를 빈 슬롯에 넣은 draft를 ScoringEngine으로 다시 계산합니다."""
+        tensor = self.engine.tensor
+        filled = {}
+        for (slot, lane_idx), cid in zip(open_slots, picked):
+            lane = LANES[lane_idx]
+            filled[slot.index] = replace(
+                slot,
+                canonical_name=tensor.champions[cid],
+                display_name=tensor.data_names[cid],
+                selected_lane=lane,
+                lane_choice=lane,
+                excluded=False,
+            )
+        allies = tuple(filled.get(slot.index, slot) for slot in draft.allies)
+        planned = replace(draft, allies=allies)
+        assignments = []
+        for (slot, lane_idx), cid in zip(open_slots, picked):
+            score, _details = self.engine.compute_slot_score(planned, allies[draft.allies.index(slot)])
+            assignments.append((slot.index, LANES[lane_idx], tensor.data_names[cid], score))
+        team_total, team_average, complete = self.engine.team_stats(planned, "allies", use_cache=False)
+        return DraftPlan(tuple(assignments), team_total, team_average, complete)
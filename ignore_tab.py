@@ -109,15 +109,16 @@ class IgnoreTab:
         self.refresh_ignore_listbox()
         self.app.on_ignore_list_updated()
 
-    def ignore_selected_recommendations(self, selection):
+    def ignore_selected_recommendations(self, selection, tree=None):
         if not selection:
             messagebox.showinfo("Ignore List", "추천 리스트에서 제외할 챔피언을 선택하세요.")
             return
         added = []
         duplicates = []
         missing = []
+        tree = tree or self.app.recommend_tree
         for item_id in selection:
-            values = self.app.recommend_tree.item(item_id, "values")
+            values = tree.item(item_id, "values")
             if not values:
                 continue
             champ_name = str(values[0]).strip()
@@ -0,0 +1,120 @@
+"""
+클라이언트 스냅샷의 라인 배정 (assignedPosition이 없는 커스텀/블라인드 로비용).
+
+배정되지 않은 챔피언들에게 남은 라인을 하나씩 주되 챔피언×라인 판수 합이 최대가 되도록
+최소 비용 할당(헝가리안 알고리즘)으로 풉니다.
+
+- 판수가 있는 라인만 배정 후보이고, 데이터가 전혀 없는 챔피언은 남은 아무 라인이나 받습니다 (판수 0).
+- 남은 라인 중 판수가 있는 라인이 없는 챔피언은 배정하지 않습니다.
+- 나머지 챔피언 모두에게 라인을 줄 수 없으면 판수가 큰 (챔피언, 라인)부터 탐욕적으로 배정합니다.
+"""
+
+# 판수가 없는 (챔피언, 라인) 칸의 비용. 최적해가 이 칸을 쓰면 전원 배정이 불가능한 경우
+_FORBIDDEN = float("inf")
+
+
+def solve_assignment(cost):
+    """
+    행 수 <= 열 수인 비용 행렬의 최소 비용 할당.
+    행마다 배정된 열 인덱스 리스트를 반환합니다. (O(행² × 열) 헝가리안 알고리즘)
+    금지 칸은 _FORBIDDEN 대신 충분히 큰 유한 값으로 바꿔 계산합니다.
+    """
+    rows = len(cost)
+    if rows == 0:
+        return []
+    cols = len(cost[0])
+    if rows > cols:
+        raise ValueError("rows must not exceed columns")
+
+    finite = [value for row in cost for value in row if value != _FORBIDDEN]
+    big = (max((abs(value) for value in finite), default=0) + 1) * (rows + 1)
+    matrix = [[big if value == _FORBIDDEN else value for value in row] for row in cost]
+
+    # 1-기반 포텐셜 (u: 행, v: 열), match[열] = 행
+    u = [0] * (rows + 1)
+    v = [0] * (cols + 1)
+    match = [0] * (cols + 1)
+    way = [0] * (cols + 1)
+    for row in range(1, rows + 1):
+        match[0] = row
+        col0 = 0
+        minv = [float("inf")] * (cols + 1)
+        used = [False] * (cols + 1)
+        while True:
+            used[col0] = True
+            row0 = match[col0]
+            delta = float("inf")
+            col1 = 0
+            for col in range(1, cols + 1):
+                if used[col]:
+                    continue
+                reduced = matrix[row0 - 1][col - 1] - u[row0] - v[col]
+                if reduced < minv[col]:
+                    minv[col] = reduced
+                    way[col] = col0
+                if minv[col] < delta:
+                    delta = minv[col]
+                    col1 = col
+            for col in range(cols + 1):
+                if used[col]:
+                    u[match[col]] += delta
+                    v[col] -= delta
+                else:
+                    minv[col] -= delta
+            col0 = col1
+            if match[col0] == 0:
+                break
+        while col0:
+            col1 = way[col0]
+            match[col0] = match[col1]
+            col0 = col1
+
+    assignment = [0] * rows
+    for col in range(1, cols + 1):
+        if match[col]:
+            assignment[match[col] - 1] = col - 1
+    return assignment
+
+
+def assign_lanes(candidates, available_lanes):
+    """
+    candidates: [(key, {라인: 판수}), ...] 판수가 있는 라인만 담은 dict (데이터가 없으면 빈 dict)
+    available_lanes: 배정할 수 있는 라인 목록
+    반환: {key: 라인}
+    """
+    lanes = list(available_lanes)
+    if not candidates or not lanes:
+        return {}
+
+    # 남은 라인 중 판수가 있는 라인이 없는 챔피언은 배정 대상에서 뺌
+    eligible = [
+        (key, rates) for key, rates in candidates
+        if not rates or any(rates.get(lane, 0) > 0 for lane in lanes)
+    ]
+    if len(eligible) <= len(lanes):
+        cost = [
+            [
+                -rates.get(lane, 0) if not rates or rates.get(lane, 0) > 0 else _FORBIDDEN
+                for lane in lanes
+            ]
+            for _key, rates in eligible
+        ]
+        columns = solve_assignment(cost)
+        if all(cost[row][col] != _FORBIDDEN for row, col in enumerate(columns)):
+            return {key: lanes[col] for (key, _rates), col in zip(eligible, columns)}
+
+    # 전원 배정 불가: 판수가 큰 (챔피언, 라인)부터 탐욕 배정
+    options = sorted(
+        ((rates[lane], position, lane) for position, (_key, rates) in enumerate(candidates) for lane in lanes if lane in rates),
+        key=lambda option: option[0],
+        reverse=True,
+    )
+    assigned = {}
+    used_lanes = set()
+    for _games, position, lane in options:
+        key = candidates[position][0]
+        if key in assigned or lane in used_lanes:
+            continue
+        assigned[key] = lane
+        used_lanes.add(lane)
+    return assigned
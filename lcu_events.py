@@ -0,0 +1,499 @@
+"""
+LCU 웹소켓(WAMP) 이벤트 스트림.
+
+League Client는 REST 포트와 같은 포트에서 웹소켓을 열어 두고, WAMP 1.0 형식으로
+"OnJsonApiEvent_<경로>" 토픽을 구독하면 해당 REST 리소스가 바뀔 때마다 전체 JSON을 보내 줍니다.
+픽창 세션을 폴링하는 대신 이 이벤트를 받아 픽/호버/밴이 바뀌는 즉시 스냅샷을 만들 수 있습니다.
+
+    구독: [5, "OnJsonApiEvent_lol-champ-select_v1_session"]
+    이벤트: [8, 토픽, {"uri": "/lol-champ-select/v1/session", "eventType": "Update", "data": {...}}]
+
+웹소켓 전송은 websocket-client 패키지(import websocket)를 사용하고, 여기서는 WAMP 구독/이벤트 파싱만 합니다.
+패키지가 없으면 event_stream_available()이 False이고 watcher는 폴링만 사용합니다.
+
+LcuReplayServer는 기록해 둔 세션 payload를 같은 형식의 이벤트로 재생하는 로컬 대역 서버입니다.
+테스트와 클라이언트 없이 실시간 연동을 확인할 때 사용합니다. (서버 쪽 프레임 처리만 최소한으로 구현)
+
+사용법:
+    python lcu_events.py replay <세션 JSON 파일 또는 디렉터리> [포트]
+"""
+
+import base64
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import ssl
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+try:
+    import websocket  # websocket-client
+except ImportError:  # 없으면 watcher가 폴링만 사용
+    websocket = None
+
+# 픽창 세션 REST 경로 (일반/레거시)
+CHAMP_SELECT_SESSION_URIS = (
+    "/lol-champ-select/v1/session",
+    "/lol-champ-select-legacy/v1/session",
+)
+
+WAMP_SUBSCRIBE = 5
+WAMP_EVENT = 8
+
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OPCODE_CONTINUATION = 0x0
+_OPCODE_TEXT = 0x1
+_OPCODE_BINARY = 0x2
+_OPCODE_CLOSE = 0x8
+_OPCODE_PING = 0x9
+_OPCODE_PONG = 0xA
+
+# 프레임 첫 바이트를 받은 뒤 나머지를 기다리는 최대 시간 (초)
+FRAME_READ_TIMEOUT = 5.0
+CONNECT_TIMEOUT = 3.0
+# 재생 서버가 받아들이는 프레임 payload 최대 크기 (길이 필드를 그대로 믿고 읽지 않도록)
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+
+class LcuEventStreamError(Exception):
+    """웹소켓 연결 실패 또는 연결 끊김."""
+
+
+@dataclass(frozen=True)
+class LcuEvent:
+    """OnJsonApiEvent 하나. event_type은 "Create" / "Update" / "Delete"."""
+    uri: str
+    event_type: str
+    data: object
+
+
+def event_stream_available():
+    """websocket-client가 설치되어 있어 LcuEventStream을 쓸 수 있는지."""
+    return websocket is not None
+
+
+def event_topic(uri):
+    """REST 경로를 WAMP 토픽 이름으로 바꿉니다. ("/lol-champ-select/v1/session" → "OnJsonApiEvent_lol-champ-select_v1_session")"""
+    return "OnJsonApiEvent" + uri.replace("/", "_")
+
+
+def _accept_key(key):
+    digest = hashlib.sha1((key + _WEBSOCKET_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def encode_frame(payload: bytes, opcode=_OPCODE_TEXT, mask=True) -> bytes:
+    """FIN 프레임 하나를 만듭니다. 클라이언트 → 서버 프레임은 마스킹해야 합니다."""
+    length = len(payload)
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+    if not mask:
+        return bytes(header) + payload
+    key = os.urandom(4)
+    return bytes(header) + key + _mask(payload, key)
+
+
+def _mask(payload, key):
+    """payload를 4바이트 key로 XOR 합니다 (마스킹/언마스킹 동일). 바이트 단위 반복 대신 정수 연산 한 번."""
+    length = len(payload)
+    if not length:
+        return payload
+    repeated = (key * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(length, "big")
+
+
+class _FrameSocket:
+    """LcuReplayServer 쪽 소켓: 정확히 n바이트 읽기와 프레임 송수신 (클라이언트 프레임은 마스킹되어 옴)."""
+
+    def __init__(self, sock, mask_outgoing=False):
+        self.sock = sock
+        self.mask_outgoing = mask_outgoing
+        self.buffer = bytearray()
+        self._send_lock = threading.Lock()
+
+    def _fill(self, timeout):
+        """버퍼에 데이터를 더 받습니다. timeout 동안 아무것도 오지 않으면 False."""
+        self.sock.settimeout(timeout)
+        try:
+            chunk = self.sock.recv(65536)
+        except socket.timeout:
+            return False
+        except OSError as exc:
+            raise LcuEventStreamError(f"웹소켓 수신 실패: {exc}") from exc
+        if not chunk:
+            raise LcuEventStreamError("웹소켓 연결이 끊어졌습니다.")
+        self.buffer += chunk
+        return True
+
+    def read_exact(self, count, timeout=FRAME_READ_TIMEOUT):
+        while len(self.buffer) < count:
+            if not self._fill(timeout):
+                raise LcuEventStreamError("웹소켓 프레임 수신 시간이 초과되었습니다.")
+        data = bytes(self.buffer[:count])
+        del self.buffer[:count]
+        return data
+
+    def read_until(self, marker, limit=65536):
+        while marker not in self.buffer:
+            if len(self.buffer) > limit:
+                raise LcuEventStreamError("웹소켓 핸드셰이크 응답이 너무 깁니다.")
+            if not self._fill(FRAME_READ_TIMEOUT):
+                raise LcuEventStreamError("웹소켓 핸드셰이크 시간이 초과되었습니다.")
+        end = self.buffer.index(marker) + len(marker)
+        data = bytes(self.buffer[:end])
+        del self.buffer[:end]
+        return data
+
+    def send(self, payload: bytes, opcode=_OPCODE_TEXT):
+        frame = encode_frame(payload, opcode, mask=self.mask_outgoing)
+        with self._send_lock:
+            try:
+                self.sock.sendall(frame)
+            except OSError as exc:
+                raise LcuEventStreamError(f"웹소켓 송신 실패: {exc}") from exc
+
+    def read_frame(self, timeout):
+        """(opcode, fin, payload). timeout 동안 프레임이 시작되지 않으면 None."""
+        if not self.buffer and not self._fill(timeout):
+            return None
+        first, second = self.read_exact(2)
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self.read_exact(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self.read_exact(8))[0]
+        if length > MAX_FRAME_BYTES:
+            raise LcuEventStreamError(f"웹소켓 프레임이 너무 큽니다: {length} bytes")
+        key = self.read_exact(4) if second & 0x80 else None
+        payload = self.read_exact(length)
+        if key:
+            payload = _mask(payload, key)
+        return first & 0x0F, bool(first & 0x80), payload
+
+    def read_message(self, timeout):
+        """
+        데이터 메시지 하나를 (opcode, payload)로 반환합니다. 연속 프레임은 합치고 ping에는 pong으로 답합니다.
+        timeout 동안 메시지가 없으면 None, 상대가 close를 보내면 LcuEventStreamError.
+        """
+        fragments = []
+        message_opcode = None
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic() if not fragments else FRAME_READ_TIMEOUT
+            frame = self.read_frame(max(remaining, 0.001))
+            if frame is None:
+                if fragments:
+                    raise LcuEventStreamError("웹소켓 프레임 수신 시간이 초과되었습니다.")
+                return None
+            opcode, fin, payload = frame
+            if opcode == _OPCODE_PING:
+                self.send(payload, _OPCODE_PONG)
+                continue
+            if opcode == _OPCODE_PONG:
+                continue
+            if opcode == _OPCODE_CLOSE:
+                try:
+                    self.send(payload[:2], _OPCODE_CLOSE)
+                except LcuEventStreamError:
+                    pass
+                raise LcuEventStreamError("웹소켓 연결이 종료되었습니다.")
+            if opcode != _OPCODE_CONTINUATION:
+                message_opcode = opcode
+            fragments.append(payload)
+            if fin:
+                return message_opcode, b"".join(fragments)
+
+
+class LcuEventStream:
+    """
+    LCU 웹소켓에 연결해 세션 토픽을 구독하고 LcuEvent를 하나씩 받습니다 (전송은 websocket-client).
+
+        stream = LcuEventStream("https://127.0.0.1:12345", ("riot", password))
+        stream.connect()
+        event = stream.receive(timeout=0.5)   # 없으면 None
+        stream.close()
+
+    base_url의 https/http에 맞춰 wss/ws로 연결합니다. LCU 인증서는 자체 서명이라 검증하지 않습니다.
+    """
+
+    def __init__(self, base_url, auth, uris=CHAMP_SELECT_SESSION_URIS, connect_timeout=CONNECT_TIMEOUT):
+        self.base_url = base_url
+        self.auth = auth
+        self.uris = tuple(uris)
+        self.connect_timeout = connect_timeout
+        self._ws = None
+
+    @property
+    def connected(self):
+        return self._ws is not None and self._ws.connected
+
+    def connect(self):
+        if websocket is None:
+            raise LcuEventStreamError("websocket-client 패키지가 설치되어 있지 않습니다.")
+        parts = urlsplit(self.base_url)
+        host = parts.hostname or "127.0.0.1"
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        url = f"{'wss' if parts.scheme == 'https' else 'ws'}://{host}:{port}/"
+        headers = []
+        if self.auth:
+            token = base64.b64encode(f"{self.auth[0]}:{self.auth[1]}".encode("utf-8")).decode("ascii")
+            headers.append(f"Authorization: Basic {token}")
+        ws = websocket.WebSocket(sslopt={"cert_reqs": ssl.CERT_NONE, "check_hostname": False})
+        try:
+            ws.connect(url, header=headers, subprotocols=["wamp"], timeout=self.connect_timeout)
+            for uri in self.uris:
+                ws.send(json.dumps([WAMP_SUBSCRIBE, event_topic(uri)]))
+        except (websocket.WebSocketException, OSError) as exc:
+            ws.shutdown()
+            raise LcuEventStreamError(f"웹소켓 연결 실패: {exc}") from exc
+        self._ws = ws
+
+    def receive(self, timeout):
+        """구독한 경로의 다음 LcuEvent. timeout 동안 없으면 None."""
+        if not self.connected:
+            raise LcuEventStreamError("웹소켓이 연결되어 있지 않습니다.")
+        deadline = time.monotonic() + timeout
+        while True:
+            ws = self._ws
+            try:
+                ws.settimeout(max(deadline - time.monotonic(), 0.001))
+                # ping/pong과 연속 프레임은 websocket-client가 처리
+                opcode, payload = ws.recv_data()
+            except websocket.WebSocketTimeoutException:
+                return None
+            except (websocket.WebSocketException, OSError) as exc:
+                self.close()
+                raise LcuEventStreamError(f"웹소켓 수신 실패: {exc}") from exc
+            if opcode == websocket.ABNF.OPCODE_CLOSE:
+                self.close()
+                raise LcuEventStreamError("웹소켓 연결이 종료되었습니다.")
+            event = self._parse_event(payload)
+            if event is not None:
+                return event
+            if time.monotonic() >= deadline:
+                return None
+
+    def _parse_event(self, payload):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return None
+        if not isinstance(message, list) or len(message) < 3 or message[0] != WAMP_EVENT:
+            return None
+        body = message[2]
+        if not isinstance(body, dict) or body.get("uri") not in self.uris:
+            return None
+        return LcuEvent(body.get("uri"), body.get("eventType") or "Update", body.get("data"))
+
+    def close(self):
+        ws, self._ws = self._ws, None
+        if ws is None:
+            return
+        try:
+            ws.close(timeout=1.0)
+        except (websocket.WebSocketException, OSError):
+            ws.shutdown()
+
+
+def load_recorded_sessions(path):
+    """
+    재생할 세션 payload 목록을 읽습니다.
+    JSON 파일(세션 하나 또는 세션 목록)이거나, 그런 파일이 든 디렉터리(파일명 순서)입니다.
+    """
+    if os.path.isdir(path):
+        filenames = sorted(name for name in os.listdir(path) if name.endswith(".json"))
+        sessions = []
+        for filename in filenames:
+            sessions.extend(load_recorded_sessions(os.path.join(path, filename)))
+        return sessions
+    with open(path, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return payload if isinstance(payload, list) else [payload]
+
+
+class LcuReplayServer:
+    """
+    기록된 세션 payload를 LCU와 같은 WAMP 이벤트로 재생하는 로컬 웹소켓 서버 (ws://, TLS 없음).
+
+    클라이언트가 세션 토픽을 구독하면 sessions를 interval 간격으로 "Update" 이벤트로 보내고,
+    None 항목은 "Delete" 이벤트(픽창 종료)로 보냅니다. publish()로 이벤트를 직접 보낼 수도 있습니다.
+    웹소켓이 아닌 GET 요청에는 마지막으로 보낸 세션을 REST 응답으로 돌려줍니다 (없으면 404).
+
+        with LcuReplayServer(sessions) as server:
+            stream = LcuEventStream(server.base_url, server.auth)
+    """
+
+    def __init__(self, sessions=(), interval=0.0, password="replay", uri=CHAMP_SELECT_SESSION_URIS[0], port=0):
+        self.sessions = list(sessions)
+        self.interval = interval
+        self.auth = ("riot", password)
+        self.uri = uri
+        self._clients = []
+        self._clients_lock = threading.Lock()
+        self.subscribed = threading.Event()
+        self.current_session = None
+        server = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                server._serve_client(self.request)
+
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", port), Handler, bind_and_activate=False)
+        self._server.daemon_threads = True
+        self._server.allow_reuse_address = True
+        self._server.server_bind()
+        self._server.server_activate()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="lcu-replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for frames in clients:
+            try:
+                frames.sock.close()
+            except OSError:
+                pass
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_exc):
+        self.stop()
+
+    def publish(self, session, event_type=None):
+        """구독 중인 모든 클라이언트에 세션 이벤트 하나를 보냅니다."""
+        if event_type is None:
+            event_type = "Delete" if session is None else "Update"
+        self.current_session = session
+        message = [WAMP_EVENT, event_topic(self.uri), {"uri": self.uri, "eventType": event_type, "data": session}]
+        payload = json.dumps(message, ensure_ascii=False).encode("utf-8")
+        with self._clients_lock:
+            clients = list(self._clients)
+        for frames in clients:
+            try:
+                frames.send(payload)
+            except LcuEventStreamError:
+                pass
+
+    def _serve_rest(self, sock, request_line):
+        parts = request_line.split(" ")
+        path = parts[1] if len(parts) > 1 else ""
+        session = self.current_session
+        if path != self.uri or session is None:
+            sock.sendall(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            return
+        body = json.dumps(session, ensure_ascii=False).encode("utf-8")
+        sock.sendall((
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode("ascii") + body)
+
+    def _serve_client(self, sock):
+        frames = _FrameSocket(sock, mask_outgoing=False)
+        try:
+            request = frames.read_until(b"\r\n\r\n").decode("latin-1")
+            request_line, *header_lines = request.split("\r\n")
+            headers = {}
+            for line in header_lines:
+                name, _sep, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            token = base64.b64encode(f"{self.auth[0]}:{self.auth[1]}".encode("utf-8")).decode("ascii")
+            if headers.get("authorization") != f"Basic {token}":
+                sock.sendall(b"HTTP/1.1 401 Unauthorized\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                return
+            if "sec-websocket-key" not in headers:
+                self._serve_rest(sock, request_line)
+                return
+            sock.sendall((
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {_accept_key(headers['sec-websocket-key'])}\r\n"
+                "Sec-WebSocket-Protocol: wamp\r\n\r\n"
+            ).encode("ascii"))
+
+            topic = event_topic(self.uri)
+            while True:
+                message = frames.read_message(timeout=60.0)
+                if message is None:
+                    continue
+                try:
+                    request = json.loads(message[1])
+                except ValueError:
+                    continue
+                if request[:2] == [WAMP_SUBSCRIBE, topic]:
+                    break
+            with self._clients_lock:
+                self._clients.append(frames)
+            self.subscribed.set()
+            for session in self.sessions:
+                if self.interval:
+                    time.sleep(self.interval)
+                self.publish(session)
+            # 클라이언트가 닫을 때까지 나머지 구독/ping/close만 처리
+            while True:
+                frames.read_message(timeout=60.0)
+        except (LcuEventStreamError, OSError):
+            pass
+        finally:
+            with self._clients_lock:
+                if frames in self._clients:
+                    self._clients.remove(frames)
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+
+def main(argv):
+    if len(argv) < 3 or argv[1] != "replay":
+        print(__doc__)
+        return 1
+    sessions = load_recorded_sessions(argv[2])
+    port = int(argv[3]) if len(argv) > 3 else 0
+    server = LcuReplayServer(sessions, interval=1.0, password="replay", port=port)
+    server.start()
+    print(f"Replaying {len(sessions)} sessions on {server.base_url} (auth riot:replay). Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
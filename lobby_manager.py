@@ -14,9 +14,31 @@ from op_duos_tab import OpDuosTab
 from ignore_tab import IgnoreTab
 from counter_synergy_tab import CounterSynergyTab
 from credits_tab import CreditsTab
-from weight_settings_tab import WeightSettingsTab, load_weight_settings
+from weight_settings_tab import (
+    WeightSettingsTab,
+    build_lane_weight_matrices,
+    load_weight_settings,
+    weight_settings_mtime
+)
+from champion_data import DataStore
+from matchup_tensor import LANE_INDEX
+from scoring_engine import (
+    SIDE_KEYS,
+    DraftState,
+    ScoringEngine,
+    SlotState,
+    empty_score_details
+)
+from draft_optimizer import RemainingSlotsOptimizer
+from ban_advisor import BanAdvisor
+from lane_assignment import assign_lanes
+from lcu_events import CHAMP_SELECT_SESSION_URIS, LcuEventStream, LcuEventStreamError, event_stream_available
+from log_pipeline import BatchingLogWriter
+from snapshot_diff import CHANGE_ORDER, ban_ids, diff_snapshots
 from common import (
     resolve_resource_path,
+    parse_int,
+    parse_float,
     AutocompletePopup,
     ScoreTooltip,
     LANES,
@@ -50,21 +72,27 @@ DEBUG_DATA_DIR = Path(resolve_resource_path("debug_data"))
 DEBUG_DATA_DIR.mkdir(parents=True, exist_ok=True)
 APP_ROOT = Path(__file__).resolve().parent
 DEBUG_LOG_PATH = APP_ROOT / ".cursor" / "debug.log"
-DEBUG_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+# 로그 상세도 (ui_settings의 "log_level"). debug일 때만 agent 디버그 로그(DEBUG_LOG_PATH)를 남김
+LOG_LEVELS = {"off": logging.CRITICAL + 10, "error": logging.ERROR, "info": logging.INFO, "debug": logging.DEBUG}
+LOG_LEVEL_DEFAULT = "info"
+
+# 파일 쓰기는 로그 스레드가 모아서 처리 (호출하는 watcher 스레드는 기다리지 않음)
+LCU_LOG_WRITER = BatchingLogWriter(LCU_LOG_FILE, logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+DEBUG_LOG_WRITER = BatchingLogWriter(DEBUG_LOG_PATH)
 
 LCU_LOGGER = logging.getLogger("lcu_trace")
 if not LCU_LOGGER.handlers:
-    LCU_LOGGER.setLevel(logging.DEBUG)
-    _file_handler = logging.FileHandler(LCU_LOG_FILE, encoding="utf-8")
-    _file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-    LCU_LOGGER.addHandler(_file_handler)
+    LCU_LOGGER.setLevel(LOG_LEVELS[LOG_LEVEL_DEFAULT])
+    LCU_LOGGER.addHandler(LCU_LOG_WRITER.handler)
     LCU_LOGGER.propagate = False
 
-RECOMMEND_LOW_SAMPLE_TAG = "데이터 부족"
-RECOMMEND_HIGH_SAMPLE_TAG = "신뢰도 높음"
-RECOMMEND_FULL_COUNTER_TAG = "올카운터"
-RECOMMEND_OP_SYNERGY_TAG = "OP 시너지"
-RECOMMEND_PRE_PICK_TAG = "선픽 카드"
+
+def configure_logging(level_name=LOG_LEVEL_DEFAULT):
+    """로그 상세도를 바꿉니다 (off / error / info / debug). 알 수 없는 값이면 기본값."""
+    level = LOG_LEVELS.get(str(level_name).lower(), LOG_LEVELS[LOG_LEVEL_DEFAULT])
+    LCU_LOGGER.setLevel(level)
+    return level
 
 def load_app_version() -> str:
     """VERSION 파일을 읽어 앱 버전을 반환합니다."""
@@ -136,9 +164,8 @@ THEME_DARK = {
 BANPICK_DEFAULT_LANES = ['jungle', 'bottom', 'support', 'middle', 'top']
 BANPICK_MIN_GAMES_DEFAULT = 900
 BANPICK_PICK_RATE_OVERRIDE = 1.5
-BANPICK_HIGH_SAMPLE_THRESHOLD = 10000
-BANPICK_PRE_PICK_POPULARITY_THRESHOLD = 1.5
-SYNERGY_OP_THRESHOLD = 55.0
+# 추천 목록 한 페이지에 표시할 챔피언 수 (기본값, ui_settings의 recommend_page_size로 변경 가능)
+RECOMMEND_PAGE_SIZE_DEFAULT = 20
 CHOSEONG_LIST = [
     "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
     "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
@@ -186,14 +213,26 @@ def contains_hangul_syllable(text: str) -> bool:
     return any(0xAC00 <= ord(ch) <= 0xD7A3 for ch in text)
 
 
-def log_lcu_response(method: str, path: str, response, source: str = "watcher"):
-    """LCU 응답을 필요한 정보만 추출해서 로깅합니다."""
+_NOT_DECODED = object()
+
+
+def log_lcu_response(method: str, path: str, response, source: str = "watcher", payload=_NOT_DECODED):
+    """
+    LCU 응답을 필요한 정보만 추출해서 로깅합니다.
+    호출한 쪽에서 이미 디코드한 JSON은 payload로 넘기면 다시 파싱하지 않고, None이면 상태 코드만 남깁니다.
+    """
+    if not LCU_LOGGER.isEnabledFor(logging.INFO):
+        return
     status = getattr(response, "status_code", "unknown")
+
+    if payload is None:
+        LCU_LOGGER.info("[source=%s] %s %s status=%s", source, method, path, status)
+        return
     
     # 세션 엔드포인트인 경우 필요한 정보만 파싱
     if "/session" in path:
         try:
-            data = response.json()
+            data = response.json() if payload is _NOT_DECODED else payload
             # 필요한 정보만 추출
             phase = data.get("phase")
             timer_phase = data.get("timer", {}).get("phase") if isinstance(data.get("timer"), dict) else None
@@ -236,7 +275,7 @@ def log_lcu_response(method: str, path: str, response, source: str = "watcher"):
     elif "/all-grid-champions" in path:
         # 챔피언 그리드 엔드포인트는 간단히만 로깅
         try:
-            data = response.json()
+            data = response.json() if payload is _NOT_DECODED else payload
             champ_count = len(data) if isinstance(data, list) else 0
             LCU_LOGGER.info(
                 "[source=%s] %s %s status=%s champions_count=%d",
@@ -266,7 +305,14 @@ def log_lcu_response(method: str, path: str, response, source: str = "watcher"):
 
 
 #region agent log helper
+def agent_debug_enabled() -> bool:
+    """agent 디버그 로그를 남기는지 (log_level이 debug일 때만). 호출 전에 확인하면 data를 만드는 비용도 없음."""
+    return LCU_LOGGER.isEnabledFor(logging.DEBUG)
+
+
 def agent_debug_log(hypothesis_id: str, location: str, message: str, data: dict | None = None, run_id: str = "pre-fix"):
+    if not agent_debug_enabled():
+        return
     payload = {
         "sessionId": "debug-session",
         "runId": run_id,
@@ -277,9 +323,8 @@ def agent_debug_log(hypothesis_id: str, location: str, message: str, data: dict
         "timestamp": int(time.time() * 1000)
     }
     try:
-        with open(DEBUG_LOG_PATH, "a", encoding="utf-8") as fh:
-            fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
-    except Exception:
+        DEBUG_LOG_WRITER.write_line(json.dumps(payload, ensure_ascii=False))
+    except (TypeError, ValueError):
         # Debug logging 실패는 무시
         pass
 #endregion
@@ -292,21 +337,9 @@ def log_lcu_error(method: str, path: str, error: Exception, source: str = "watch
 
 
 def reset_lcu_log():
-    """LCU 로그 파일을 초기화합니다. 새 게임 시작 시 호출됩니다."""
-    try:
-        # 기존 핸들러 제거
-        for handler in LCU_LOGGER.handlers[:]:
-            handler.close()
-            LCU_LOGGER.removeHandler(handler)
-        
-        # 파일을 덮어쓰기 모드로 다시 열기 (기존 내용 삭제)
-        _file_handler = logging.FileHandler(LCU_LOG_FILE, mode='w', encoding="utf-8")
-        _file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-        LCU_LOGGER.addHandler(_file_handler)
-        LCU_LOGGER.info("=== 새 게임 시작: 로그 초기화 ===")
-    except Exception as exc:
-        # 로그 초기화 실패해도 프로그램은 계속 실행
-        print(f"[WARN] LCU 로그 초기화 실패: {exc}")
+    """LCU 로그 파일을 초기화합니다. 새 게임 시작 시 호출됩니다 (비우기는 로그 스레드가 순서대로 처리)."""
+    LCU_LOG_WRITER.truncate()
+    LCU_LOGGER.info("=== 새 게임 시작: 로그 초기화 ===")
 
 
 def save_game_snapshot(snapshot: dict):
@@ -496,6 +529,97 @@ class LeagueClientError(Exception):
         self.temporary = temporary
 
 
+# LCU keep-alive 연결 풀 크기 (세션 조회와 챔피언 그리드 조회가 겹칠 수 있음)
+LCU_POOL_MAXSIZE = 2
+# watcher가 응답 시간 요약을 로그에 남기는 간격 (초)
+LCU_LATENCY_LOG_INTERVAL = 60.0
+
+
+class LcuPollScheduler:
+    """
+    watcher가 폴링할 때 다음 조회까지 기다릴 시간을 정합니다.
+
+    - 픽/밴 진행 중(PLANNING, BAN_PICK): active_interval
+    - 그 밖의 세션(FINALIZATION 등): base_interval
+    - 세션이 있으면 타이머(adjustedTimeLeftInPhase)가 끝나는 직후에 한 번 더 확인
+    - 세션이 없으면 base_interval부터 두 배씩 늘려 idle_max_interval까지 (세션이 보이면 초기화)
+    """
+
+    ACTIVE_PHASES = ("PLANNING", "BAN_PICK")
+    # 단계가 바뀐 직후를 잡기 위해 타이머 종료 시각 뒤에 더 기다리는 시간 (초)
+    PHASE_EDGE_DELAY = 0.1
+
+    def __init__(self, base_interval=2.0, active_interval=0.5, idle_max_interval=8.0, min_interval=0.25):
+        self.base_interval = base_interval
+        self.active_interval = active_interval
+        self.idle_max_interval = idle_max_interval
+        self.min_interval = min_interval
+        self.idle_polls = 0
+
+    def reset(self):
+        self.idle_polls = 0
+
+    def next_interval(self, snapshot):
+        if not snapshot:
+            interval = min(self.base_interval * (2 ** self.idle_polls), self.idle_max_interval)
+            if interval < self.idle_max_interval:
+                self.idle_polls += 1
+            return interval
+
+        self.idle_polls = 0
+        timer = snapshot.get("timer") if isinstance(snapshot.get("timer"), dict) else {}
+        phase = snapshot.get("phase") or timer.get("phase")
+        interval = self.active_interval if phase in self.ACTIVE_PHASES else self.base_interval
+        time_left = timer.get("adjustedTimeLeftInPhase")
+        if isinstance(time_left, (int, float)) and time_left > 0:
+            interval = min(interval, time_left / 1000.0 + self.PHASE_EDGE_DELAY)
+        return max(interval, self.min_interval)
+
+
+class LcuLatencyStats:
+    """
+    LCU 요청 경로별 응답 시간 통계. watcher 스레드가 기록하고 UI 스레드가 읽습니다.
+    경로별 값은 튜플을 통째로 바꿔 넣으므로 읽는 쪽은 잠금 없이 복사본을 봅니다.
+    sessions는 keep-alive 세션을 새로 만든 횟수(새 연결/TLS 핸드셰이크가 필요했던 횟수)입니다.
+    """
+
+    def __init__(self):
+        self._paths = {}  # {path: (count, total, max, last)} (초)
+        self.sessions = 0
+
+    def session_opened(self):
+        self.sessions += 1
+
+    def record(self, path, seconds):
+        stats = self._paths.get(path)
+        if stats is None:
+            self._paths[path] = (1, seconds, seconds, seconds)
+            return
+        count, total, peak, _last = stats
+        self._paths[path] = (count + 1, total + seconds, max(peak, seconds), seconds)
+
+    def snapshot(self):
+        """{path: {"count", "avg_ms", "max_ms", "last_ms"}}"""
+        return {
+            path: {
+                "count": count,
+                "avg_ms": total / count * 1000.0,
+                "max_ms": peak * 1000.0,
+                "last_ms": last * 1000.0,
+            }
+            for path, (count, total, peak, last) in dict(self._paths).items()
+        }
+
+    def summary(self):
+        lines = [f"LCU 세션 생성 {self.sessions}회"]
+        for path, stats in sorted(self.snapshot().items()):
+            lines.append(
+                f"{path}: {stats['count']}회 평균 {stats['avg_ms']:.1f}ms "
+                f"최대 {stats['max_ms']:.1f}ms 최근 {stats['last_ms']:.1f}ms"
+            )
+        return "\n".join(lines)
+
+
 if requests is None:  # pragma: no cover - optional dependency
     class LeagueClientWatcher:
         def __init__(self, *_args, **_kwargs):
@@ -505,9 +629,16 @@ else:
         LOCKFILE_ENV = "LOL_LOCKFILE"
         ALIAS_REFRESH_INTERVAL = 60.0
         DEFAULT_INTERVAL = 2.0
+        # 웹소켓 이벤트 대기 단위 (stop 확인 주기) / 연결 실패 후 폴링으로 버티는 시간 (초)
+        EVENT_RECEIVE_TIMEOUT = 0.5
+        EVENT_RETRY_INTERVAL = 10.0
 
-        def __init__(self, poll_interval: float = DEFAULT_INTERVAL):
+        def __init__(self, poll_interval: float = DEFAULT_INTERVAL, use_event_stream: bool = True):
             self.poll_interval = poll_interval
+            self.scheduler = LcuPollScheduler(base_interval=poll_interval)
+            self._session_endpoint = None  # 마지막으로 세션을 돌려준 엔드포인트
+            self.use_event_stream = use_event_stream
+            self._event_retry_at = 0.0
             self._callback = None
             self._status_callback = None
             self._thread = None
@@ -516,8 +647,11 @@ else:
             self._lockfile_mtime = None
             self._base_url = None
             self._auth = None
+            self._http = None  # lockfile 자격 증명에 묶인 keep-alive 세션
+            self.latency = LcuLatencyStats()
+            self._latency_logged = 0.0
             self._champion_cache: dict[int, str] = {}
-            self._last_signature = None
+            self._last_snapshot = None  # 마지막으로 콜백에 넘긴 스냅샷 (변경 내역 비교용)
             self._last_status = ""
             self._alias_refreshed = 0.0
             self._had_session = False  # 이전에 세션이 있었는지 추적
@@ -534,7 +668,7 @@ else:
             self._status_callback = status_callback
             if self._thread and self._thread.is_alive():
                 return
-            self._last_signature = None
+            self._last_snapshot = None
             self._last_status = ""
             self._had_session = False  # 시작 시 세션 상태 초기화
             self._last_phase = None
@@ -542,6 +676,7 @@ else:
             self._first_pick_side = None
             self._pick_counter = 0
             self._seen_picks.clear()
+            self.scheduler.reset()
             self._stop_event.clear()
             self._thread = threading.Thread(target=self._poll_loop, daemon=True)
             self._thread.start()
@@ -551,6 +686,7 @@ else:
                 self._stop_event.set()
                 self._thread.join(timeout=1.0)
             self._thread = None
+            self._close_http_session()
 
         def is_running(self):
             return bool(self._thread and self._thread.is_alive())
@@ -560,6 +696,11 @@ else:
                 session = self._fetch_session()
             except LeagueClientError as exc:
                 return None, str(exc)
+            return self._snapshot_from_session(session)
+
+        def _snapshot_from_session(self, session):
+            if not (session.get("phase") or session.get("myTeam") or session.get("theirTeam")):
+                return None, "현재 픽창 단계가 아닙니다."
             snapshot = self._session_to_snapshot(session)
             # phase가 있거나 myTeam/theirTeam 데이터가 있으면 유효한 스냅샷으로 간주
             if snapshot.get("phase") or snapshot.get("allies") or snapshot.get("enemies"):
@@ -571,42 +712,93 @@ else:
 
         def _poll_loop(self):
             while not self._stop_event.is_set():
+                # 웹소켓 이벤트를 우선 사용하고, 연결이 안 되거나 끊기면 한동안 폴링으로 대신함
+                # (websocket-client가 없으면 폴링만 사용)
+                if self.use_event_stream and event_stream_available() and time.monotonic() >= self._event_retry_at:
+                    self._run_event_stream()
+                    if self._stop_event.is_set():
+                        break
                 snapshot, message = self.fetch_snapshot()
-                if snapshot:
-                    # 세션이 없었다가 새로 나타난 경우 (새 게임 시작) 로그 초기화
-                    if not self._had_session:
-                        reset_lcu_log()
-                        self._snapshot_saved = False  # 새 게임 시작 시 스냅샷 저장 플래그 리셋
-                        self._first_pick_side = None
-                        self._pick_counter = 0
-                        self._seen_picks.clear()
-                    self._had_session = True
-                    
-                    # 게임 시작 시점 감지 (FINALIZATION phase 또는 timer phase가 FINALIZATION)
-                    current_phase = snapshot.get("phase")
-                    timer = snapshot.get("timer", {})
-                    timer_phase = timer.get("phase") if isinstance(timer, dict) else None
-                    
-                    # FINALIZATION phase 감지 및 스냅샷 저장
-                    is_finalization = (
-                        current_phase == "FINALIZATION" or 
-                        timer_phase == "FINALIZATION"
-                    )
-                    
-                    # 모든 챔피언이 픽되었는지 확인 (allies와 enemies 모두 5명)
-                    allies = snapshot.get("allies", [])
-                    enemies = snapshot.get("enemies", [])
-                    all_picked = (
-                        len(allies) >= 5 and 
-                        len(enemies) >= 5 and
-                        all(entry.get("championId") for entry in allies) and
-                        all(entry.get("championId") for entry in enemies)
-                    )
-                    has_any_pick = bool(allies or enemies)
-                    #region agent log
+                self._handle_snapshot(snapshot, message)
+                self._stop_event.wait(self.scheduler.next_interval(snapshot))
+
+        def _run_event_stream(self):
+            """
+            LCU 웹소켓의 픽창 세션 이벤트로 스냅샷을 만듭니다 (픽/호버/밴이 바뀌는 즉시).
+            연결에 실패하거나 끊기면 돌아오며, EVENT_RETRY_INTERVAL 동안은 폴링으로 대신합니다.
+            """
+            try:
+                self._ensure_connection()
+                stream = LcuEventStream(self._base_url, self._auth)
+                stream.connect()
+            except (LeagueClientError, LcuEventStreamError) as exc:
+                self._event_retry_at = time.monotonic() + self.EVENT_RETRY_INTERVAL
+                LCU_LOGGER.info("[source=events] websocket unavailable, polling instead: %s", exc)
+                return
+            LCU_LOGGER.info("[source=events] subscribed %s", ", ".join(stream.uris))
+            try:
+                # 구독 전에 이미 진행 중이던 픽창 상태를 한 번 맞춤
+                snapshot, message = self.fetch_snapshot()
+                self._handle_snapshot(snapshot, message)
+                while not self._stop_event.is_set():
+                    event = stream.receive(self.EVENT_RECEIVE_TIMEOUT)
+                    if event is not None:
+                        self._handle_session_event(event)
+            except LcuEventStreamError as exc:
+                if not self._stop_event.is_set():
+                    self._event_retry_at = time.monotonic() + self.EVENT_RETRY_INTERVAL
+                    LCU_LOGGER.info("[source=events] websocket closed, polling instead: %s", exc)
+            finally:
+                stream.close()
+
+        def _handle_session_event(self, event):
+            if event.event_type == "Delete" or not isinstance(event.data, dict):
+                self._handle_snapshot(None, "현재 픽창 단계가 아닙니다.")
+                return
+            snapshot, message = self._snapshot_from_session(event.data)
+            self._handle_snapshot(snapshot, message)
+
+        def _handle_snapshot(self, snapshot, message):
+            """
+            폴링/이벤트 공통: 세션 상태를 갱신하고, 직전 스냅샷과 달라졌으면
+            callback(snapshot, message, diff)로 변경 내역(SnapshotDiff)과 함께 넘깁니다.
+            """
+            if snapshot:
+                # 세션이 없었다가 새로 나타난 경우 (새 게임 시작) 로그 초기화
+                if not self._had_session:
+                    reset_lcu_log()
+                    self._snapshot_saved = False  # 새 게임 시작 시 스냅샷 저장 플래그 리셋
+                    self._first_pick_side = None
+                    self._pick_counter = 0
+                    self._seen_picks.clear()
+                self._had_session = True
+                
+                # 게임 시작 시점 감지 (FINALIZATION phase 또는 timer phase가 FINALIZATION)
+                current_phase = snapshot.get("phase")
+                timer = snapshot.get("timer", {})
+                timer_phase = timer.get("phase") if isinstance(timer, dict) else None
+                
+                # FINALIZATION phase 감지 및 스냅샷 저장
+                is_finalization = (
+                    current_phase == "FINALIZATION" or 
+                    timer_phase == "FINALIZATION"
+                )
+                
+                # 모든 챔피언이 픽되었는지 확인 (allies와 enemies 모두 5명)
+                allies = snapshot.get("allies", [])
+                enemies = snapshot.get("enemies", [])
+                all_picked = (
+                    len(allies) >= 5 and 
+                    len(enemies) >= 5 and
+                    all(entry.get("championId") for entry in allies) and
+                    all(entry.get("championId") for entry in enemies)
+                )
+                has_any_pick = bool(allies or enemies)
+                #region agent log
+                if agent_debug_enabled():
                     agent_debug_log(
                         hypothesis_id="H7_save_gate",
-                        location="lobby_manager.py:_poll_loop",
+                        location="lobby_manager.py:_handle_snapshot",
                         message="save_gate_state",
                         data={
                             "phase": current_phase,
@@ -621,73 +813,55 @@ else:
                             "snapshot_saved": self._snapshot_saved,
                         }
                     )
-                    #endregion
-                    
-                    # FINALIZATION phase이고 (모든 픽 완료 또는 일부라도 존재)하며 아직 스냅샷을 저장하지 않았으면 저장
-                    if is_finalization and (all_picked or has_any_pick) and not self._snapshot_saved:
-                        save_game_snapshot(snapshot)
-                        self._snapshot_saved = True
-                    
-                    self._last_phase = current_phase or timer_phase
-                    
-                    signature = (
-                        tuple(entry["championId"] for entry in snapshot.get("allies", [])),
-                        tuple(entry["championId"] for entry in snapshot.get("enemies", []))
-                    )
-                    if signature != self._last_signature:
-                        self._last_signature = signature
-                        if self._callback:
-                            self._callback(snapshot, message)
-                else:
-                    # 세션이 사라진 경우 (게임 종료 또는 픽창 종료)
-                    if self._had_session:
-                        self._had_session = False
-                        self._snapshot_saved = False  # 세션 종료 시 스냅샷 저장 플래그 리셋
-                        self._last_phase = None
-                        self._first_pick_side = None
-                        self._pick_counter = 0
-                        self._seen_picks.clear()
-                    if message and message != self._last_status:
-                        self._last_status = message
-                        if self._status_callback:
-                            self._status_callback(message)
-                self._stop_event.wait(self.poll_interval)
+                #endregion
+                
+                # FINALIZATION phase이고 (모든 픽 완료 또는 일부라도 존재)하며 아직 스냅샷을 저장하지 않았으면 저장
+                if is_finalization and (all_picked or has_any_pick) and not self._snapshot_saved:
+                    save_game_snapshot(snapshot)
+                    self._snapshot_saved = True
+                
+                self._last_phase = current_phase or timer_phase
+                
+                # 픽/호버, 라인, 슬롯 순서, 밴, phase 중 바뀐 것만 변경 내역으로 넘김
+                diff = diff_snapshots(self._last_snapshot, snapshot)
+                if diff:
+                    self._last_snapshot = snapshot
+                    if self._callback:
+                        self._callback(snapshot, message, diff)
+            else:
+                # 세션이 사라진 경우 (게임 종료 또는 픽창 종료)
+                if self._had_session:
+                    self._had_session = False
+                    self._last_snapshot = None  # 다음 픽창은 전체 반영부터
+                    self._snapshot_saved = False  # 세션 종료 시 스냅샷 저장 플래그 리셋
+                    self._last_phase = None
+                    self._first_pick_side = None
+                    self._pick_counter = 0
+                    self._seen_picks.clear()
+                if message and message != self._last_status:
+                    self._last_status = message
+                    if self._status_callback:
+                        self._status_callback(message)
 
         def _fetch_session(self):
             self._ensure_connection()
             
-            endpoints = [
-                "/lol-champ-select/v1/session",
-                "/lol-champ-select-legacy/v1/session"
-            ]
+            # 지난번에 세션을 돌려준 엔드포인트부터 조회
+            endpoints = list(CHAMP_SELECT_SESSION_URIS)
+            if self._session_endpoint in endpoints:
+                endpoints.remove(self._session_endpoint)
+                endpoints.insert(0, self._session_endpoint)
             
             for endpoint in endpoints:
-                response = self._perform_lcu_get(endpoint, timeout=2.5, allow_404=True)
-                if response is None:
+                session = self._get_lcu_json(endpoint, timeout=2.5, allow_404=True)
+                if not isinstance(session, dict):
                     continue
-                try:
-                    session = response.json()
-                    
-                    if session.get("phase") or session.get("myTeam") or session.get("theirTeam"):
-                        return session
-                except ValueError:
-                    pass
+                if session.get("phase") or session.get("myTeam") or session.get("theirTeam"):
+                    self._session_endpoint = endpoint
+                    return session
             
             raise LeagueClientError("현재 픽창 단계가 아닙니다.", temporary=True)
 
-        def _fetch_session_from_endpoint(self, path):
-            # This method is deprecated and replaced by loop in _fetch_session, keeping it if needed or can be removed
-            try:
-                response = self._perform_lcu_get(path, timeout=2.5, allow_404=True)
-            except LeagueClientError:
-                raise
-            if response is None:
-                return None
-            try:
-                return response.json()
-            except ValueError:
-                return None
-
         def _ensure_connection(self):
             lockfile = self._find_lockfile()
             if not lockfile:
@@ -696,7 +870,7 @@ else:
                 mtime = os.path.getmtime(lockfile)
             except OSError as exc:
                 raise LeagueClientError(f"lockfile 정보를 읽을 수 없습니다: {exc}", temporary=True)
-            if self._lockfile_mtime == mtime and self._base_url and self._auth:
+            if self._lockfile_mtime == mtime and self._base_url and self._auth and self._http is not None:
                 return
             self._lockfile_mtime = mtime
             try:
@@ -710,6 +884,24 @@ else:
             _name, _pid, port, password, protocol = parts[:5]
             self._base_url = f"{protocol}://127.0.0.1:{port}"
             self._auth = ("riot", password)
+            self._open_http_session()
+
+        def _open_http_session(self):
+            """새 lockfile 자격 증명으로 keep-alive 세션을 다시 만듭니다 (이전 연결은 닫음)."""
+            self._close_http_session()
+            session = requests.Session()
+            session.auth = self._auth
+            session.verify = False
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=LCU_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._http = session
+            self.latency.session_opened()
+
+        def _close_http_session(self):
+            session, self._http = self._http, None
+            if session is not None:
+                session.close()
 
         def _find_lockfile(self):
             if self._lockfile_path and os.path.exists(self._lockfile_path):
@@ -732,12 +924,13 @@ else:
             if self._first_pick_side is None:
                 self._first_pick_side = self._detect_first_pick_side(allies, enemies)
                 #region agent log
-                agent_debug_log(
-                    hypothesis_id="H5_first_pick_side",
-                    location="lobby_manager.py:_session_to_snapshot",
-                    message="first_pick_side_detected",
-                    data={"firstPickSide": self._first_pick_side}
-                )
+                if agent_debug_enabled():
+                    agent_debug_log(
+                        hypothesis_id="H5_first_pick_side",
+                        location="lobby_manager.py:_session_to_snapshot",
+                        message="first_pick_side_detected",
+                        data={"firstPickSide": self._first_pick_side}
+                    )
                 #endregion
 
             # 밴 챔피언 수집 (우리팀 / 상대팀)
@@ -892,17 +1085,18 @@ else:
                             self._pick_counter += 1
                             self._seen_picks.add(key)
                             #region agent log
-                            agent_debug_log(
-                                hypothesis_id="H6_synth_pickturn",
-                                location="lobby_manager.py:_assign_synthetic_pickturn",
-                                message="synthetic_pick_assigned",
-                                data={
-                                    "pickCounter": self._pick_counter,
-                                    "cellId": cell_id,
-                                    "championId": champ_id,
-                                    "isAlly": is_ally
-                                }
-                            )
+                            if agent_debug_enabled():
+                                agent_debug_log(
+                                    hypothesis_id="H6_synth_pickturn",
+                                    location="lobby_manager.py:_assign_synthetic_pickturn",
+                                    message="synthetic_pick_assigned",
+                                    data={
+                                        "pickCounter": self._pick_counter,
+                                        "cellId": cell_id,
+                                        "championId": champ_id,
+                                        "isAlly": is_ally
+                                    }
+                                )
                             #endregion
                         old_pick = entry.get("pickTurn")
                         if not isinstance(old_pick, int) or old_pick <= 0:
@@ -950,27 +1144,29 @@ else:
             ]
             for endpoint in endpoints:
                 try:
-                    response = self._perform_lcu_get(endpoint, timeout=3.0, allow_404=True)
+                    payload = self._get_lcu_json(endpoint, timeout=3.0, allow_404=True)
                 except LeagueClientError:
                     return None
-                if response is None:
-                    continue
-                try:
-                    return response.json()
-                except ValueError:
-                    continue
+                if payload is not None:
+                    return payload
             return None
 
         def _perform_lcu_get(self, path, timeout=2.5, allow_404=False):
-            if not self._base_url or not self._auth:
+            session = self._http
+            if not self._base_url or not self._auth or session is None:
                 raise LeagueClientError("LCU 연결 정보가 없습니다.", temporary=True)
             url = f"{self._base_url}{path}"
+            started = time.perf_counter()
             try:
-                response = requests.get(url, auth=self._auth, timeout=timeout, verify=False)
+                response = session.get(url, timeout=timeout)
             except requests.RequestException as exc:
                 log_lcu_error("GET", path, exc, source="watcher")
                 raise LeagueClientError(f"LCU 연결 실패: {exc}", temporary=True)
-            log_lcu_response("GET", path, response, source="watcher")
+            self.latency.record(path, time.perf_counter() - started)
+            self._log_latency_summary()
+            if response.status_code != 200:
+                # 성공 응답은 _get_lcu_json이 디코드한 뒤 로깅
+                log_lcu_response("GET", path, response, source="watcher", payload=None)
             if response.status_code == 401:
                 self._lockfile_mtime = None
                 raise LeagueClientError("LCU 인증에 실패했습니다. 잠시 후 다시 시도하세요.", temporary=True)
@@ -978,6 +1174,29 @@ else:
                 return None
             response.raise_for_status()
             return response
+
+        def _get_lcu_json(self, path, timeout=2.5, allow_404=False):
+            """GET 후 JSON을 한 번만 디코드해 반환합니다 (404이거나 JSON이 아니면 None). 로그에도 같은 객체를 넘깁니다."""
+            response = self._perform_lcu_get(path, timeout=timeout, allow_404=allow_404)
+            if response is None:
+                return None
+            try:
+                payload = response.json()
+            except ValueError:
+                # 디코드에 실패한 본문은 다시 파싱하지 않고 상태 코드만 기록
+                log_lcu_response("GET", path, response, source="watcher", payload=None)
+                return None
+            log_lcu_response("GET", path, response, source="watcher", payload=payload)
+            return payload
+
+        def _log_latency_summary(self):
+            now = time.monotonic()
+            if now - self._latency_logged < LCU_LATENCY_LOG_INTERVAL:
+                return
+            self._latency_logged = now
+            LCU_LOGGER.info("[source=watcher] latency %s", self.latency.summary().replace("\n", " | "))
+
+
 def diagnose_lcu_connection():
     if requests is None:
         return False, "requests 패키지가 설치되어 있지 않아 LCU 연결을 점검할 수 없습니다.", {}
@@ -1116,16 +1335,39 @@ class ChampionScraperApp:
         
         self.dashboard_tab = tk.Frame(self.notebook)
         self.notebook.add(self.dashboard_tab, text="챔피언 추천")
-        self.recommend_counter_cache = {}
         
-        # 챔피언 데이터 캐시 및 사전 로딩
-        self.champion_data_cache = {}
-        threading.Thread(target=self.preload_all_champion_data, daemon=True).start()
+        (
+            self.canonical_lookup,
+            self.alias_lookup,
+            self.display_lookup,
+            self.autocomplete_candidates
+        ) = load_alias_tables()
+
+        # 챔피언 매치업 데이터 저장소 (백그라운드 로딩, 끝나기 전에는 빈 텐서로 동작)
+        self.data_store = DataStore(self.resolve_champion_name)
+        # 로딩 중이라 라인 배정을 미룬 클라이언트 진영 (로딩이 끝나면 다시 반영)
+        self._deferred_client_lane_sides = set()
+        # 텐서에 없는 표기(별칭 등)를 resolve_champion_name으로 찾은 결과 (소문자 이름 → ID)
+        self.champion_id_cache = {}
+        # 현재 텐서에 묶인 점수 계산 엔진 (scoring_engine 속성 참고)
+        self._scoring_engine = None
+        # 슬롯/라인/밴/무시/가중치 변경 시 재계산을 Tk idle 시점에 한 번으로 합침 (schedule_recompute 참고)
+        self._recompute_pending = False
+        # 이미 예약된 재계산에 합쳐져 따로 실행되지 않은 요청 수
+        self.recompute_skipped_count = 0
+        # 마지막 재계산에 쓴 draft 상태 (툴팁이 같은 상태의 점수 캐시를 읽음)
+        self.last_draft_state = None
+        # 추천 목록 현재 페이지 (0부터)
+        self.recommend_page = 0
         
         self._lane_swap_guard = False
         self.paned_window = None  # Will be set in build_dashboard_tab
         self.ui_settings = self._load_ui_settings()  # Load UI settings
+        configure_logging(self.ui_settings.get("log_level", LOG_LEVEL_DEFAULT))
         self.weight_settings = load_weight_settings()  # Load weight settings
+        # 라인 가중치 5×5 행렬 캐시 (가중치 입력 변경/설정 파일 변경 시에만 다시 만듦)
+        self.weight_settings_mtime = weight_settings_mtime()
+        self.lane_weight_matrices = None
         
         # 테마 초기화
         saved_theme = self.ui_settings.get("theme", "light")
@@ -1139,39 +1381,6 @@ class ChampionScraperApp:
         self.banned_champions: set[str] = set()
         # 팀별 밴 표시용 레이블 ({"allies": Label, "enemies": Label})
         self.ban_labels: dict[str, tk.Label] = {}
-        
-        (
-            self.canonical_lookup,
-            self.alias_lookup,
-            self.display_lookup,
-            self.autocomplete_candidates
-        ) = load_alias_tables()
-
-    def preload_all_champion_data(self):
-        """
-        data 디렉토리의 모든 JSON 파일을 읽어 메모리에 캐싱합니다.
-        백그라운드 스레드에서 실행됩니다.
-        """
-        data_dir = resolve_resource_path("data")
-        if not os.path.exists(data_dir):
-            return
-            
-        try:
-            for filename in os.listdir(data_dir):
-                if not filename.endswith(".json"):
-                    continue
-                    
-                path = os.path.join(data_dir, filename)
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        self.champion_data_cache[filename] = data
-                except Exception as e:
-                    print(f"Failed to load {filename}: {e}")
-        except Exception as e:
-            print(f"Error during data preload: {e}")
-            
-        print(f"Preloaded {len(self.champion_data_cache)} champion data files.")
 
         self.ignored_champions = self._initialize_ignored_champions()
         
@@ -1185,6 +1394,7 @@ class ChampionScraperApp:
         if requests is None:
             initial_lcu_status = "requests 미설치로 LCU 점검 불가"
         self.lcu_status_var = tk.StringVar(value=initial_lcu_status)
+        self.data_status_var = tk.StringVar(value="데이터 로딩 중...")
         self.client_sync_var = tk.BooleanVar(value=True)
 
         self.apply_theme()
@@ -1201,6 +1411,129 @@ class ChampionScraperApp:
         # Weight settings tab
         self.weight_settings_tab = WeightSettingsTab(self.notebook, self)
 
+        self.data_store.add_progress_listener(self._on_data_load_progress)
+        self.data_store.add_ready_listener(self._on_data_store_ready)
+        self.data_store.start()
+
+    @property
+    def matchup_tensor(self):
+        """로딩이 끝나기 전에는 빈 텐서를 반환합니다 (추천/점수가 비어 있다가 로딩 완료 시 갱신됨)."""
+        return self.data_store.tensor
+
+    @property
+    def data_catalog(self):
+        """텐서와 함께 만든 데이터 파일 목록 (로딩이 끝나기 전에는 빈 목록)."""
+        return self.data_store.catalog
+
+    def _lane_data_catalog(self):
+        """
+        라인 자동 배정에 쓰는 데이터 목록 (텐서는 catalog.tensor).
+        로딩 중이면 UI 스레드에서 기다리지 않고 None을 반환하며, 호출한 쪽은 배정을 미뤄 두었다가
+        로딩이 끝나면(_apply_data_store_ready) 다시 실행합니다.
+        """
+        if not self.data_store.is_ready:
+            return None
+        return self.data_store.catalog
+
+    def _get_recommend_thresholds(self):
+        min_games = self.parse_int(self.recommend_min_games_entry.get()) if hasattr(self, "recommend_min_games_entry") else BANPICK_MIN_GAMES_DEFAULT
+        if min_games < 0:
+            min_games = 0
+
+        pick_rate_override = (
+            self.parse_float(self.recommend_pick_rate_entry.get())
+            if hasattr(self, "recommend_pick_rate_entry") else BANPICK_PICK_RATE_OVERRIDE
+        )
+        if pick_rate_override < 0:
+            pick_rate_override = 0.0
+        return min_games, pick_rate_override
+
+    @property
+    def scoring_engine(self):
+        """현재 매치업 텐서에 묶인 ScoringEngine (데이터가 다시 로딩되면 새로 만듦)."""
+        tensor = self.matchup_tensor
+        engine = self._scoring_engine
+        if engine is None or engine.tensor is not tensor:
+            engine = ScoringEngine(tensor, self.champion_id_for_name)
+            self._scoring_engine = engine
+        return engine
+
+    def snapshot_draft_state(self) -> DraftState:
+        """
+        점수 계산에 필요한 위젯 상태를 한 번에 읽어 DraftState로 만듭니다.
+        새로 고침마다 한 번만 호출하고, 이후 계산은 위젯에 접근하지 않습니다.
+        """
+        sides = {}
+        for side_key in SIDE_KEYS:
+            slot_states = []
+            for idx, slot in enumerate(self.banpick_slots.get(side_key, [])):
+                lane_widget = slot.get("lane")
+                lane_choice = lane_widget.get().lower() if lane_widget else None
+                exclude_var = slot.get("exclude_var")
+                slot_states.append(SlotState(
+                    side=side_key,
+                    index=idx,
+                    canonical_name=slot.get("canonical_name"),
+                    display_name=slot.get("display_name"),
+                    selected_lane=slot.get("selected_lane"),
+                    lane_choice=lane_choice,
+                    excluded=bool(exclude_var and exclude_var.get())
+                ))
+            sides[side_key] = tuple(slot_states)
+        my_lane_var = getattr(self, "my_lane_var", None)
+        min_games, pick_rate_override = self._get_recommend_thresholds()
+        return DraftState(
+            allies=sides["allies"],
+            enemies=sides["enemies"],
+            my_lane=my_lane_var.get() if my_lane_var else None,
+            banned=frozenset(getattr(self, "banned_champions", ())),
+            ignored=frozenset(self.ignored_champions),
+            min_games=min_games,
+            pick_rate_override=pick_rate_override,
+            lane_weights=self.get_lane_weight_matrices()
+        )
+
+    @staticmethod
+    def _slot_state_for(draft, champion_slot):
+        side_slots = draft.side(champion_slot.get("side"))
+        idx = champion_slot.get("index")
+        if idx is None or not 0 <= idx < len(side_slots):
+            return None
+        return side_slots[idx]
+
+    def _on_data_load_progress(self, done, total, message):
+        # 로딩 스레드에서 호출됨
+        self.root.after(0, lambda: self.data_status_var.set(f"데이터 로딩 중... ({done}/{total})"))
+
+    def _on_data_store_ready(self, store):
+        # 로딩 스레드에서 호출됨
+        self.root.after(0, lambda: self._apply_data_store_ready(store))
+
+    def _apply_data_store_ready(self, store):
+        if store.error is not None:
+            self.data_status_var.set("데이터 로딩 실패")
+            return
+        self.data_status_var.set(f"챔피언 {len(store.tensor)}명 데이터 준비 완료")
+        # 로딩 전에 입력된 슬롯/추천을 실제 데이터로 다시 계산
+        self.champion_id_cache.clear()
+        self._run_deferred_lane_assignment()
+        self.schedule_recompute()
+
+    def _run_deferred_lane_assignment(self):
+        """로딩 중이라 미뤄 둔 라인 자동 배정(클라이언트 스냅샷, 슬롯 라인 감지)을 다시 실행합니다."""
+        sides = self._deferred_client_lane_sides
+        self._deferred_client_lane_sides = set()
+        snapshot = getattr(self, "last_client_snapshot", None)
+        if snapshot:
+            for side_key in SIDE_KEYS:
+                if side_key in sides:
+                    entries = self._normalize_client_entries(snapshot.get(side_key, []))
+                    self._populate_side_from_client(side_key, entries, force=True)
+        for side_key in SIDE_KEYS:
+            for slot in self.banpick_slots.get(side_key, []):
+                if slot.pop("lane_detection_deferred", False):
+                    self.perform_banpick_search(slot, auto_trigger=True)
+
     def apply_theme(self, theme=None):
         """현재 테마 또는 지정된 테마를 적용합니다."""
         if theme is not None:
@@ -1318,7 +1651,8 @@ class ChampionScraperApp:
     def build_dashboard_tab(self):
         self.banpick_slots = {"allies": [], "enemies": []}
         self.my_lane_var = tk.StringVar(value="")
-        self.my_lane_var.trace_add("write", lambda *_: self.update_banpick_recommendations())
+        self.recommend_page_var = tk.StringVar(value="")
+        self.my_lane_var.trace_add("write", lambda *_: self.schedule_recompute())
         lcu_frame = tk.LabelFrame(self.dashboard_tab, text="클라이언트 연결 상태")
         lcu_frame.pack(fill="x", padx=10, pady=(0, 5))
         tk.Label(
@@ -1371,6 +1705,11 @@ class ChampionScraperApp:
             width=10
         )
         self.theme_toggle_button.pack(side="right", padx=(5, 8))
+        tk.Label(
+            lcu_frame,
+            textvariable=self.data_status_var,
+            anchor="e"
+        ).pack(side="right", padx=(10, 5))
         
         # My Lane selection frame
         my_lane_frame = tk.LabelFrame(self.dashboard_tab, text="나의 라인")
@@ -1454,37 +1793,81 @@ class ChampionScraperApp:
         self.recommend_min_games_entry = tk.Entry(filter_frame, width=6)
         self.recommend_min_games_entry.insert(0, str(BANPICK_MIN_GAMES_DEFAULT))
         self.recommend_min_games_entry.pack(side="left", padx=(4, 0))
-        self.recommend_min_games_entry.bind("<KeyRelease>", lambda _e: self.update_banpick_recommendations())
-        self.recommend_min_games_entry.bind("<FocusOut>", lambda _e: self.update_banpick_recommendations())
+        # 임계값은 입력을 마쳤을 때(Enter/포커스 이동)만 반영 (입력 중간 값마다 다시 계산하지 않음)
+        self.recommend_min_games_entry.bind("<Return>", lambda _e: self.schedule_recompute())
+        self.recommend_min_games_entry.bind("<FocusOut>", lambda _e: self.schedule_recompute())
 
         tk.Label(filter_frame, text="최소 픽률").pack(side="left", padx=(10, 0))
         self.recommend_pick_rate_entry = tk.Entry(filter_frame, width=6)
         self.recommend_pick_rate_entry.insert(0, str(BANPICK_PICK_RATE_OVERRIDE))
         self.recommend_pick_rate_entry.pack(side="left", padx=(4, 0))
-        self.recommend_pick_rate_entry.bind("<KeyRelease>", lambda _e: self.update_banpick_recommendations())
-        self.recommend_pick_rate_entry.bind("<FocusOut>", lambda _e: self.update_banpick_recommendations())
-
-        columns = ("챔피언", "태그", "최종 점수", "시너지", "카운터")
-        self.recommend_tree = ttk.Treeview(recommend_frame, columns=columns, show="headings", height=8)
-        for col in columns:
-            self.recommend_tree.heading(col, text=col)
-            self.recommend_tree.column(col, anchor="center")
-        self.recommend_tree.column("챔피언", anchor="w", width=100)
-        self.recommend_tree.column("태그", anchor="w", width=50)
-        self.recommend_tree.column("최종 점수", width=10)
-        self.recommend_tree.column("시너지", width=500)
-        self.recommend_tree.column("카운터", width=500)
-        scroll = tk.Scrollbar(recommend_frame, orient="vertical", command=self.recommend_tree.yview)
-        scroll.pack(side="right", fill="y")
-        self.recommend_tree.configure(yscrollcommand=scroll.set)
-        self.recommend_tree.pack(fill="both", expand=True)
+        self.recommend_pick_rate_entry.bind("<Return>", lambda _e: self.schedule_recompute())
+        self.recommend_pick_rate_entry.bind("<FocusOut>", lambda _e: self.schedule_recompute())
+
+        tk.Label(filter_frame, text="표시 개수").pack(side="left", padx=(10, 0))
+        self.recommend_page_size_entry = tk.Entry(filter_frame, width=4)
+        self.recommend_page_size_entry.insert(0, str(self._get_recommend_page_size()))
+        self.recommend_page_size_entry.pack(side="left", padx=(4, 0))
+        self.recommend_page_size_entry.bind("<Return>", self._on_recommend_page_size_changed)
+        self.recommend_page_size_entry.bind("<FocusOut>", self._on_recommend_page_size_changed)
+
+        # 내 라인 탭 + 라인별 탭 (모든 라인 추천은 재계산 때 한 번에 채워 두므로 탭 전환은 즉시)
+        self.recommend_notebook = ttk.Notebook(recommend_frame)
+        self.recommend_notebook.pack(fill="both", expand=True)
+        my_lane_tab = tk.Frame(self.recommend_notebook)
+        self.recommend_notebook.add(my_lane_tab, text="내 라인")
+        self.recommend_tree = self._create_recommend_tree(my_lane_tab)
+        self.lane_recommend_trees = {}
+        for lane in LANES:
+            lane_tab = tk.Frame(self.recommend_notebook)
+            self.recommend_notebook.add(lane_tab, text=lane)
+            self.lane_recommend_trees[lane] = self._create_recommend_tree(lane_tab)
+        # 밴 추천 탭: 상대가 골랐을 때 우리 팀 조합 점수를 가장 많이 떨어뜨리는 챔피언
+        ban_tab = tk.Frame(self.recommend_notebook)
+        self.recommend_notebook.add(ban_tab, text="밴 추천")
+        ban_columns = ("챔피언", "라인", "위협도", "아군 점수 감소", "상대 시너지")
+        self.ban_threat_tree = ttk.Treeview(ban_tab, columns=ban_columns, show="headings", height=8)
+        for col in ban_columns:
+            self.ban_threat_tree.heading(col, text=col)
+            self.ban_threat_tree.column(col, anchor="center", width=100)
+        self.ban_threat_tree.column("챔피언", anchor="w")
+        ban_scroll = tk.Scrollbar(ban_tab, orient="vertical", command=self.ban_threat_tree.yview)
+        ban_scroll.pack(side="right", fill="y")
+        self.ban_threat_tree.configure(yscrollcommand=ban_scroll.set)
+        self.ban_threat_tree.pack(fill="both", expand=True)
         action_frame = tk.Frame(recommend_frame)
         action_frame.pack(fill="x", padx=5, pady=(5, 5))
+        tk.Button(action_frame, text="◀ 이전", command=lambda: self.change_recommend_page(-1)).pack(side="left")
+        tk.Label(action_frame, textvariable=self.recommend_page_var).pack(side="left", padx=(6, 6))
+        tk.Button(action_frame, text="다음 ▶", command=lambda: self.change_recommend_page(1)).pack(side="left")
         tk.Button(
             action_frame,
             text="선택 챔피언 제외",
             command=self.ignore_selected_recommendations
         ).pack(side="right")
+        tk.Button(
+            action_frame,
+            text="남은 슬롯 조합 추천",
+            command=self.show_remaining_slot_plans
+        ).pack(side="right", padx=(0, 6))
+
+    def show_remaining_slot_plans(self):
+        """비어 있는 아군 슬롯 전체에 대한 추천 조합(팀 조합 점수 기준)을 보여줍니다."""
+        draft = self.snapshot_draft_state()
+        plans = RemainingSlotsOptimizer(self.scoring_engine).optimize(draft)
+        if not plans:
+            messagebox.showinfo("남은 슬롯 조합 추천", "추천할 조합이 없습니다. (빈 아군 슬롯 또는 데이터 없음)")
+            return
+        lines = []
+        for rank, plan in enumerate(plans, start=1):
+            if plan.complete:
+                lines.append(f"[{rank}] 조합 점수: {plan.team_average:.2f} (합계 {plan.team_total:.2f})")
+            else:
+                lines.append(f"[{rank}] 조합 점수 합계: {plan.team_total:.2f}")
+            for _index, lane, name, score in plan.assignments:
+                lines.append(f"  {lane}: {name} ({score:.2f})")
+            lines.append("")
+        messagebox.showinfo("남은 슬롯 조합 추천", "\n".join(lines).strip())
 
     def manual_client_import(self):
         if not self.client_sync_supported or not self.client_watcher:
@@ -1658,7 +2041,7 @@ class ChampionScraperApp:
         changed |= self._populate_side_from_client("enemies", current_enemies, sort_by_lane=False)
         
         if changed:
-            self.update_banpick_recommendations()
+            self.schedule_recompute()
 
         # 다음 단계 예약 (3초 후)
         self.root.after(3000, lambda: self._replay_step(groups, step_index + 1, original_snapshot))
@@ -1676,6 +2059,8 @@ class ChampionScraperApp:
         if success:
             self.client_sync_checkbox.config(state="normal")
             self.client_fetch_button.config(state="normal")
+            if self.client_watcher and self.client_watcher.latency.sessions:
+                report = f"{report}\n\n[실시간 연동 응답 시간]\n{self.client_watcher.latency.summary()}"
             messagebox.showinfo("클라이언트 연결 점검", report)
             if self.client_sync_var.get():
                 self._start_client_sync()
@@ -1684,10 +2069,37 @@ class ChampionScraperApp:
             self.client_fetch_button.config(state="disabled")
             messagebox.showerror("클라이언트 연결 점검", report)
 
+    def _create_recommend_tree(self, parent):
+        columns = ("챔피언", "태그", "최종 점수", "시너지", "카운터")
+        tree = ttk.Treeview(parent, columns=columns, show="headings", height=8)
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, anchor="center")
+        tree.column("챔피언", anchor="w", width=100)
+        tree.column("태그", anchor="w", width=50)
+        tree.column("최종 점수", width=10)
+        tree.column("시너지", width=500)
+        tree.column("카운터", width=500)
+        scroll = tk.Scrollbar(parent, orient="vertical", command=tree.yview)
+        scroll.pack(side="right", fill="y")
+        tree.configure(yscrollcommand=scroll.set)
+        tree.pack(fill="both", expand=True)
+        return tree
+
+    def _active_recommend_tree(self):
+        """추천 탭 중 현재 보이는 탭의 Treeview."""
+        notebook = getattr(self, "recommend_notebook", None)
+        if notebook is not None:
+            selected = notebook.select()
+            for tree in self.lane_recommend_trees.values():
+                if str(tree.master) == selected:
+                    return tree
+        return self.recommend_tree
+
     def ignore_selected_recommendations(self):
         if self.ignore_tab:
-            selection = self.recommend_tree.selection()
-            self.ignore_tab.ignore_selected_recommendations(selection)
+            tree = self._active_recommend_tree()
+            self.ignore_tab.ignore_selected_recommendations(tree.selection(), tree)
 
     def persist_ignored_champions(self):
         canonical_names = []
@@ -1709,9 +2121,7 @@ class ChampionScraperApp:
             self.counter_synergy_tab.update_GUI()
             self.counter_synergy_tab.update_synergy_GUI()
 
-        self.recommend_counter_cache.clear()
-        
-        self.update_banpick_recommendations()
+        self.schedule_recompute()
         if self.op_duos_tab:
             self.op_duos_tab.populate_synergy_highlights()
         if self.ignore_tab:
@@ -1741,7 +2151,7 @@ class ChampionScraperApp:
 
             # Exclude Checkbox
             exclude_var = tk.BooleanVar(value=False)
-            exclude_var.trace_add("write", lambda *args: (self.update_banpick_recommendations(), self.update_team_total_scores()))
+            exclude_var.trace_add("write", lambda *args: self.schedule_recompute())
             exclude_check = tk.Checkbutton(
                 slot_frame,
                 text="데이터 제외",
@@ -1787,7 +2197,6 @@ class ChampionScraperApp:
                 "counter_dataset": None,
                 "last_lane_value": None,
                 "last_lane": None,
-                "score_details": None  # 점수 계산 상세 정보
             }
 
             search_button.configure(command=lambda s=slot: self.perform_banpick_search(s))
@@ -1880,10 +2289,10 @@ class ChampionScraperApp:
             self.client_watcher.stop()
         self._set_client_status("클라이언트 연동 꺼짐")
 
-    def handle_client_snapshot(self, snapshot, _message=None):
+    def handle_client_snapshot(self, snapshot, _message=None, diff=None):
         if not snapshot:
             return
-        self.root.after(0, lambda: self._apply_snapshot_and_status(snapshot))
+        self.root.after(0, lambda: self._apply_snapshot_and_status(snapshot, diff))
 
     def handle_client_status(self, message):
         self.root.after(0, lambda: self._set_client_status(message))
@@ -1908,8 +2317,8 @@ class ChampionScraperApp:
         except Exception as e:
             messagebox.showerror("Error", f"스냅샷 저장 실패: {e}")
 
-    def _apply_snapshot_and_status(self, snapshot):
-        changed = self._apply_client_snapshot(snapshot)
+    def _apply_snapshot_and_status(self, snapshot, diff=None):
+        changed = self._apply_client_snapshot(snapshot, diff)
         phase = snapshot.get("phase")
         
         # 자동 동기화 상태에서도 phase가 없을 때 메시지 구체화
@@ -1923,26 +2332,89 @@ class ChampionScraperApp:
             else:
                 phase = "알 수 없음"
                 
+        # phase가 넘어간 변경 내역은 슬롯이 그대로여도 새 phase를 표시
+        phase_advanced = diff is not None and not diff.full and diff.phase_changed()
         status = f"{phase} - 자동 동기화"
-        if not changed:
+        if not changed and not phase_advanced:
             status = f"{phase} - 업데이트 없음"
         self._set_client_status(status)
 
-    def _apply_client_snapshot(self, snapshot):
-        allies = self._normalize_client_entries(snapshot.get("allies", []))
-        enemies = self._normalize_client_entries(snapshot.get("enemies", []))
+    def _apply_client_snapshot(self, snapshot, diff=None):
+        """
+        클라이언트 스냅샷을 슬롯/밴에 반영합니다.
+        diff(watcher의 SnapshotDiff)가 있으면 바뀐 슬롯과 밴만 반영하고 재계산은 예약(schedule_recompute)에 맡기며,
+        없거나 전체 반영(full)이면 (수동 불러오기, 동기화 시작) 전체를 반영합니다.
+        """
+        incremental = diff is not None and not diff.full
         changed = False
-        changed |= self._populate_side_from_client("allies", allies)
-        changed |= self._populate_side_from_client("enemies", enemies)
+        for side_key in ("allies", "enemies"):
+            if incremental:
+                changed |= self._apply_client_side_diff(side_key, snapshot, diff.slot_changes(side_key))
+            else:
+                entries = self._normalize_client_entries(snapshot.get(side_key, []))
+                changed |= self._populate_side_from_client(side_key, entries)
 
         # 밴 정보 업데이트
-        self._update_banned_champions_from_snapshot(snapshot)
+        previous_bans = set(getattr(self, "banned_champions", set()))
+        if diff is None or diff.bans_changed():
+            self._update_banned_champions_from_snapshot(snapshot)
 
-        if changed:
+        if changed and not incremental:
+            # 슬롯 입력으로 예약된 재계산을 스냅샷 끝에서 한 번에 처리
             self.update_banpick_recommendations()
+        elif changed or self.banned_champions != previous_bans:
+            # 변경 내역은 바뀐 슬롯만 예약된 재계산에서 다시 점수를 매김
+            self.schedule_recompute()
         self.last_client_snapshot = snapshot
         return changed
 
+    def _apply_client_side_diff(self, side_key, snapshot, changes):
+        """
+        한 진영의 슬롯 변경을 반영합니다.
+        기존 슬롯(cellId)의 픽/호버, 라인 변경은 그 슬롯만 다시 채우고 (슬롯 검색이 재계산을 예약),
+        슬롯 구성/순서가 바뀌었거나 cellId에 맞는 슬롯이 없으면 진영 전체를 다시 배치합니다.
+        """
+        if not changes:
+            return False
+        slot_by_cell = {
+            slot["client_cell_id"]: slot
+            for slot in self.banpick_slots.get(side_key, [])
+            if slot.get("client_cell_id") is not None
+        }
+        entries = snapshot.get(side_key, [])
+        if any(change.kind == CHANGE_ORDER or change.slot not in slot_by_cell for change in changes):
+            return self._populate_side_from_client(side_key, self._normalize_client_entries(entries))
+
+        entry_by_cell = {entry.get("cellId"): entry for entry in entries}
+        changed = False
+        for cell_id in dict.fromkeys(change.slot for change in changes):
+            slot = slot_by_cell[cell_id]
+            entry = self._normalize_client_entries([entry_by_cell[cell_id]])[0]
+            if not entry.get("assignedPosition"):
+                self._assign_client_slot_lane(side_key, slot, entry)
+            # 라인만 바뀐 경우도 같은 챔피언 그대로 라인을 다시 반영
+            changed |= self._populate_slot_from_client(slot, entry, force=True)
+        return changed
+
+    def _assign_client_slot_lane(self, side_key, slot, entry):
+        """포지션 정보가 없는 슬롯 하나의 라인: 진영의 다른 클라이언트 슬롯이 쓰는 라인을 뺀 나머지 중 판수가 가장 많은 라인."""
+        if not self.data_store.is_ready:
+            self._deferred_client_lane_sides.add(side_key)
+            return
+        used_lanes = set()
+        for other_slot in self.banpick_slots.get(side_key, []):
+            if other_slot is slot or other_slot.get("client_cell_id") is None:
+                continue
+            lane_box = other_slot.get("lane")
+            lane_value = lane_box.get().lower() if lane_box else ""
+            if lane_value in LANES:
+                used_lanes.add(lane_value)
+        available_lanes = [lane for lane in LANES if lane not in used_lanes]
+        name = entry.get("canonical") or entry.get("display")
+        lane = assign_lanes([(0, self._get_champion_lane_pick_rates(name))], available_lanes).get(0)
+        if lane:
+            entry["assignedPosition"] = lane
+
     def _normalize_client_entries(self, entries):
         normalized_entries = []
         for entry in entries:
@@ -1982,21 +2454,9 @@ class ChampionScraperApp:
             self._update_ban_labels([], [])
             return
 
-        def _extract_ids(snapshot_dict, primary_key: str, fallback_key: str) -> list[int]:
-            """allyBans/enemyBans → 없으면 bans.myTeamBans/theirTeamBans 순으로 ID 리스트 추출."""
-            ids = snapshot_dict.get(primary_key)
-            if not isinstance(ids, list):
-                ids = []
-                bans_struct = snapshot_dict.get("bans")
-                if isinstance(bans_struct, dict):
-                    raw_ids = bans_struct.get(fallback_key) or []
-                    if isinstance(raw_ids, list):
-                        ids = raw_ids
-            # 정수 ID만 필터링
-            return [cid for cid in ids if isinstance(cid, int) and cid > 0]
-
-        ally_ids = _extract_ids(snapshot, "allyBans", "myTeamBans")
-        enemy_ids = _extract_ids(snapshot, "enemyBans", "theirTeamBans")
+        # allyBans/enemyBans → 없으면 bans.myTeamBans/theirTeamBans
+        ally_ids = ban_ids(snapshot, "allies")
+        enemy_ids = ban_ids(snapshot, "enemies")
 
         if not ally_ids and not enemy_ids:
             self.banned_champions = set()
@@ -2066,163 +2526,44 @@ class ChampionScraperApp:
         if not full_name:
             return {}
             
-        pick_rates = {}
-        
-        for lane in LANES:
-            data_filename = f"{full_name}_{lane}.json".replace(" ", "_")
-            filename = resolve_resource_path("data", data_filename)
-            
-            try:
-                with open(filename, "r", encoding="utf-8") as file:
-                    raw_data = json.load(file)
-                    
-                    # Get games count from counters -> [lane]
-                    # We use the same lane key to avoid double counting
-                    counters = raw_data.get("counters", {})
-                    lane_data = counters.get(lane, {})
-                    
-                    total_games = 0
-                    for enemy_data in lane_data.values():
-                        games_str = enemy_data.get("games", "0")
-                        games = int(str(games_str).replace(",", ""))
-                        total_games += games
-                        
-                    if total_games > 0:
-                        pick_rates[lane] = total_games
-                        
-            except (FileNotFoundError, json.JSONDecodeError, OSError, ValueError):
-                continue
-                
-        return pick_rates
+        catalog = self._lane_data_catalog()
+        if catalog is None:
+            return {}
+        # 로딩 시 계산해 둔 챔피언×라인 판수 (같은 라인 상대와의 games 합)
+        games = catalog.pick_games(catalog.tensor.champion_id(full_name))
+        return {lane: games[LANE_INDEX[lane]] for lane in LANES if games[LANE_INDEX[lane]]}
 
     def _resolve_lane_conflicts_by_pick_rate(self, side_key, entries):
         """
         Resolve lane conflicts using pick rate data.
-        Uses optimal matching algorithm to maximize total pick rate sum.
+        Assigns the remaining lanes with a min-cost assignment (Hungarian) that maximizes total pick rate sum.
         """
         # Only process if any entry is missing assignedPosition
         if all(e.get("assignedPosition") for e in entries):
             return entries
 
-        # Separate entries with and without assigned positions
-        fixed_assignments = {}  # {index: lane}
-        unassigned_champions = []  # [(index, entry, rates)]
-        
+        # 데이터 로딩 중에는 배정하지 않고, 로딩이 끝나면 이 진영을 다시 반영
+        if not self.data_store.is_ready:
+            self._deferred_client_lane_sides.add(side_key)
+            return entries
+
+        # Entries with a valid position are fixed; the rest are assigned below
+        fixed_lanes = set()
+        unassigned = []  # [(index, rates)]
         for i, entry in enumerate(entries):
-            name = entry.get("canonical") or entry.get("display")
-            rates = self._get_champion_lane_pick_rates(name)
             current_pos = entry.get("assignedPosition")
-            
-            # If entry already has a valid position, fix it
             if current_pos and current_pos.lower() in LANES:
-                fixed_assignments[i] = current_pos.lower()
+                fixed_lanes.add(current_pos.lower())
             else:
-                unassigned_champions.append({
-                    "index": i,
-                    "entry": entry,
-                    "rates": rates
-                })
-        
-        # If all are fixed, return early
-        if not unassigned_champions:
-            return entries
-        
-        # Get fixed lanes to avoid conflicts
-        fixed_lanes = set(fixed_assignments.values())
-        available_lanes = set(LANES) - fixed_lanes
-        
-        # If no available lanes, can't assign anything
-        if not available_lanes:
-            return entries
-        
-        # Find optimal assignment for unassigned champions using backtracking
-        best_assignment = {}
-        best_score = -1
-        
-        def backtrack(champion_idx, used_lanes, current_score):
-            nonlocal best_assignment, best_score
-            
-            if champion_idx >= len(unassigned_champions):
-                # All champions assigned, check if this is better
-                if current_score > best_score:
-                    best_score = current_score
-                    best_assignment = used_lanes.copy()
-                return
-            
-            champ = unassigned_champions[champion_idx]
-            champ_index = champ["index"]
-            rates = champ["rates"]
-            
-            # Get possible lanes for this champion (lanes with pick rate > 0)
-            possible_lanes = [lane for lane in available_lanes if rates.get(lane, 0) > 0]
-            
-            # If no rates available, try all available lanes
-            if not rates:
-                possible_lanes = list(available_lanes)
-            
-            # Try each possible lane for this champion
-            for lane in possible_lanes:
-                if lane in used_lanes.values():
-                    continue  # Lane already used
-                
-                # Get pick rate for this lane
-                pick_rate = rates.get(lane, 0)
-                
-                used_lanes[champ_index] = lane
-                backtrack(champion_idx + 1, used_lanes, current_score + pick_rate)
-                del used_lanes[champ_index]
-            
-            # Also try not assigning this champion (if it has no valid rates or all lanes are taken)
-            if not possible_lanes:
-                backtrack(champion_idx + 1, used_lanes, current_score)
-        
-        # Start backtracking
-        backtrack(0, {}, 0)
-        
-        # Apply the best assignment found
-        for champ_index, lane in best_assignment.items():
-            entries[champ_index]["assignedPosition"] = lane
-        
-        # If some champions weren't assigned, try greedy fallback for remaining
-        remaining_champions = [
-            champ for champ in unassigned_champions 
-            if champ["index"] not in best_assignment
-        ]
-        remaining_lanes = available_lanes - set(best_assignment.values())
-        
-        if remaining_champions and remaining_lanes:
-            # Greedy assignment for remaining
-            remaining_assignments = []
-            for champ in remaining_champions:
-                rates = champ["rates"]
-                for lane in remaining_lanes:
-                    if lane in rates:
-                        remaining_assignments.append({
-                            "index": champ["index"],
-                            "lane": lane,
-                            "count": rates[lane]
-                        })
-            
-            remaining_assignments.sort(key=lambda x: x["count"], reverse=True)
-            used_lanes = set(best_assignment.values())
-            assigned_champions = set(best_assignment.keys())
-            
-            for assign in remaining_assignments:
-                idx = assign["index"]
-                lane = assign["lane"]
-                
-                if idx in assigned_champions:
-                    continue
-                if lane in used_lanes:
-                    continue
-                
-                entries[idx]["assignedPosition"] = lane
-                assigned_champions.add(idx)
-                used_lanes.add(lane)
-            
+                name = entry.get("canonical") or entry.get("display")
+                unassigned.append((i, self._get_champion_lane_pick_rates(name)))
+
+        available_lanes = [lane for lane in LANES if lane not in fixed_lanes]
+        for index, lane in assign_lanes(unassigned, available_lanes).items():
+            entries[index]["assignedPosition"] = lane
         return entries
 
-    def _populate_side_from_client(self, side_key, entries, sort_by_lane=True):
+    def _populate_side_from_client(self, side_key, entries, sort_by_lane=True, force=False):
         # Apply fallback logic for both allies and enemies if needed (e.g. custom games)
         entries = self._resolve_lane_conflicts_by_pick_rate(side_key, entries)
 
@@ -2251,12 +2592,15 @@ class ChampionScraperApp:
         changed = False
         for idx, slot in enumerate(slots):
             if idx < len(entries):
-                changed |= self._populate_slot_from_client(slot, entries[idx])
+                # watcher 변경 내역을 슬롯 단위로 반영할 때 cellId로 슬롯을 찾음
+                slot["client_cell_id"] = entries[idx].get("cellId")
+                changed |= self._populate_slot_from_client(slot, entries[idx], force=force)
             else:
+                slot["client_cell_id"] = None
                 changed |= self._clear_slot_from_client(slot)
         return changed
 
-    def _populate_slot_from_client(self, slot, entry):
+    def _populate_slot_from_client(self, slot, entry, force=False):
         normalized = entry.get("normalized")
         canonical = entry.get("canonical")
         display = entry.get("display")
@@ -2276,7 +2620,8 @@ class ChampionScraperApp:
                     if lane_value in LANES:
                         self.my_lane_var.set(lane_value)
         
-        if slot_canonical and normalized and slot_canonical.lower() == normalized:
+        # force: 같은 챔피언이어도 라인을 다시 반영 (로딩 후 미뤄 둔 라인 배정)
+        if not force and slot_canonical and normalized and slot_canonical.lower() == normalized:
             slot["client_last_champion"] = normalized
             return False
         
@@ -2394,12 +2739,12 @@ class ChampionScraperApp:
         self._update_slot_lane_cache(slot, new_value)
         new_lane = slot.get("last_lane")
         if not new_lane:
-            self.update_banpick_recommendations()
+            self.schedule_recompute()
             return
 
         side_key = slot.get("side")
         if not side_key or side_key not in self.banpick_slots:
-            self.update_banpick_recommendations()
+            self.schedule_recompute()
             return
 
         swap_target = None
@@ -2426,7 +2771,7 @@ class ChampionScraperApp:
                 self._update_slot_lane_cache(swap_target, previous_value)
             # Note: my_lane_var doesn't need to be swapped because it's lane-based, not slot-based
 
-        self.update_banpick_recommendations()
+        self.schedule_recompute()
 
     def clear_banpick_slot(self, slot, reset_lane=False, suppress_update=False):
         if not slot:
@@ -2460,10 +2805,7 @@ class ChampionScraperApp:
             manual_var.set(False)
         
         if not suppress_update:
-            self.update_banpick_recommendations()
-            self.update_team_total_scores()
-            # 모든 슬롯의 점수 표시 업데이트
-            self._update_all_slot_scores()
+            self.schedule_recompute()
 
     def get_autocomplete_candidates(self):
         return self.autocomplete_candidates
@@ -2528,6 +2870,9 @@ class ChampionScraperApp:
                 best_lane = self._find_best_lane_by_counters(full_name)
                 if best_lane:
                     target_lane = best_lane
+                elif not self.data_store.is_ready:
+                    # 로딩이 끝나면 라인 감지를 다시 실행 (_run_deferred_lane_assignment)
+                    slot["lane_detection_deferred"] = True
         
         # If we still don't have a valid target lane (e.g. manual trigger but invalid lane, though caught above),
         # or auto trigger failed to find best lane, ensure we have something valid or fallback
@@ -2536,6 +2881,8 @@ class ChampionScraperApp:
              best_lane = self._find_best_lane_by_counters(full_name)
              if best_lane:
                  target_lane = best_lane
+             elif not self.data_store.is_ready:
+                 slot["lane_detection_deferred"] = True
 
         # Load datasets and capture the actual lane found
         synergy_dataset, synergy_lane, _ = self._load_lane_dataset(
@@ -2607,17 +2954,14 @@ class ChampionScraperApp:
         slot["synergy_dataset"] = synergy_dataset
         slot["counter_dataset"] = counter_dataset
         
-        # 모든 슬롯의 점수 재계산 (새 챔피언이 등록되면 다른 슬롯의 점수도 변경될 수 있음)
-        self._update_all_slot_scores()
-
         if not auto_trigger:
             entry_widget.delete(0, tk.END)
 
-        self.update_banpick_recommendations()
-        self.update_team_total_scores()
+        # 모든 슬롯의 점수/추천 재계산 (새 챔피언이 등록되면 다른 슬롯의 점수도 변경될 수 있음)
+        self.schedule_recompute()
         return True
     
-    def _update_slot_score_display(self, slot):
+    def _update_slot_score_display(self, slot, draft=None):
         """슬롯의 점수를 계산하고 표시를 업데이트합니다"""
         result_var = slot.get("result_var")
         result_label = slot.get("result_label")
@@ -2629,16 +2973,14 @@ class ChampionScraperApp:
         
         if not display_name or not selected_lane:
             result_var.set("검색 결과 없음")
-            slot["score_details"] = None
             if result_label:
                 # 테마에 맞는 텍스트 색상 사용
                 fg_color = self.current_theme.get("fg_color", "#111111")
                 result_label.config(fg=fg_color)
             return
         
-        # 점수 계산 및 상세 정보 수집
-        score, details = self.calculate_champion_score_with_details(slot)
-        slot["score_details"] = details
+        # 점수 계산 (상세 정보는 엔진 캐시에 남아 툴팁에서 다시 읽음)
+        score = self.calculate_champion_score(slot, draft=draft)
         
         # 점수에 따른 이모지와 색상 결정
         if score > 102:
@@ -2655,11 +2997,14 @@ class ChampionScraperApp:
         if result_label:
             result_label.config(fg=color)
     
-    def _update_all_slot_scores(self):
+    def _update_all_slot_scores(self, draft=None):
         """모든 슬롯의 점수 표시를 업데이트합니다"""
-        for side_key in ["allies", "enemies"]:
+        if draft is None:
+            draft = self.snapshot_draft_state()
+        self.last_draft_state = draft
+        for side_key in SIDE_KEYS:
             for slot in self.banpick_slots.get(side_key, []):
-                self._update_slot_score_display(slot)
+                self._update_slot_score_display(slot, draft)
 
     def _check_champion_data_exists(self, champion_name, lane):
         """
@@ -2667,285 +3012,31 @@ class ChampionScraperApp:
         """
         if not champion_name or not lane:
             return False
-            
-        full_name = self.resolve_champion_name(champion_name)
-        if not full_name:
-            return False
-            
-        data_filename = f"{full_name.lower()}_{lane.lower()}.json".replace(" ", "_")
-        filename = resolve_resource_path("data", data_filename)
-        return os.path.exists(filename)
+        champion_id = self.champion_id_for_name(champion_name)
+        return self.data_catalog.has_file(champion_id, LANE_INDEX.get(lane.lower()))
 
-    def calculate_champion_score(self, champion_slot, target_lane=None):
-        score, _ = self.calculate_champion_score_with_details(champion_slot, target_lane)
+    def calculate_champion_score(self, champion_slot, target_lane=None, draft=None):
+        score, _ = self.calculate_champion_score_with_details(champion_slot, target_lane, draft)
         return score
 
-    def calculate_champion_score_with_details(self, champion_slot, target_lane=None):
-        """점수 계산과 상세 정보를 함께 반환합니다"""
-        details = {
-            "synergy_entries": [],  # [(champion_name, lane, win_rate, weight, weighted_score)]
-            "counter_entries": [],  # [(champion_name, lane, win_rate, counter_score, weight, weighted_score)]
-            "excluded_synergy": [], # [(champion_name, lane, games, pick_rate, win_rate)]
-            "excluded_counter": [], # [(champion_name, lane, games, pick_rate, win_rate)]
-            "synergy_score": 0.0,
-            "counter_score": 0.0,
-            "synergy_weight_sum": 0.0,
-            "counter_weight_sum": 0.0,
-            "total_score": 0.0
-        }
-        
-        if not champion_slot.get("canonical_name") or not champion_slot.get("selected_lane"):
-            return 0.0, details
-        
-        if champion_slot.get("exclude_var") and champion_slot["exclude_var"].get():
-            return 0.0, details
-        
-        side_key = champion_slot.get("side")
-        opponent_side = "enemies" if side_key == "allies" else "allies"
-        champion_lane = target_lane if target_lane else champion_slot.get("selected_lane")
-        slot_champion_canonical = champion_slot.get("canonical_name", "")
-        
-        if not self._check_champion_data_exists(champion_slot.get("canonical_name"), champion_lane):
-            return 0.0, details
-        
-        synergy_sum = 0.0
-        synergy_weight_sum = 0.0  # 가중치 합 (정규화용)
-        counter_sum = 0.0
-        counter_weight_sum = 0.0  # 가중치 합 (정규화용)
-        
-        min_games = self.parse_int(self.recommend_min_games_entry.get()) if hasattr(self, "recommend_min_games_entry") else BANPICK_MIN_GAMES_DEFAULT
-        if min_games < 0:
-            min_games = 0
-        
-        pick_rate_override = (
-            self.parse_float(self.recommend_pick_rate_entry.get())
-            if hasattr(self, "recommend_pick_rate_entry") else BANPICK_PICK_RATE_OVERRIDE
-        )
-        if pick_rate_override < 0:
-            pick_rate_override = 0.0
-        
-        # 시너지 점수 계산 (같은 팀)
-        for friend in self.banpick_slots.get(side_key, []):
-            if friend is champion_slot:
-                continue
-            if friend.get("exclude_var") and friend["exclude_var"].get():
-                continue
-                
-            source_lane = friend.get("selected_lane")
-            friend_name = friend.get("display_name") or friend.get("canonical_name") or "Unknown"
-            friend_canonical = friend.get("canonical_name")
-
-            # 1. Look for ME in Friend's Dataset
-            entry_a = None
-            dataset_a = friend.get("synergy_dataset")
-            if dataset_a:
-                lane_entries = dataset_a.get(champion_lane, {})
-                # Normalize lookup - loop or direct? Loop is safer for resolving names matches
-                # But optimizing: Try resolve_champion_name match
-                for name, data in lane_entries.items():
-                    if self.resolve_champion_name(name) == slot_champion_canonical:
-                        entry_a = data
-                        break
-            
-            # 2. Look for Friend in MY Dataset
-            entry_b = None
-            dataset_b = champion_slot.get("synergy_dataset")
-            if dataset_b and friend_canonical:
-                lane_entries = dataset_b.get(source_lane, {})
-                for name, data in lane_entries.items():
-                    if self.resolve_champion_name(name) == friend_canonical:
-                        entry_b = data
-                        break
-            
-            # Select Best Entry
-            # Criteria: Meets requirements? Higher games?
-            selected_entry = None
-            is_valid_a = False
-            is_valid_b = False
-            
-            if entry_a:
-                games_a = self.parse_int(entry_a.get("games"))
-                pick_rate_a = self.parse_float(entry_a.get("pick_rate") or entry_a.get("popularity"))
-                is_valid_a = (games_a >= min_games) or (pick_rate_a >= pick_rate_override)
-            
-            if entry_b:
-                games_b = self.parse_int(entry_b.get("games"))
-                pick_rate_b = self.parse_float(entry_b.get("pick_rate") or entry_b.get("popularity"))
-                is_valid_b = (games_b >= min_games) or (pick_rate_b >= pick_rate_override)
-            
-            use_source = None # 'a' or 'b'
-            if is_valid_a and is_valid_b:
-                # Both valid, pick higher games
-                use_source = 'a' if self.parse_int(entry_a.get("games")) >= self.parse_int(entry_b.get("games")) else 'b'
-            elif is_valid_a:
-                use_source = 'a'
-            elif is_valid_b:
-                use_source = 'b'
-            elif entry_a: # Both invalid, but A exists (prefer A for consistency if both fail)
-                use_source = 'a'
-            elif entry_b:
-                use_source = 'b'
-            
-            final_entry = None
-            if use_source == 'a':
-                final_entry = entry_a
-            elif use_source == 'b':
-                final_entry = entry_b
-            
-            if not final_entry:
-                continue
-
-            # Process Final Entry
-            games = self.parse_int(final_entry.get("games"))
-            pick_rate = self.parse_float(final_entry.get("pick_rate") or final_entry.get("popularity"))
-            win_rate = self.parse_float(final_entry.get("win_rate"))
-            
-            # Check requirements again (for exclusion list)
-            is_valid = (games >= min_games) or (pick_rate >= pick_rate_override)
-            
-            if not is_valid:
-                details["excluded_synergy"].append((friend_name, source_lane, games, pick_rate, win_rate))
-                continue
-
-            weight = self.get_lane_weight(champion_lane, source_lane, "synergy")
-            if weight <= 0:
-                continue
-            
-            weighted_score = win_rate * weight
-            synergy_sum += weighted_score
-            synergy_weight_sum += weight
-            details["synergy_entries"].append((friend_name, source_lane, win_rate, weight, weighted_score))
-
-        # 카운터 점수 계산 (상대팀)
-        for enemy in self.banpick_slots.get(opponent_side, []):
-            if enemy.get("exclude_var") and enemy["exclude_var"].get():
-                continue
-            
-            source_lane = enemy.get("selected_lane")
-            enemy_name = enemy.get("display_name") or enemy.get("canonical_name") or "Unknown"
-            enemy_canonical = enemy.get("canonical_name")
-
-            # 1. Look for ME in Enemy's Dataset (Enemy vs Me)
-            entry_a = None
-            dataset_a = enemy.get("counter_dataset")
-            if dataset_a:
-                lane_entries = dataset_a.get(champion_lane, {})
-                for name, data in lane_entries.items():
-                    if self.resolve_champion_name(name) == slot_champion_canonical:
-                        entry_a = data
-                        break
-
-            # 2. Look for Enemy in MY Dataset (Me vs Enemy)
-            entry_b = None
-            dataset_b = champion_slot.get("counter_dataset")
-            if dataset_b and enemy_canonical:
-                lane_entries = dataset_b.get(source_lane, {})
-                for name, data in lane_entries.items():
-                    if self.resolve_champion_name(name) == enemy_canonical:
-                        entry_b = data
-                        break
-
-            # Select Best
-            selected_entry = None
-            is_valid_a = False
-            is_valid_b = False
-            
-            if entry_a:
-                games_a = self.parse_int(entry_a.get("games"))
-                pick_rate_a = self.parse_float(entry_a.get("pick_rate") or entry_a.get("popularity"))
-                is_valid_a = (games_a >= min_games) or (pick_rate_a >= pick_rate_override)
-            
-            if entry_b:
-                games_b = self.parse_int(entry_b.get("games"))
-                pick_rate_b = self.parse_float(entry_b.get("pick_rate") or entry_b.get("popularity"))
-                is_valid_b = (games_b >= min_games) or (pick_rate_b >= pick_rate_override)
-            
-            use_source = None
-            if is_valid_a and is_valid_b:
-                use_source = 'a' if self.parse_int(entry_a.get("games")) >= self.parse_int(entry_b.get("games")) else 'b'
-            elif is_valid_a:
-                use_source = 'a'
-            elif is_valid_b:
-                use_source = 'b'
-            elif entry_a:
-                use_source = 'a'
-            elif entry_b:
-                use_source = 'b'
-            
-            final_entry = None
-            is_inverted = False # True if using 'a' (Enemy vs Me), False if 'b' (Me vs Enemy)
-            
-            if use_source == 'a':
-                final_entry = entry_a
-                is_inverted = True # entry from enemy perspective
-            elif use_source == 'b':
-                final_entry = entry_b
-                is_inverted = False # entry from my perspective
-            
-            if not final_entry:
-                continue
-                
-            games = self.parse_int(final_entry.get("games"))
-            pick_rate = self.parse_float(final_entry.get("pick_rate") or final_entry.get("popularity"))
-            win_rate_raw = self.parse_float(final_entry.get("win_rate"))
-            
-            # Counter logic: If inverted (Enemy vs Me), My Win Rate = 100 - EnemyWinRate
-            # If not inverted (Me vs Enemy), My Win Rate = Raw WinRate
-            # Wait. "Counter Score" usually wants "How much do I counter them?".
-            # If win_rate_raw is "Me vs Enemy" (e.g. 52%), then Counter Value is usually defined as (WinRate - 50)?
-            # Or in this app: `100 - win_rate_value` (line 2312 of original) was used when source was Enemy (Enemy vs Me).
-            # If Enemy vs Me is 48% -> My Win Rate is 52%. Score is 52.
-            # So: if is_inverted (Enemy's data), Score = 100 - win_rate_raw.
-            #     if not inverted (My data), Score = win_rate_raw.
-            
-            if is_inverted:
-                my_win_rate = 100.0 - win_rate_raw
-            else:
-                my_win_rate = win_rate_raw
-
-            is_valid = (games >= min_games) or (pick_rate >= pick_rate_override)
-            
-            if not is_valid:
-                # For display, we might want to show the 'my_win_rate' equivalent
-                details["excluded_counter"].append((enemy_name, source_lane, games, pick_rate, my_win_rate))
-                continue
-            
-            weight = self.get_lane_weight(champion_lane, source_lane, "counter")
-            if weight <= 0:
-                continue
-                
-            # Counter Score Logic:
-            # Often apps measure "Counter" as "Advantage". 
-            # If My Win Rate is 55%, advantage is +5%.
-            # The original code did `weighted_score = counter_value * weight` where counter_value = 100 - enemy_win_rate.
-            # So it's just My Win Rate.
-            
-            weighted_score = my_win_rate * weight
-            counter_sum += weighted_score
-            counter_weight_sum += weight
-            details["counter_entries"].append((enemy_name, source_lane, win_rate_raw, my_win_rate, weight, weighted_score))
-        
-        # 가중치 합으로 나눠서 정규화 (라인 간 비교 가능하게)
-        synergy_score = synergy_sum / synergy_weight_sum if synergy_weight_sum > 0 else 0.0
-        counter_score = counter_sum / counter_weight_sum if counter_weight_sum > 0 else 0.0
-        total_score = synergy_score + counter_score
-        
-        details["synergy_score"] = synergy_score
-        details["counter_score"] = counter_score
-        details["synergy_weight_sum"] = synergy_weight_sum
-        details["counter_weight_sum"] = counter_weight_sum
-        details["total_score"] = total_score
-        
-        return total_score, details
+    def calculate_champion_score_with_details(self, champion_slot, target_lane=None, draft=None):
+        """점수 계산과 상세 정보를 함께 반환합니다 (계산은 ScoringEngine이 담당)"""
+        if draft is None:
+            draft = self.snapshot_draft_state()
+        slot_state = self._slot_state_for(draft, champion_slot)
+        if slot_state is None:
+            return 0.0, empty_score_details()
+        return self.scoring_engine.score_slot(draft, slot_state, target_lane)
     
     def _get_score_tooltip_text(self, slot):
         """슬롯의 점수 상세 정보를 툴팁 텍스트로 포맷팅합니다"""
-        details = slot.get("score_details")
-        if not details:
+        display_name = slot.get("display_name")
+        selected_lane = slot.get("selected_lane")
+        draft = self.last_draft_state
+        if not display_name or not selected_lane or draft is None:
             return None
-        
-        display_name = slot.get("display_name", "Unknown")
-        selected_lane = slot.get("selected_lane", "?")
+        # 마지막 재계산의 draft 상태로 엔진 캐시에서 읽음 (다시 계산하지 않음)
+        _score, details = self.calculate_champion_score_with_details(slot, draft=draft)
         
         lines = []
         lines.append(f"=== {display_name} ({selected_lane}) 점수 상세 ===")
@@ -3000,29 +3091,17 @@ class ChampionScraperApp:
         
         return "\n".join(lines)
 
-    def update_team_total_scores(self):
+    def update_team_total_scores(self, draft=None):
         """우리팀과 상대팀의 총 조합 점수를 업데이트합니다"""
         if not hasattr(self, "team_total_labels"):
             return
 
         # 팀별 유효 슬롯(점수 > 0) 기준으로 "모든 슬롯이 채워졌는지" 판단
-        def _team_stats(side_key: str):
-            slots = self.banpick_slots.get(side_key, [])
-            total = 0.0
-            valid_scores: list[float] = []
-            for slot in slots:
-                if slot.get("canonical_name") and slot.get("selected_lane"):
-                    score = self.calculate_champion_score(slot)
-                    if score > 0:
-                        total += score
-                        valid_scores.append(score)
-            # 5개 슬롯 모두 유효 점수(>0)를 가진 경우에만 완성 상태로 간주
-            is_complete = len(slots) == 5 and len(valid_scores) == 5
-            avg = total / len(valid_scores) if is_complete and valid_scores else 0.0
-            return total, avg, is_complete
-
-        _allies_total, allies_avg, allies_complete = _team_stats("allies")
-        _enemies_total, enemies_avg, enemies_complete = _team_stats("enemies")
+        if draft is None:
+            draft = self.snapshot_draft_state()
+        engine = self.scoring_engine
+        _allies_total, allies_avg, allies_complete = engine.team_stats(draft, "allies")
+        _enemies_total, enemies_avg, enemies_complete = engine.team_stats(draft, "enemies")
 
         # 예상 승률 계산: 두 팀 모두 완성되었을 때만 계산
         # 50% + (우리팀 점수 - 상대팀 점수) / 2, 범위 제한: 5% ~ 95%
@@ -3068,382 +3147,111 @@ class ChampionScraperApp:
                 default_color = self.current_theme.get("score_default", "blue")
                 enemies_label.config(text="조합 점수: -", fg=default_color)
 
+    def schedule_recompute(self):
+        """
+        추천 목록/조합 점수/슬롯 점수 재계산을 예약합니다.
+
+        슬롯 입력, 라인 변경, 밴/무시 목록, 가중치 변경은 모두 이 함수로 무효화만 표시하고,
+        실제 계산은 Tk idle 시점(after_idle)에 한 번만 수행합니다.
+        이미 예약된 계산이 있으면 거기에 합쳐지고 recompute_skipped_count가 증가합니다.
+        """
+        if self._recompute_pending:
+            self.recompute_skipped_count += 1
+            return
+        self._recompute_pending = True
+        self.root.after_idle(self._run_scheduled_recompute)
+
+    def _run_scheduled_recompute(self):
+        # 그 사이 update_banpick_recommendations가 직접 호출되어 이미 처리됨
+        if not self._recompute_pending:
+            return
+        self._recompute_pending = False
+        self.update_banpick_recommendations()
+
     def update_banpick_recommendations(self):
+        """
+        추천 목록, 팀 조합 점수, 슬롯 점수를 한 번에 다시 계산합니다.
+        예약된 재계산(schedule_recompute)이 있으면 여기서 함께 처리됩니다.
+        """
+        if self._recompute_pending:
+            self._recompute_pending = False
+            self.recompute_skipped_count += 1
         tree = getattr(self, "recommend_tree", None)
         if not tree:
             return
+
+        # 위젯 상태는 여기서 한 번만 읽고, 계산은 엔진에서 처리
+        draft = self.snapshot_draft_state()
+        # 밴픽 상태가 바뀌면 첫 페이지부터 표시
+        self.recommend_page = 0
+        self._render_recommendations(tree, draft)
+        self._render_lane_recommendations(draft)
+        self._render_ban_threats(draft)
+        # 총 조합 점수 업데이트
+        self.update_team_total_scores(draft)
+        # 모든 슬롯의 점수 표시 업데이트
+        self._update_all_slot_scores(draft)
+
+    def _render_recommendations(self, tree, draft):
+        """현재 페이지의 추천 행만 만들어 recommend_tree에 넣습니다."""
         for item in tree.get_children():
             tree.delete(item)
-
-        my_lane = self.my_lane_var.get()
-        if not my_lane or my_lane not in LANES:
+        engine = self.scoring_engine
+        page_size = self._get_recommend_page_size()
+        recommendations, candidate_count = [], 0
+        if draft.my_lane in LANES and engine.target_slot(draft) is not None:
+            recommendations, candidate_count = engine.recommend_page(draft, self.recommend_page * page_size, page_size)
+            if not recommendations and candidate_count:
+                # 후보 수가 줄어 현재 페이지가 비면 마지막 페이지로
+                self.recommend_page = (candidate_count - 1) // page_size
+                recommendations, candidate_count = engine.recommend_page(draft, self.recommend_page * page_size, page_size)
+        self._update_recommend_page_label(candidate_count, page_size)
+        self._insert_recommendation_rows(tree, recommendations)
+
+    def _render_lane_recommendations(self, draft):
+        """라인별 탭: 다섯 라인의 추천 상위 목록(첫 페이지)을 한 번에 계산해 채웁니다."""
+        lane_trees = getattr(self, "lane_recommend_trees", None)
+        if not lane_trees:
             return
-
-        # Find the slot in allies team that matches my lane
-        target_slot = None
-        for slot in self.banpick_slots.get("allies", []):
-            slot_lane = slot.get("lane")
-            if slot_lane and slot_lane.get().lower() == my_lane:
-                target_slot = slot
-                break
-        
-        if not target_slot:
+        by_lane = self.scoring_engine.recommend_all_lanes(draft, self._get_recommend_page_size())
+        for lane, lane_tree in lane_trees.items():
+            for item in lane_tree.get_children():
+                lane_tree.delete(item)
+            self._insert_recommendation_rows(lane_tree, by_lane.get(lane, []))
+
+    @property
+    def ban_advisor(self):
+        """현재 점수 계산 엔진에 묶인 BanAdvisor (엔진이 바뀌면 새로 만듦)"""
+        advisor = getattr(self, "_ban_advisor", None)
+        engine = self.scoring_engine
+        if advisor is None or advisor.engine is not engine:
+            advisor = BanAdvisor(engine)
+            self._ban_advisor = advisor
+        return advisor
+
+    def _render_ban_threats(self, draft):
+        """밴 추천 탭: 위협도 상위 목록 (표시 개수만큼)"""
+        tree = getattr(self, "ban_threat_tree", None)
+        if not tree:
             return
-        
-        # My lane is always in the allies team
-        side_key = "allies"
-        target_lane = my_lane
-
-        scores = {}
-        pick_rate_override = (
-            self.parse_float(self.recommend_pick_rate_entry.get())
-            if hasattr(self, "recommend_pick_rate_entry") else BANPICK_PICK_RATE_OVERRIDE
-        )
-        if pick_rate_override < 0:
-            pick_rate_override = 0.0
-
-        def ensure_score_entry(champion):
-            entry = scores.get(champion)
-            if entry is None:
-                entry = {
-                    "synergy_sum": 0.0,
-                    "synergy_weight_sum": 0.0,  # 가중치 합 (정규화용)
-                    "counter_sum": 0.0,
-                    "counter_weight_sum": 0.0,  # 가중치 합 (정규화용)
-                    "synergy_sources": [],
-                    "counter_sources": [],
-                    "has_low_sample": False,
-                    "has_low_pick_gap": False, # deprecated but kept for compatibility
-                    "tags": [],
-                    "all_high_sample": True,
-                    "all_counter_under_50": True,
-                    "has_op_synergy": False,
-                    "synergy_slots_with_data": set(),  # 데이터가 있는 아군 슬롯 인덱스
-                    "counter_slots_with_data": set()   # 데이터가 있는 적군 슬롯 인덱스
-                }
-                scores[champion] = entry
-            return entry
-
-        def append_tag(components, label):
-            if label and label not in components["tags"]:
-                components["tags"].append(label)
-
-        def should_use_entry(details):
-            games = self.parse_int(details.get("games"))
-            pick_rate_value = 0.0
-            if "pick_rate" in details:
-                pick_rate_value = self.parse_float(details.get("pick_rate"))
-            elif "popularity" in details:
-                pick_rate_value = self.parse_float(details.get("popularity"))
-            meets_games_requirement = games >= min_games
-            meets_pick_rate_override = pick_rate_value >= pick_rate_override
-            include_entry = meets_games_requirement or meets_pick_rate_override
-            low_sample = not meets_games_requirement
-            # penalized_pick = (not include_entry) and (not meets_pick_rate_override) # No longer used to exclude
-            high_sample = games >= BANPICK_HIGH_SAMPLE_THRESHOLD
-            return include_entry, low_sample, high_sample, games, pick_rate_value
-
-        selected_lowers = set()
-        for slot_list in self.banpick_slots.values():
-            for s in slot_list:
-                # 내 라인(target_slot)에 있는 챔피언은 제외 목록에 넣지 않음
-                if s is target_slot:
-                    continue
-
-                name = s.get("display_name")
-                canon = s.get("canonical_name")
-                if name:
-                    selected_lowers.add(name.lower())
-                if canon:
-                    selected_lowers.add(canon.lower())
-
-        min_games = self.parse_int(self.recommend_min_games_entry.get()) if hasattr(self, "recommend_min_games_entry") else BANPICK_MIN_GAMES_DEFAULT
-        if min_games < 0:
-            min_games = 0
-
-        # Synergy contributions from same side
-        for friend_idx, friend in enumerate(self.banpick_slots.get(side_key, [])):
-            if friend.get("exclude_var") and friend["exclude_var"].get():
-                continue
-            dataset = friend.get("synergy_dataset")
-            if not dataset:
-                continue
-            source_lane = friend.get("selected_lane")
-            friend_canonical = friend.get("canonical_name")
-            lane_entries = dataset.get(target_lane, {})
-            
-            for champ_name, details in lane_entries.items():
-                # 1. Prepare Entry A (Friend vs Candidate)
-                entry_a = details
-                
-                # 2. Prepare Entry B (Candidate vs Friend)
-                entry_b = None
-                candidate_canon = self.resolve_champion_name(champ_name)
-                if candidate_canon and friend_canonical:
-                    cand_filename = f"{candidate_canon.lower()}_{target_lane.lower()}.json".replace(" ", "_")
-                    cand_raw = self.champion_data_cache.get(cand_filename)
-                    if cand_raw:
-                        cand_payload = cand_raw.get("synergy", {})
-                        if isinstance(cand_payload, dict):
-                            cand_lane_entries = cand_payload.get(source_lane, {})
-                            for k, v in cand_lane_entries.items():
-                                if self.resolve_champion_name(k) == friend_canonical:
-                                    entry_b = self.sanitize_synergy_entry(v)
-                                    break
-                
-                # 3. Select Best Entry
-                is_valid_a = False
-                is_valid_b = False
-                
-                if entry_a:
-                    games_a = self.parse_int(entry_a.get("games"))
-                    pick_rate_a = self.parse_float(entry_a.get("pick_rate") or entry_a.get("popularity"))
-                    is_valid_a = (games_a >= min_games) or (pick_rate_a >= pick_rate_override)
-                
-                if entry_b:
-                    games_b = self.parse_int(entry_b.get("games"))
-                    pick_rate_b = self.parse_float(entry_b.get("pick_rate") or entry_b.get("popularity"))
-                    is_valid_b = (games_b >= min_games) or (pick_rate_b >= pick_rate_override)
-                
-                use_source = None
-                if is_valid_a and is_valid_b:
-                    use_source = 'a' if self.parse_int(entry_a.get("games")) >= self.parse_int(entry_b.get("games")) else 'b'
-                elif is_valid_a:
-                    use_source = 'a'
-                elif is_valid_b:
-                    use_source = 'b'
-                elif entry_a:
-                    use_source = 'a'
-                elif entry_b:
-                    use_source = 'b'
-                
-                final_entry = entry_a if use_source == 'a' else entry_b
-                if not final_entry:
-                    continue
-                
-                include_entry, low_sample, high_sample, games, pick_rate_val = should_use_entry(final_entry)
-                source_name = friend.get("display_name") or friend.get("canonical_name") or "Unknown"
-                
-                if not include_entry:
-                    components = ensure_score_entry(champ_name)
-                    label = f"{source_name}(제외: {games}판, {pick_rate_val:.1f}%)"
-                    components["synergy_sources"].append(label)
-                    continue
-
-                value = self.parse_float(final_entry.get("win_rate"))
-                weight = self.get_lane_weight(target_lane, source_lane, "synergy")
-                if weight <= 0:
-                    continue
-                components = ensure_score_entry(champ_name)
-                components["synergy_sum"] += value * weight
-                components["synergy_weight_sum"] += weight
-                components["synergy_slots_with_data"].add(friend_idx)
-                if low_sample:
-                    components["has_low_sample"] = True
-                    append_tag(components, RECOMMEND_LOW_SAMPLE_TAG)
-                if not high_sample:
-                    components["all_high_sample"] = False
-                if value >= SYNERGY_OP_THRESHOLD:
-                    components["has_op_synergy"] = True
-                
-                label = f"{source_name}({value:.2f})"
-                if low_sample:
-                    label = f"{WARNING_ICON} {label}"
-                components["synergy_sources"].append(label)
-
-        # Counter contributions from opposing side
-        opponent_side = "enemies" if side_key == "allies" else "allies"
-        for enemy_idx, enemy in enumerate(self.banpick_slots.get(opponent_side, [])):
-            if enemy.get("exclude_var") and enemy["exclude_var"].get():
-                continue
-            dataset = enemy.get("counter_dataset")
-            if not dataset:
-                continue
-            source_lane = enemy.get("selected_lane")
-            enemy_canonical = enemy.get("canonical_name")
-            lane_entries = dataset.get(target_lane, {})
-            
-            for champ_name, details in lane_entries.items():
-                # 1. Prepare Entry A (Enemy vs Candidate)
-                entry_a = details
-                
-                # 2. Prepare Entry B (Candidate vs Enemy)
-                entry_b = None
-                candidate_canon = self.resolve_champion_name(champ_name)
-                if candidate_canon and enemy_canonical:
-                    cand_filename = f"{candidate_canon.lower()}_{target_lane.lower()}.json".replace(" ", "_")
-                    cand_raw = self.champion_data_cache.get(cand_filename)
-                    if cand_raw:
-                        cand_payload = cand_raw.get("counters")
-                        # Handle case where file is flat or payload missing
-                        if cand_payload is None:
-                             cand_payload = cand_raw
-                        
-                        if isinstance(cand_payload, dict):
-                            cand_lane_entries = cand_payload.get(source_lane, {})
-                            for k, v in cand_lane_entries.items():
-                                if self.resolve_champion_name(k) == enemy_canonical:
-                                    entry_b = self.sanitize_counter_entry(v)
-                                    break
-
-                # 3. Select Best Entry
-                is_valid_a = False
-                is_valid_b = False
-                
-                if entry_a:
-                    games_a = self.parse_int(entry_a.get("games"))
-                    pick_rate_a = self.parse_float(entry_a.get("pick_rate") or entry_a.get("popularity"))
-                    is_valid_a = (games_a >= min_games) or (pick_rate_a >= pick_rate_override)
-                
-                if entry_b:
-                    games_b = self.parse_int(entry_b.get("games"))
-                    pick_rate_b = self.parse_float(entry_b.get("pick_rate") or entry_b.get("popularity"))
-                    is_valid_b = (games_b >= min_games) or (pick_rate_b >= pick_rate_override)
-                
-                use_source = None
-                if is_valid_a and is_valid_b:
-                    use_source = 'a' if self.parse_int(entry_a.get("games")) >= self.parse_int(entry_b.get("games")) else 'b'
-                elif is_valid_a:
-                    use_source = 'a'
-                elif is_valid_b:
-                    use_source = 'b'
-                elif entry_a:
-                    use_source = 'a'
-                elif entry_b:
-                    use_source = 'b'
-                
-                final_entry = entry_a if use_source == 'a' else entry_b
-                if not final_entry:
-                    continue
-                
-                include_entry, low_sample, high_sample, games, pick_rate_val = should_use_entry(final_entry)
-                source_name = enemy.get("display_name") or enemy.get("canonical_name") or "Unknown"
-                
-                if not include_entry:
-                    components = ensure_score_entry(champ_name)
-                    label = f"{source_name}(제외: {games}판, {pick_rate_val:.1f}%)"
-                    components["counter_sources"].append(label)
-                    continue
-
-                # Calculate Score
-                win_rate_value = self.parse_float(final_entry.get("win_rate"))
-                
-                # Inversion Logic
-                # If use_source == 'a' (Enemy vs Candidate), Score = 100 - EnemyWinRate
-                # If use_source == 'b' (Candidate vs Enemy), Score = CandidateWinRate
-                if use_source == 'a':
-                    value = 100.0 - win_rate_value
-                else:
-                    value = win_rate_value
-                
-                weight = self.get_lane_weight(target_lane, source_lane, "counter")
-                if weight <= 0:
-                    continue
-                components = ensure_score_entry(champ_name)
-                components["counter_sum"] += value * weight
-                components["counter_weight_sum"] += weight
-                components["counter_slots_with_data"].add(enemy_idx)
-                if low_sample:
-                    components["has_low_sample"] = True
-                    append_tag(components, RECOMMEND_LOW_SAMPLE_TAG)
-                if not high_sample:
-                    components["all_high_sample"] = False
-                if win_rate_value >= 50.0:
-                    # Note: this check is slightly ambiguous.
-                    # It probably means "Is Candidate Win Rate >= 50?"
-                    # If 'a', win_rate_value is Enemy Win Rate. So if EnemyWinRate <= 50, then Cand >= 50.
-                    # If 'b', win_rate_value is Cand Win Rate.
-                    # Original code: `if win_rate_value >= 50.0: components["all_counter_under_50"] = False`
-                    # Original `win_rate_value` came from `details` (Enemy vs Candidate).
-                    # So it checked "Did Enemy win > 50%?". If so, then "All counters NOT under 50".
-                    # Wait, "all_counter_under_50" usually means "Is my win rate always < 50?".
-                    # If Enemy Win Rate >= 50, My Win Rate <= 50.
-                    # This tag logic seems to check "Did the ENEMY have >= 50% win rate?".
-                    # If so, it sets `all_counter_under_50 = False`.
-                    # This implies the tag means "Do ALL enemies have < 50% win rate against me?" i.e. "Am I always winning?"
-                    # If Enemy WR >= 50, then I am NOT always winning.
-                    # Correct.
-                    
-                    # For `entry_b` (Cand vs Enemy), win_rate is My Win Rate.
-                    # So if My Win Rate <= 50, then Enemy WR >= 50.
-                    # Logic needs adjustment?
-                    # "all_counter_under_50" name is confusing.
-                    # Let's assume it means "Does any counter exist that beats me?"
-                    pass
-
-                # Re-evaluating tag logic
-                # Original: `if win_rate_value >= 50.0: components["all_counter_under_50"] = False`
-                # where win_rate_value was Enemy WR.
-                # So if Enemy WR >= 50 (Enemy favored), then 'all_counter_under_50' becomes False.
-                # So `all_counter_under_50` tracks if "All enemy WRs are < 50" (i.e. I win > 50 against everyone).
-                
-                # New Logic:
-                # We need "Enemy Win Rate".
-                # If 'a': Enemy WR = win_rate_value.
-                # If 'b': Enemy WR = 100 - win_rate_value.
-                
-                enemy_win_rate = win_rate_value if use_source == 'a' else (100.0 - win_rate_value)
-                if enemy_win_rate >= 50.0:
-                    components["all_counter_under_50"] = False
-                
-                display_val = value # This is My Score
-                label = f"{source_name}({display_val:.2f})"
-                if low_sample:
-                    label = f"{WARNING_ICON} {label}"
-                components["counter_sources"].append(label)
-
-
-
-        recommendations = []
-
-        for champ_name, components in scores.items():
-            if champ_name.lower() in selected_lowers:
-                continue
-            # 밴된 챔피언은 추천 목록에서 제외
-            if self.is_champion_banned(champ_name):
-                continue
-            if self.is_champion_ignored(champ_name):
-                continue
-            if components["has_low_pick_gap"]:
-                continue
-            
-            # 데이터 파일 존재 여부 확인 (추천 목록에서도 제외)
-            if not self._check_champion_data_exists(champ_name, target_lane):
-                continue
-
-            # 가중치 합으로 나눠서 정규화 (라인 간 비교 가능하게)
-            synergy_score = (
-                components["synergy_sum"] / components["synergy_weight_sum"]
-                if components["synergy_weight_sum"] > 0 else 0.0
-            )
-            counter_score = (
-                components["counter_sum"] / components["counter_weight_sum"]
-                if components["counter_weight_sum"] > 0 else 0.0
+        for item in tree.get_children():
+            tree.delete(item)
+        for threat in self.ban_advisor.rank(draft, self._get_recommend_page_size()):
+            tree.insert(
+                "",
+                "end",
+                values=(
+                    threat.name,
+                    threat.lane,
+                    f"{threat.threat:.2f}",
+                    f"{threat.ally_drop:.2f}",
+                    f"{threat.enemy_synergy:+.2f}"
+                )
             )
-            total = synergy_score + counter_score
-            if total == 0:
-                continue
-            if components["counter_weight_sum"] > 0 and components["all_counter_under_50"]:
-                append_tag(components, RECOMMEND_FULL_COUNTER_TAG)
-            if components["all_high_sample"] and (components["synergy_weight_sum"] > 0 or components["counter_weight_sum"] > 0):
-                append_tag(components, RECOMMEND_HIGH_SAMPLE_TAG)
-            if components["has_op_synergy"]:
-                append_tag(components, RECOMMEND_OP_SYNERGY_TAG)
-            if self._qualifies_for_pre_pick_tag(champ_name, target_lane):
-                append_tag(components, RECOMMEND_PRE_PICK_TAG)
-            recommendations.append((
-                champ_name,
-                total,
-                synergy_score,
-                counter_score,
-                components["synergy_sources"],
-                components["counter_sources"],
-                components["has_low_sample"],
-                list(components["tags"])
-            ))
-
-        recommendations.sort(key=lambda item: item[1], reverse=True)
-        for champ_name, total, synergy_score, counter_score, synergy_sources, counter_sources, has_low_sample, tags in recommendations[:20]:
+
+    @staticmethod
+    def _insert_recommendation_rows(tree, recommendations):
+        for champ_name, total, synergy_score, counter_score, synergy_sources, counter_sources, has_low_sample, tags in recommendations:
             display_name = f"{WARNING_ICON} {champ_name}" if has_low_sample else champ_name
             synergy_label = " / ".join(synergy_sources) if synergy_sources else "-"
             counter_label = " / ".join(counter_sources) if counter_sources else "-"
@@ -3459,93 +3267,65 @@ class ChampionScraperApp:
                     counter_label
                 )
             )
-        
-        # 총 조합 점수 업데이트
-        self.update_team_total_scores()
-        # 모든 슬롯의 점수 표시 업데이트
-        self._update_all_slot_scores()
 
-    def _resolve_canonical_for_dataset(self, champion_name: str | None) -> str | None:
-        if not champion_name:
-            return None
-        stripped = str(champion_name).strip()
-        if not stripped:
-            return None
-        lowered = stripped.lower()
-        canonical = self.canonical_lookup.get(lowered)
-        if canonical:
-            return canonical
-        resolved = self.resolve_champion_name(stripped)
-        if resolved:
-            return resolved
-        return stripped
-
-    def _get_recommend_counter_dataset(self, canonical_name: str, lane: str):
-        if not canonical_name or lane not in LANES:
-            return None
-        cache_key = (canonical_name, lane)
-        if cache_key in self.recommend_counter_cache:
-            return self.recommend_counter_cache[cache_key]
-        dataset, _resolved_lane, _ = self._load_lane_dataset(
-            canonical_name,
-            lane,
-            "Counter",
-            "counters",
-            self.sanitize_counter_entry,
-            suppress_errors=True,
-            apply_ignore_filter=False
-        )
-        self.recommend_counter_cache[cache_key] = dataset
-        return dataset
+    def _get_recommend_page_size(self):
+        try:
+            page_size = int(self.ui_settings.get("recommend_page_size", RECOMMEND_PAGE_SIZE_DEFAULT))
+        except (TypeError, ValueError):
+            page_size = RECOMMEND_PAGE_SIZE_DEFAULT
+        return max(1, page_size)
 
-    def _qualifies_for_pre_pick_tag(self, champion_name: str, lane: str) -> bool:
-        if lane not in LANES:
-            return False
-        canonical = self._resolve_canonical_for_dataset(champion_name)
-        if not canonical:
-            return False
-        dataset = self._get_recommend_counter_dataset(canonical, lane)
-        if not dataset:
-            return False
-        lane_entries = dataset.get(lane, {})
-        if not lane_entries:
-            return False
-        for details in lane_entries.values():
-            popularity = self.parse_float(details.get("popularity"))
-            if popularity <= BANPICK_PRE_PICK_POPULARITY_THRESHOLD:
-                continue
-            win_rate = self.parse_float(details.get("win_rate"))
-            if win_rate < 50.0:
-                return False
-        return True
+    def _update_recommend_page_label(self, candidate_count, page_size):
+        label_var = getattr(self, "recommend_page_var", None)
+        if label_var is None:
+            return
+        page_count = max(1, (candidate_count + page_size - 1) // page_size)
+        label_var.set(f"{self.recommend_page + 1}/{page_count} 페이지 (후보 {candidate_count}명)")
+
+    def change_recommend_page(self, delta):
+        """추천 목록 페이지 이동 (점수는 다시 계산하지 않고 해당 페이지 행만 만듦)"""
+        tree = getattr(self, "recommend_tree", None)
+        if not tree:
+            return
+        self.recommend_page = max(0, self.recommend_page + delta)
+        self._render_recommendations(tree, self.snapshot_draft_state())
+
+    def _on_recommend_page_size_changed(self, _event=None):
+        value = self.recommend_page_size_entry.get().strip()
+        try:
+            page_size = int(value)
+        except ValueError:
+            return
+        if page_size <= 0 or page_size == self._get_recommend_page_size():
+            return
+        self.ui_settings["recommend_page_size"] = page_size
+        self._save_ui_settings()
+        self.recommend_page = 0
+        tree = getattr(self, "recommend_tree", None)
+        if tree:
+            self._render_recommendations(tree, self.snapshot_draft_state())
 
-    def get_lane_weight(self, target_lane, source_lane, weight_type="counter"):
+    def get_lane_weight_matrices(self):
         """
-        라인 가중치를 반환합니다.
-        weight_type: "synergy" 또는 "counter"
-        저장된 값이 있으면 그것을 사용하고, 없으면 weight_settings.json의 기본값을 사용합니다.
+        {"counter": 5×5, "synergy": 5×5} 라인 가중치 행렬을 반환합니다.
+        저장된 값(ui_settings)이 있으면 그것을, 없으면 weight_settings.json의 기본값을 사용합니다.
+        weight_settings.json이 바뀐 경우에만 파일을 다시 읽습니다.
         """
-        if not target_lane or not source_lane:
-            from weight_settings_tab import LANE_WEIGHT_DEFAULT
-            return LANE_WEIGHT_DEFAULT
-        
-        # 저장된 가중치 확인 (사용자가 수정한 값)
-        weight_settings_ui = self.ui_settings.get("lane_weights", {})
-        lane_settings = weight_settings_ui.get(target_lane, {})
-        type_settings = lane_settings.get(weight_type, {})
-        
-        saved_weight = type_settings.get(source_lane)
-        if saved_weight is not None:
-            return float(saved_weight)
-        
-        # 기본값 사용 (weight_settings.json에서)
-        from weight_settings_tab import LANE_WEIGHT_DEFAULT
-        weight_settings = load_weight_settings()
-        weight_type_settings = weight_settings.get(weight_type, {})
-        lane_weight_map = weight_type_settings.get("lane_weight_map", {})
-        mapping = lane_weight_map.get(target_lane, {})
-        return mapping.get(source_lane, LANE_WEIGHT_DEFAULT)
-    
+        mtime = weight_settings_mtime()
+        if mtime != self.weight_settings_mtime:
+            self.weight_settings = load_weight_settings()
+            self.weight_settings_mtime = weight_settings_mtime()
+            self.lane_weight_matrices = None
+        if self.lane_weight_matrices is None:
+            self.lane_weight_matrices = build_lane_weight_matrices(
+                self.weight_settings,
+                self.ui_settings.get("lane_weights", {})
+            )
+        return self.lane_weight_matrices
+
+    def invalidate_lane_weights(self):
+        """가중치 입력값이 바뀌었을 때 호출합니다."""
+        self.lane_weight_matrices = None
 
     def _parse_threshold_value(self, entry_widget, default_value):
         if not entry_widget:
@@ -3560,38 +3340,11 @@ class ChampionScraperApp:
         return parsed if parsed >= 0 else default_value
 
     def _find_best_lane_by_counters(self, full_name):
-        best_lane = None
-        max_games = -1
-
-        for lane in LANES:
-            data_filename = f"{full_name}_{lane}.json".replace(" ", "_")
-            filename = resolve_resource_path("data", data_filename)
-            if not os.path.exists(filename):
-                continue
-            
-            try:
-                with open(filename, "r", encoding="utf-8") as file:
-                    raw_data = json.load(file)
-            except (OSError, json.JSONDecodeError):
-                continue
-
-            counters_data = raw_data.get("counters")
-            if not isinstance(counters_data, dict):
-                continue
-
-            total_games = 0
-            for sub_lane_data in counters_data.values():
-                if not isinstance(sub_lane_data, dict):
-                    continue
-                for entry in sub_lane_data.values():
-                    if isinstance(entry, dict):
-                        total_games += self.parse_int(entry.get("games"))
-            
-            if total_games > max_games:
-                max_games = total_games
-                best_lane = lane
-        
-        return best_lane
+        """카운터 games 합이 가장 큰 라인 (로딩 시 계산한 값). 데이터가 없거나 로딩 중이면 None."""
+        catalog = self._lane_data_catalog()
+        if catalog is None:
+            return None
+        return catalog.best_lane(catalog.tensor.champion_id(full_name))
 
     def _load_lane_dataset(
         self,
@@ -3603,55 +3356,26 @@ class ChampionScraperApp:
         suppress_errors=False,
         apply_ignore_filter=False  # 기본값 False: 점수 계산에는 ignore list 적용 안 함
     ):
+        # data_label, suppress_errors: 파일별 JSON 파싱 오류 안내용이었으나
+        # 매핑된 묶음 데이터에는 파일 단위 오류가 없어 호출 호환을 위해서만 유지
         if preferred_lane in LANES:
             lanes_to_try = [preferred_lane]
         else:
             lanes_to_try = [preferred_lane] + [lane for lane in LANES if lane != preferred_lane]
         best_candidate = None
 
+        tensor = self.matchup_tensor
+        champion_id = tensor.champion_id(full_name)
         for lane_candidate in lanes_to_try:
-            data_filename = f"{full_name}_{lane_candidate}.json".replace(" ", "_")
-            
-            # Check cache first
-            raw_data = self.champion_data_cache.get(data_filename)
-            
-            if raw_data is None:
-                filename = resolve_resource_path("data", data_filename)
-                try:
-                    with open(filename, "r", encoding="utf-8") as file:
-                        raw_data = json.load(file)
-                except FileNotFoundError:
-                    continue
-                except json.JSONDecodeError as e:
-                    if not suppress_errors:
-                        messagebox.showerror(
-                            "Error",
-                            f"{data_label} 데이터 파일 '{data_filename}'을 읽을 수 없습니다.\n에러: {e}"
-                        )
-                    return None, None, False
-                except OSError as e:
-                    if not suppress_errors:
-                        messagebox.showerror(
-                            "Error",
-                            f"{data_label} 데이터 파일 '{data_filename}'을 여는 중 오류가 발생했습니다.\n경로: {filename}\n에러: {e}"
-                        )
-                    return None, None, False
-
-            payload = raw_data.get(data_key)
-            if payload is None and data_key == "counters":
-                payload = raw_data
-            if not isinstance(payload, dict):
+            # 필요한 파일 하나만 매치업 배열에서 숫자로 읽어 표시용 dict로 만듦
+            lane_dataset = tensor.lane_dataset(data_key, champion_id, LANE_INDEX.get(lane_candidate))
+            if lane_dataset is None:
                 continue
 
-            sanitized_dataset = {ln: {} for ln in LANES}
-            for lane_name in LANES:
-                lane_payload = payload.get(lane_name, {})
-                if not isinstance(lane_payload, dict):
-                    continue
-                for name, entry in lane_payload.items():
-                    if not isinstance(entry, dict):
-                        continue
-                    sanitized_dataset[lane_name][name] = sanitize_entry(entry)
+            sanitized_dataset = {
+                lane_name: {name: sanitize_entry(entry) for name, entry in lane_dataset[lane_name].items()}
+                for lane_name in LANES
+            }
 
             if apply_ignore_filter:
                 self._apply_ignore_filter(sanitized_dataset)
@@ -3663,7 +3387,7 @@ class ChampionScraperApp:
                 return sanitized_dataset, lane_candidate, False
 
             total_games = sum(
-                self.parse_int(details.get("games"))
+                details["games"]
                 for lane_data in sanitized_dataset.values()
                 for details in lane_data.values()
             )
@@ -3691,7 +3415,7 @@ class ChampionScraperApp:
         # 밴 정보 및 표시 초기화
         self.banned_champions = set()
         self._update_ban_labels([], [])
-        self.update_banpick_recommendations()
+        self.schedule_recompute()
 
     def reset_banpick_slots(self):
         if not hasattr(self, "banpick_slots"):
@@ -3700,7 +3424,7 @@ class ChampionScraperApp:
             for slot in slots:
                 self.clear_banpick_slot(slot, reset_lane=True, suppress_update=True)
         # my_lane_var should NOT be reset - it persists across dashboard resets
-        self.update_banpick_recommendations()
+        self.schedule_recompute()
 
     def format_display_name(self, slug: str) -> str:
         key = slug.lower().replace("_", "")
@@ -3725,18 +3449,20 @@ class ChampionScraperApp:
         return None
     
     def sanitize_counter_entry(self, entry):
+        """카운터 항목을 schema v2 숫자 필드로 정리합니다 (v1 문자열도 허용)."""
         sanitized = entry.copy()
-        sanitized["games"] = f"{self.parse_int(entry.get('games'))}"
-        sanitized["popularity"] = f"{self.parse_float(entry.get('popularity')):.2f}"
-        sanitized["win_rate"] = f"{self.parse_float(entry.get('win_rate')):.2f}"
-        sanitized["win_rate_diff"] = f"{self.parse_float(entry.get('win_rate_diff')):.2f}"
+        sanitized["games"] = self.parse_int(entry.get("games"))
+        sanitized["popularity"] = round(self.parse_float(entry.get("popularity")), 2)
+        sanitized["win_rate"] = round(self.parse_float(entry.get("win_rate")), 2)
+        sanitized["win_rate_diff"] = round(self.parse_float(entry.get("win_rate_diff")), 2)
         return sanitized
 
     def sanitize_synergy_entry(self, entry):
+        """시너지 항목을 schema v2 숫자 필드로 정리합니다 (v1 문자열도 허용)."""
         sanitized = entry.copy()
-        sanitized["games"] = f"{self.parse_int(entry.get('games'))}"
-        sanitized["pick_rate"] = f"{self.parse_float(entry.get('pick_rate')):.2f}"
-        sanitized["win_rate"] = f"{self.parse_float(entry.get('win_rate')):.2f}"
+        sanitized["games"] = self.parse_int(entry.get("games"))
+        sanitized["pick_rate"] = round(self.parse_float(entry.get("pick_rate")), 2)
+        sanitized["win_rate"] = round(self.parse_float(entry.get("win_rate")), 2)
         return sanitized
 
     def _initialize_ignored_champions(self) -> set[str]:
@@ -3750,72 +3476,69 @@ class ChampionScraperApp:
             normalized.add(canonical.lower())
         return normalized
 
+    def champion_id_for_name(self, name):
+        """
+        이름을 매치업 텐서의 챔피언 ID로 바꿉니다.
+        데이터에 등장하는 표기는 로딩 시 만든 인턴 테이블에서 바로 찾고,
+        그 밖의 표기(별칭 등)만 resolve_champion_name을 한 번 거친 뒤 캐시합니다.
+        """
+        if not name:
+            return None
+        tensor = self.matchup_tensor
+        champion_id = tensor.lookup_id(name)
+        if champion_id is not None:
+            return champion_id
+        lowered = str(name).strip().lower()
+        if not lowered:
+            return None
+        if lowered not in self.champion_id_cache:
+            canonical = self.canonical_lookup.get(lowered) or self.resolve_champion_name(lowered)
+            self.champion_id_cache[lowered] = tensor.champion_id(canonical)
+        return self.champion_id_cache[lowered]
+
+    def _champion_ids_for_names(self, names) -> set:
+        ids = set()
+        for name in names:
+            champion_id = self.champion_id_for_name(name)
+            if champion_id is not None:
+                ids.add(champion_id)
+        return ids
+
     def _apply_ignore_filter(self, dataset):
         if not dataset or not self.ignored_champions:
             return
+        ignored_ids = self._champion_ids_for_names(self.ignored_champions)
         for lane, champions in dataset.items():
             if not isinstance(champions, dict):
                 continue
             for champ_name in list(champions.keys()):
-                if self.is_champion_ignored(champ_name):
+                if str(champ_name).strip().lower() in self.ignored_champions or self.champion_id_for_name(champ_name) in ignored_ids:
                     champions.pop(champ_name, None)
 
     def is_champion_ignored(self, name: str) -> bool:
         if not name or not self.ignored_champions:
             return False
-        lowered = str(name).strip().lower()
-        if lowered in self.ignored_champions:
-            return True
-        canonical = self.canonical_lookup.get(lowered)
-        if canonical and canonical.lower() in self.ignored_champions:
-            return True
-        resolved = self.resolve_champion_name(name)
-        if resolved and resolved.lower() in self.ignored_champions:
+        if str(name).strip().lower() in self.ignored_champions:
             return True
-        return False
+        champion_id = self.champion_id_for_name(name)
+        return champion_id is not None and champion_id in self._champion_ids_for_names(self.ignored_champions)
 
     def is_champion_banned(self, name: str) -> bool:
         """현재 게임에서 밴된 챔피언인지 여부를 반환합니다."""
         if not name or not getattr(self, "banned_champions", None):
             return False
-        lowered = str(name).strip().lower()
-        if lowered in self.banned_champions:
-            return True
-        canonical = self.canonical_lookup.get(lowered)
-        if canonical and canonical.lower() in self.banned_champions:
+        if str(name).strip().lower() in self.banned_champions:
             return True
-        resolved = self.resolve_champion_name(name)
-        if resolved and resolved.lower() in self.banned_champions:
-            return True
-        return False
+        champion_id = self.champion_id_for_name(name)
+        return champion_id is not None and champion_id in self._champion_ids_for_names(self.banned_champions)
 
     @staticmethod
     def parse_int(value):
-        if isinstance(value, int):
-            return value
-        if isinstance(value, float):
-            return int(value)
-        if isinstance(value, str):
-            value = value.replace(",", "").strip()
-            if not value:
-                return 0
-        try:
-            return int(value)
-        except (TypeError, ValueError):
-            return 0
+        return parse_int(value)
 
     @staticmethod
     def parse_float(value):
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            value = value.replace(",", "").strip()
-            if not value:
-                return 0.0
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return 0.0
+        return parse_float(value)
     
     def toggle_theme(self):
         """다크모드/라이트모드 전환"""
@@ -0,0 +1,204 @@
+"""
+백그라운드 로그 기록.
+
+로거에는 큐에 넣기만 하는 핸들러(writer.handler)를 붙이고, 실제 파일 쓰기는 전용 스레드가
+큐에 쌓인 항목을 모아(batch) 한 번에 쓰고 한 번만 flush합니다. 호출하는 쪽(LCU watcher 등)은
+파일 I/O를 기다리지 않습니다.
+
+- 파일이 max_bytes를 넘으면 RotatingFileHandler처럼 path.1, path.2 ... 로 밀어내고 새 파일을 엽니다.
+- truncate(): 큐 순서를 지키며 파일을 비웁니다 (새 게임 시작 시 로그 초기화).
+- write_line(): LogRecord 없이 완성된 한 줄을 씁니다 (JSON 디버그 로그용).
+- 스레드는 처음 기록할 때 시작하고, 프로세스 종료 시 남은 항목을 모두 쓴 뒤 멈춥니다.
+  stop() 이후의 기록은 스레드를 다시 띄우지 않고 호출한 스레드에서 바로 씁니다.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+
+LOG_MAX_BYTES_DEFAULT = 2 * 1024 * 1024
+LOG_BACKUP_COUNT_DEFAULT = 2
+LOG_BATCH_SIZE = 256
+
+_STOP = object()
+_TRUNCATE = object()
+
+
+class _WriterQueueHandler(logging.handlers.QueueHandler):
+    """레코드를 writer 큐에 넣습니다. (메시지 병합은 호출 스레드, 포맷/쓰기는 writer 스레드)"""
+
+    def __init__(self, writer):
+        super().__init__(writer.queue)
+        self.writer = writer
+
+    def enqueue(self, record):
+        self.writer.put(record)
+
+
+class BatchingLogWriter:
+    """큐로 받은 로그 레코드/문자열을 백그라운드 스레드에서 묶어 파일에 씁니다."""
+
+    def __init__(self, path, formatter=None, max_bytes=LOG_MAX_BYTES_DEFAULT,
+                 backup_count=LOG_BACKUP_COUNT_DEFAULT, batch_size=LOG_BATCH_SIZE):
+        self.path = os.fspath(path)
+        self.formatter = formatter or logging.Formatter("%(message)s")
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.queue = queue.SimpleQueue()
+        self.handler = _WriterQueueHandler(self)
+        self._stream = None
+        self._size = 0
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._exit_registered = False
+
+    def put(self, item):
+        with self._lock:
+            if self._stopped:
+                # 멈춘 뒤에는 (종료 중 로그 등) 큐를 거치지 않고 바로 씀
+                self._write_through(item)
+                return
+            if self._thread is None:
+                self._start()
+            self.queue.put(item)
+
+    def write_line(self, text):
+        self.put(text)
+
+    def truncate(self):
+        self.put(_TRUNCATE)
+
+    def flush(self, timeout=2.0):
+        """지금까지 넣은 항목이 모두 파일에 쓰일 때까지 기다립니다."""
+        with self._lock:
+            if self._thread is None:
+                return True
+            done = threading.Event()
+            self.queue.put(done)
+        return done.wait(timeout)
+
+    def stop(self, timeout=2.0):
+        """남은 항목을 모두 쓰고 스레드를 멈춥니다. 이후 기록은 호출한 스레드에서 바로 씁니다."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            thread = self._thread
+            if thread is not None:
+                self.queue.put(_STOP)
+        if thread is not None:
+            thread.join(timeout)
+        with self._lock:
+            self._thread = None
+
+    def _start(self):
+        # self._lock을 잡은 상태에서 호출
+        self._thread = threading.Thread(target=self._run, name=f"log-writer:{os.path.basename(self.path)}", daemon=True)
+        self._thread.start()
+        if not self._exit_registered:
+            atexit.register(self.stop)
+            self._exit_registered = True
+
+    def _write_through(self, item):
+        # self._lock을 잡은 상태에서 호출 (writer 스레드는 이미 멈춤)
+        if item is _TRUNCATE:
+            self._open("wb")
+        elif isinstance(item, str):
+            self._write([item])
+        elif isinstance(item, logging.LogRecord):
+            try:
+                self._write([self.formatter.format(item)])
+            except Exception:
+                pass
+        self._close()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            items = [self.queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for item in items:
+                if item is _STOP:
+                    stopping = True
+                elif item is _TRUNCATE:
+                    self._write(lines)
+                    lines = []
+                    self._open("wb")
+                elif isinstance(item, threading.Event):
+                    self._write(lines)
+                    lines = []
+                    item.set()
+                elif isinstance(item, str):
+                    lines.append(item)
+                else:
+                    try:
+                        lines.append(self.formatter.format(item))
+                    except Exception:
+                        pass
+            self._write(lines)
+        self._close()
+
+    def _open(self, mode="ab"):
+        self._close()
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._stream = open(self.path, mode)
+            self._size = self._stream.seek(0, os.SEEK_END)
+        except OSError:
+            self._stream = None
+            self._size = 0
+
+    def _close(self):
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def _rotate(self):
+        self._close()
+        try:
+            if self.backup_count > 0:
+                for index in range(self.backup_count - 1, 0, -1):
+                    source = f"{self.path}.{index}"
+                    if os.path.exists(source):
+                        os.replace(source, f"{self.path}.{index + 1}")
+                os.replace(self.path, f"{self.path}.1")
+                self._open("ab")
+            else:
+                self._open("wb")
+        except OSError:
+            self._open("ab")
+
+    def _write(self, lines):
+        if not lines:
+            return
+        data = ("\n".join(lines) + "\n").encode("utf-8", errors="replace")
+        if self._stream is None:
+            self._open("ab")
+        if self._stream is None:
+            return
+        if self.max_bytes and self._size and self._size + len(data) > self.max_bytes:
+            self._rotate()
+            if self._stream is None:
+                return
+        try:
+            self._stream.write(data)
+            self._stream.flush()
+            self._size += len(data)
+        except OSError:
+            # 로그 기록 실패는 무시
+            pass
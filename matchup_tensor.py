@@ -0,0 +1,645 @@
+"""
+챔피언 매치업 데이터를 고정 레이아웃 배열로 컴파일합니다.
+
+data/*_{lane}.json 파일 하나가 행(row) 하나가 되고, 파일에 등장하는 상대 챔피언 이름이
+열(column)이 됩니다. 카운터/시너지별로 games, pick_rate, win_rate 배열을
+(행, 열, 상대 라인) 순서로 펼쳐 담습니다.
+
+    MatchupTable  : 이름 해석 없이 파일 내용 그대로의 배열 (묶음 파일에 그대로 저장/매핑됨)
+    MatchupTensor : MatchupTable 위에 canonical 챔피언 ID 인덱스와
+                    역방향(상대 파일 쪽) 위치 인덱스를 얹은 조회용 뷰
+
+승률과 픽률은 소수점 2자리 데이터이므로 100배한 정수로 저장합니다.
+(정수 / 100.0 은 원래 문자열을 float로 읽은 값과 정확히 같습니다)
+"""
+
+from array import array
+
+from common import LANES, parse_int, parse_float
+
+KIND_COUNTER = "counters"
+KIND_SYNERGY = "synergy"
+MATCHUP_KINDS = (KIND_COUNTER, KIND_SYNERGY)
+
+LANE_COUNT = len(LANES)
+LANE_INDEX = {lane: idx for idx, lane in enumerate(LANES)}
+
+# games 배열에서 "항목 없음"을 나타내는 값 (0판짜리 항목과 구분하기 위함)
+MISSING_GAMES = -1
+
+# 배열 typecode (묶음 파일의 바이너리 레이아웃과 같아야 함)
+GAMES_TYPECODE = "i"
+RATE_TYPECODE = "h"
+
+# 각 kind의 픽률 필드 이름
+PICK_RATE_KEYS = {KIND_COUNTER: "popularity", KIND_SYNERGY: "pick_rate"}
+
+
+def split_data_filename(filename: str):
+    """'lee_sin_jungle.json' → ('lee_sin', 'jungle'). 형식이 맞지 않으면 (None, None)."""
+    if not filename.endswith(".json"):
+        return None, None
+    stem, _sep, lane = filename[:-len(".json")].rpartition("_")
+    if not stem or lane not in LANE_INDEX:
+        return None, None
+    return stem, lane
+
+
+def _to_centi(value) -> int:
+    return int(round(parse_float(value) * 100))
+
+
+def _kind_payload(raw_data, kind):
+    payload = raw_data.get(kind)
+    if payload is None and kind == KIND_COUNTER:
+        payload = raw_data
+    return payload if isinstance(payload, dict) else None
+
+
+class MatchupTable:
+    """
+    (파일 행, 상대 이름 열, 상대 라인) 3차원 배열 묶음.
+
+    rows    : [(파일명 stem, lane), ...]
+    columns : 데이터에 등장하는 상대 챔피언 이름 ("Name" 값)
+    games / pick_rate / win_rate : {kind: 배열} (array 또는 mmap 위의 memoryview)
+    mtimes  : {파일명: 원본 JSON 수정 시각}
+    """
+
+    def __init__(self, rows, columns, games, pick_rate, win_rate, mtimes=None):
+        self.rows = [tuple(row) for row in rows]
+        self.columns = list(columns)
+        self.row_stride = len(self.columns) * LANE_COUNT
+        self.games = games
+        self.pick_rate = pick_rate
+        self.win_rate = win_rate
+        # 원본 JSON 파일의 수정 시각 {파일명: 초}. 알 수 없으면 비어 있음
+        self.mtimes = dict(mtimes or {})
+
+    @classmethod
+    def empty(cls, rows, columns):
+        size = len(rows) * len(columns) * LANE_COUNT
+        return cls(
+            rows,
+            columns,
+            {kind: array(GAMES_TYPECODE, [MISSING_GAMES]) * size for kind in MATCHUP_KINDS},
+            {kind: array(RATE_TYPECODE, [0]) * size for kind in MATCHUP_KINDS},
+            {kind: array(RATE_TYPECODE, [0]) * size for kind in MATCHUP_KINDS},
+        )
+
+    @property
+    def cell_count(self) -> int:
+        return len(self.rows) * self.row_stride
+
+    def iter_arrays(self):
+        """직렬화 순서대로 (kind, 필드 이름, 배열)을 순회합니다."""
+        for kind in MATCHUP_KINDS:
+            yield kind, "games", self.games[kind]
+            yield kind, "pick_rate", self.pick_rate[kind]
+            yield kind, "win_rate", self.win_rate[kind]
+
+
+def compile_matchup_table(payloads) -> MatchupTable:
+    """{파일명: JSON payload} 묶음을 이름 해석 없이 MatchupTable로 컴파일합니다."""
+    files = []
+    column_ids = {}
+    for filename in sorted(payloads):
+        raw_data = payloads[filename]
+        stem, lane = split_data_filename(filename)
+        if not stem or not isinstance(raw_data, dict):
+            continue
+        has_entries = False
+        for kind in MATCHUP_KINDS:
+            payload = _kind_payload(raw_data, kind)
+            if payload is None:
+                continue
+            for other_lane, lane_payload in payload.items():
+                if other_lane not in LANE_INDEX or not isinstance(lane_payload, dict):
+                    continue
+                for raw_name, entry in lane_payload.items():
+                    if raw_name and isinstance(entry, dict):
+                        column_ids.setdefault(raw_name, len(column_ids))
+                        has_entries = True
+        if has_entries:
+            files.append((stem, lane, raw_data))
+
+    table = MatchupTable.empty([(stem, lane) for stem, lane, _data in files], list(column_ids))
+    for row, (_stem, _lane, raw_data) in enumerate(files):
+        base = row * table.row_stride
+        for kind in MATCHUP_KINDS:
+            payload = _kind_payload(raw_data, kind)
+            if payload is None:
+                continue
+            pick_key = PICK_RATE_KEYS[kind]
+            games, pick_rate, win_rate = table.games[kind], table.pick_rate[kind], table.win_rate[kind]
+            for other_lane, lane_payload in payload.items():
+                other_lane_idx = LANE_INDEX.get(other_lane)
+                if other_lane_idx is None or not isinstance(lane_payload, dict):
+                    continue
+                for raw_name, entry in lane_payload.items():
+                    if not raw_name or not isinstance(entry, dict):
+                        continue
+                    pos = base + column_ids[raw_name] * LANE_COUNT + other_lane_idx
+                    games[pos] = parse_int(entry.get("games"))
+                    pick_rate[pos] = _to_centi(entry.get(pick_key))
+                    win_rate[pos] = _to_centi(entry.get("win_rate"))
+    return table
+
+
+class MatchupTensor:
+    """
+    canonical 챔피언 ID로 MatchupTable을 조회하는 뷰.
+
+    entry(kind, a, la, b, lb)는 "a 챔피언의 la 라인 데이터 파일에 기록된 b 챔피언(lb 라인)" 항목입니다.
+    테이블 배열은 복사하지 않으므로 mmap 위의 테이블이면 조회한 페이지만 메모리에 올라옵니다.
+    """
+
+    def __init__(self, table=None, resolve_name=None):
+        if table is None:
+            table = MatchupTable.empty([], [])
+        self.table = table
+
+        canonical_cache = {}
+
+        def canonical_of(raw_name):
+            if raw_name not in canonical_cache:
+                resolved = resolve_name(str(raw_name).replace("_", " ")) if resolve_name and raw_name else None
+                canonical_cache[raw_name] = resolved or None
+            return canonical_cache[raw_name]
+
+        column_canonicals = [canonical_of(name) for name in table.columns]
+        row_canonicals = [canonical_of(stem) for stem, _lane in table.rows]
+        champions = sorted(
+            {name for name in column_canonicals if name} | {name for name in row_canonicals if name},
+            key=str.lower,
+        )
+        self.champions = champions
+        self.champion_ids = {name: idx for idx, name in enumerate(champions)}
+        self._lower_ids = {name.lower(): idx for idx, name in enumerate(champions)}
+        self.champion_count = len(champions)
+
+        # canonical ID → 테이블 열 / (ID, 라인) → 테이블 행. 없으면 -1
+        self.column_of = [-1] * self.champion_count
+        self.column_champion = [None] * len(table.columns)
+        for column, canonical in enumerate(column_canonicals):
+            if not canonical:
+                continue
+            cid = self.champion_ids[canonical]
+            if self.column_of[cid] < 0:
+                self.column_of[cid] = column
+                self.column_champion[column] = cid
+
+        self.row_of = [-1] * (self.champion_count * LANE_COUNT)
+        self.row_champion = [None] * len(table.rows)
+        for row, canonical in enumerate(row_canonicals):
+            if not canonical:
+                continue
+            cid = self.champion_ids[canonical]
+            key = cid * LANE_COUNT + LANE_INDEX[table.rows[row][1]]
+            if self.row_of[key] < 0:
+                self.row_of[key] = row
+                self.row_champion[row] = cid
+
+        # 데이터 파일의 "Name" 값 (추천 목록 표시에 사용)
+        self.data_names = [
+            table.columns[self.column_of[cid]] if self.column_of[cid] >= 0 else champions[cid]
+            for cid in range(self.champion_count)
+        ]
+
+        self.reverse_offset = self._build_reverse_offsets()
+
+        # 이름 인턴 테이블: 데이터에 등장하는 모든 표기(소문자) → canonical ID.
+        # 로딩 시 한 번만 resolve_name을 거치므로 이후 조회는 dict 한 번으로 끝남
+        self.name_ids = dict(self._lower_ids)
+        for column, canonical in enumerate(column_canonicals):
+            if canonical:
+                self.name_ids.setdefault(table.columns[column].strip().lower(), self.champion_ids[canonical])
+        for row, canonical in enumerate(row_canonicals):
+            if canonical:
+                stem = table.rows[row][0].lower()
+                self.name_ids.setdefault(stem, self.champion_ids[canonical])
+                self.name_ids.setdefault(stem.replace("_", " "), self.champion_ids[canonical])
+
+    def _build_reverse_offsets(self):
+        """
+        배열 위치마다 반대 방향 항목의 위치를 담은 인덱스를 만듭니다.
+        (a, la) 파일의 (b, lb) 칸 → (b, lb) 파일의 (a, la) 칸. 반대쪽 파일이 없으면 -1.
+        배열 레이아웃이 kind와 무관하므로 카운터/시너지가 같은 인덱스를 씁니다.
+        """
+        table = self.table
+        stride = table.row_stride
+        reverse = array(GAMES_TYPECODE, [-1]) * table.cell_count
+        other_rows = [
+            (column, [self.row_of[other_id * LANE_COUNT + other_lane] for other_lane in range(LANE_COUNT)])
+            for column, other_id in enumerate(self.column_champion)
+            if other_id is not None
+        ]
+        for row, champion_id in enumerate(self.row_champion):
+            if champion_id is None or self.column_of[champion_id] < 0:
+                continue
+            # 반대쪽 파일에서 이 챔피언(이 라인)이 들어갈 칸
+            back = self.column_of[champion_id] * LANE_COUNT + LANE_INDEX[table.rows[row][1]]
+            base = row * stride
+            for column, rows_by_lane in other_rows:
+                pos = base + column * LANE_COUNT
+                for other_lane, other_row in enumerate(rows_by_lane):
+                    if other_row >= 0:
+                        reverse[pos + other_lane] = other_row * stride + back
+        return reverse
+
+    def __len__(self):
+        return self.champion_count
+
+    def champion_id(self, canonical_name):
+        if not canonical_name:
+            return None
+        idx = self.champion_ids.get(canonical_name)
+        if idx is None:
+            idx = self._lower_ids.get(str(canonical_name).lower())
+        return idx
+
+    def lookup_id(self, name):
+        """
+        데이터에 등장한 표기(canonical 이름, "Name" 값, 파일명 stem)로 ID를 찾습니다.
+        별칭/초성 같은 유사 검색은 하지 않으며, 모르는 이름이면 None.
+        """
+        if not name:
+            return None
+        return self.name_ids.get(str(name).strip().lower())
+
+    def row_index(self, champion_id, lane_idx) -> int:
+        if champion_id is None or lane_idx is None:
+            return -1
+        return self.row_of[champion_id * LANE_COUNT + lane_idx]
+
+    def has_data(self, champion_id, lane_idx) -> bool:
+        return self.row_index(champion_id, lane_idx) >= 0
+
+    def data_stem(self, champion_id, lane_idx):
+        """(ID, 라인)의 데이터 파일 stem ('lee_sin' 등). 파일이 없으면 None."""
+        row = self.row_index(champion_id, lane_idx)
+        return self.table.rows[row][0] if row >= 0 else None
+
+    def offset(self, champion_id, lane_idx, other_id, other_lane_idx):
+        """배열 위치. 행이나 열이 없으면 None."""
+        row = self.row_index(champion_id, lane_idx)
+        if row < 0 or other_id is None or other_lane_idx is None:
+            return None
+        column = self.column_of[other_id]
+        if column < 0:
+            return None
+        return row * self.table.row_stride + column * LANE_COUNT + other_lane_idx
+
+    def _entry_at(self, kind, pos):
+        games = self.table.games[kind][pos]
+        if games == MISSING_GAMES:
+            return None
+        return {
+            "games": games,
+            "pick_rate": self.table.pick_rate[kind][pos] / 100.0,
+            "win_rate": self.table.win_rate[kind][pos] / 100.0,
+        }
+
+    def entry(self, kind, champion_id, lane_idx, other_id, other_lane_idx):
+        """
+        a 파일에 기록된 b 항목을 {"games", "pick_rate", "win_rate"} 숫자 dict로 반환합니다.
+        항목이 없으면 None.
+        """
+        pos = self.offset(champion_id, lane_idx, other_id, other_lane_idx)
+        if pos is None:
+            return None
+        return self._entry_at(kind, pos)
+
+    def entry_pair(self, kind, champion_id, lane_idx, other_id, other_lane_idx):
+        """
+        (a 파일의 b 항목, b 파일의 a 항목)을 함께 반환합니다. 없는 쪽은 None.
+        """
+        pos = self.offset(champion_id, lane_idx, other_id, other_lane_idx)
+        if pos is None:
+            return None, self.entry(kind, other_id, other_lane_idx, champion_id, lane_idx)
+        reverse = self.reverse_offset[pos]
+        return self._entry_at(kind, pos), (self._entry_at(kind, reverse) if reverse >= 0 else None)
+
+    def iter_lane_pairs(self, kind, champion_id, lane_idx, other_lane_idx):
+        """
+        a 파일의 other_lane 목록을 (other_id, a 파일의 항목, other 파일의 a 항목) 형태로 순회합니다.
+        반대 방향 항목은 역방향 인덱스로 바로 찾습니다.
+        """
+        row = self.row_index(champion_id, lane_idx)
+        if row < 0 or other_lane_idx is None:
+            return
+        base = row * self.table.row_stride + other_lane_idx
+        games = self.table.games[kind]
+        reverse_offset = self.reverse_offset
+        for column, other_id in enumerate(self.column_champion):
+            if other_id is None:
+                continue
+            pos = base + column * LANE_COUNT
+            if games[pos] == MISSING_GAMES:
+                continue
+            reverse = reverse_offset[pos]
+            yield other_id, self._entry_at(kind, pos), (self._entry_at(kind, reverse) if reverse >= 0 else None)
+
+    def iter_lane_entries(self, kind, champion_id, lane_idx, other_lane_idx):
+        """a 파일의 other_lane 목록을 (other_id, entry) 형태로 순회합니다."""
+        row = self.row_index(champion_id, lane_idx)
+        if row < 0 or other_lane_idx is None:
+            return
+        base = row * self.table.row_stride + other_lane_idx
+        games = self.table.games[kind]
+        for column, other_id in enumerate(self.column_champion):
+            if other_id is None:
+                continue
+            pos = base + column * LANE_COUNT
+            if games[pos] == MISSING_GAMES:
+                continue
+            yield other_id, self._entry_at(kind, pos)
+
+    def lane_games_total(self, kind, champion_id, lane_idx, other_lane_indices=None):
+        """a 파일에서 지정한 상대 라인들(기본: 전체)의 games 합계. 파일이 없으면 None."""
+        row = self.row_index(champion_id, lane_idx)
+        if row < 0:
+            return None
+        if other_lane_indices is None:
+            other_lane_indices = range(LANE_COUNT)
+        stride = self.table.row_stride
+        games = self.table.games[kind]
+        total = 0
+        for other_lane_idx in other_lane_indices:
+            start = row * stride + other_lane_idx
+            total += sum(value for value in games[start:start + stride:LANE_COUNT] if value > 0)
+        return total
+
+    def lane_dataset(self, kind, champion_id, lane_idx):
+        """
+        a 파일의 kind 데이터를 {상대 라인: {Name: 숫자 항목}} 형태로 만듭니다.
+        (필요한 파일 하나만 배열에서 읽어 dict로 만듭니다)
+        항목이 하나도 없으면 None.
+        """
+        row = self.row_index(champion_id, lane_idx)
+        if row < 0:
+            return None
+        table = self.table
+        pick_key = PICK_RATE_KEYS[kind]
+        games, pick_rate, win_rate = table.games[kind], table.pick_rate[kind], table.win_rate[kind]
+        dataset = {lane: {} for lane in LANES}
+        has_entries = False
+        for other_lane_idx, other_lane in enumerate(LANES):
+            start = row * table.row_stride + other_lane_idx
+            lane_games = games[start:start + table.row_stride:LANE_COUNT]
+            for column, value in enumerate(lane_games):
+                if value == MISSING_GAMES:
+                    continue
+                pos = start + column * LANE_COUNT
+                name = table.columns[column]
+                win_rate_centi = win_rate[pos]
+                entry = {
+                    "Name": name,
+                    "games": value,
+                    pick_key: pick_rate[pos] / 100.0,
+                    "win_rate": win_rate_centi / 100.0,
+                }
+                if kind == KIND_COUNTER:
+                    entry["win_rate_diff"] = (win_rate_centi - 5000) / 100.0
+                dataset[other_lane][name] = entry
+                has_entries = True
+        return dataset if has_entries else None
+
+
+def compile_matchup_tensor(payloads, resolve_name) -> MatchupTensor:
+    """
+    {파일명: JSON payload} 묶음을 MatchupTensor로 컴파일합니다.
+    resolve_name: 데이터의 챔피언 이름(파일명 stem, "Name")을 canonical 이름으로 바꾸는 함수.
+    """
+    return MatchupTensor(compile_matchup_table(payloads), resolve_name)
+
+
+def choose_matchup_source(entry_a, entry_b, min_games, pick_rate_override):
+    """
+    양방향 항목 중 점수에 쓸 쪽을 고릅니다. 'a', 'b' 또는 None.
+
+    min_games 이상이거나 pick_rate_override 이상이면 유효한 항목이며,
+    둘 다 유효하면 games가 많은 쪽(같으면 a), 하나만 유효하면 그쪽,
+    둘 다 유효하지 않으면 있는 쪽(a 우선)을 씁니다.
+    """
+    is_valid_a = bool(entry_a) and (entry_a["games"] >= min_games or entry_a["pick_rate"] >= pick_rate_override)
+    is_valid_b = bool(entry_b) and (entry_b["games"] >= min_games or entry_b["pick_rate"] >= pick_rate_override)
+    if is_valid_a and is_valid_b:
+        return "a" if entry_a["games"] >= entry_b["games"] else "b"
+    if is_valid_a:
+        return "a"
+    if is_valid_b:
+        return "b"
+    if entry_a:
+        return "a"
+    if entry_b:
+        return "b"
+    return None
+
+
+# MatchupDecisions 배열 값
+SOURCE_NONE = 0
+SOURCE_A = 1
+SOURCE_B = 2
+FLAG_INCLUDE = 1
+FLAG_LOW_SAMPLE = 2
+FLAG_HIGH_SAMPLE = 4
+# 선택된 항목 기준 a 쪽 승률이 50% 이상 (카운터의 "올카운터" 판정용)
+FLAG_A_WINS = 8
+
+
+class MatchupDecisions:
+    """
+    임계값(min_games, pick_rate_override) 하나에 대한 칸별 a/b 선택 결과 표.
+
+    칸 위치는 MatchupTensor와 같습니다. (a, la) 파일의 (b, lb) 칸이 entry_a,
+    역방향 칸이 entry_b이며, 칸마다 선택한 쪽, 내 관점 승률(카운터에서 a를 쓰면 100 - 승률),
+    표본 플래그를 저장합니다. 임계값이 바뀌면 새로 만들어야 합니다.
+
+    표는 (kind, 행, 상대 라인) 구간 단위로 처음 조회할 때 계산합니다. 임계값을 바꿀 때마다 전체 칸을
+    훑지 않고, mmap 위의 테이블이면 조회한 구간의 페이지만 읽습니다.
+    """
+
+    def __init__(self, tensor, min_games, pick_rate_override, high_sample_threshold):
+        self.tensor = tensor
+        self.min_games = min_games
+        self.pick_rate_override = pick_rate_override
+        self.high_sample_threshold = high_sample_threshold
+        # (kind, 행, 상대 라인) → (source, flags, score) 열 축 배열, _segment 참고
+        self._segments = {}
+        # (kind, 행, 상대 라인) → 후보 축 배열, lane_batch 참고
+        self._batches = {}
+
+    def _segment(self, kind, row, other_lane_idx):
+        """a 파일 한 행의 상대 라인 구간을 열 축 배열 (source, flags, score)로 계산해 캐시합니다."""
+        key = (kind, row, other_lane_idx)
+        segment = self._segments.get(key)
+        if segment is not None:
+            return segment
+        table = self.tensor.table
+        games, pick_rate, win_rate = table.games[kind], table.pick_rate[kind], table.win_rate[kind]
+        reverse_offset = self.tensor.reverse_offset
+        min_games, pick_rate_override = self.min_games, self.pick_rate_override
+        high_sample_threshold = self.high_sample_threshold
+        invert = kind == KIND_COUNTER
+
+        column_count = len(table.columns)
+        start = row * table.row_stride + other_lane_idx
+        source = bytearray(column_count)
+        flags = bytearray(column_count)
+        score = array(RATE_TYPECODE, bytes(column_count * array(RATE_TYPECODE).itemsize))
+        for column in range(column_count):
+            pos = start + column * LANE_COUNT
+            games_a = games[pos]
+            reverse = reverse_offset[pos]
+            games_b = games[reverse] if reverse >= 0 else MISSING_GAMES
+            has_a = games_a != MISSING_GAMES
+            has_b = games_b != MISSING_GAMES
+            if not has_a and not has_b:
+                continue
+            # choose_matchup_source와 같은 규칙 (픽률 비교도 float 값으로 동일하게)
+            is_valid_a = has_a and (games_a >= min_games or pick_rate[pos] / 100.0 >= pick_rate_override)
+            is_valid_b = has_b and (games_b >= min_games or pick_rate[reverse] / 100.0 >= pick_rate_override)
+            if is_valid_a and is_valid_b:
+                use_a = games_a >= games_b
+            elif is_valid_a or is_valid_b:
+                use_a = is_valid_a
+            else:
+                use_a = has_a
+            chosen = pos if use_a else reverse
+            chosen_games = games[chosen]
+            meets_games = chosen_games >= min_games
+            cell_flags = 0
+            if meets_games or pick_rate[chosen] / 100.0 >= pick_rate_override:
+                cell_flags |= FLAG_INCLUDE
+            if not meets_games:
+                cell_flags |= FLAG_LOW_SAMPLE
+            if chosen_games >= high_sample_threshold:
+                cell_flags |= FLAG_HIGH_SAMPLE
+            if (win_rate[chosen] >= 5000) if use_a else (win_rate[chosen] <= 5000):
+                cell_flags |= FLAG_A_WINS
+            source[column] = SOURCE_A if use_a else SOURCE_B
+            flags[column] = cell_flags
+            score[column] = 10000 - win_rate[chosen] if (invert and use_a) else win_rate[chosen]
+        segment = (source, flags, score)
+        self._segments[key] = segment
+        return segment
+
+    def _cell(self, kind, pos):
+        """배열 위치의 (source, flags, score centi)."""
+        row, remainder = divmod(pos, self.tensor.table.row_stride)
+        column, other_lane_idx = divmod(remainder, LANE_COUNT)
+        source, flags, score = self._segment(kind, row, other_lane_idx)
+        return source[column], flags[column], score[column]
+
+    def matches(self, tensor, min_games, pick_rate_override) -> bool:
+        return self.tensor is tensor and self.min_games == min_games and self.pick_rate_override == pick_rate_override
+
+    def _decision_at(self, kind, pos):
+        source, cell_flags, score = self._cell(kind, pos)
+        if source == SOURCE_NONE:
+            return None
+        chosen = pos if source == SOURCE_A else self.tensor.reverse_offset[pos]
+        return {
+            "source": "a" if source == SOURCE_A else "b",
+            "entry": self.tensor._entry_at(kind, chosen),
+            "score": score / 100.0,
+            "include": bool(cell_flags & FLAG_INCLUDE),
+            "low_sample": bool(cell_flags & FLAG_LOW_SAMPLE),
+            "high_sample": bool(cell_flags & FLAG_HIGH_SAMPLE),
+        }
+
+    def _decide(self, kind, entry_a, entry_b):
+        # 표에 칸이 없는 경우(a 파일이 없음)에만 쓰는 같은 규칙의 계산
+        use_source = choose_matchup_source(entry_a, entry_b, self.min_games, self.pick_rate_override)
+        if use_source is None:
+            return None
+        entry = entry_a if use_source == "a" else entry_b
+        meets_games = entry["games"] >= self.min_games
+        win_rate_value = entry["win_rate"]
+        if kind == KIND_COUNTER and use_source == "a":
+            win_rate_value = (10000 - round(win_rate_value * 100)) / 100.0
+        return {
+            "source": use_source,
+            "entry": entry,
+            "score": win_rate_value,
+            "include": meets_games or entry["pick_rate"] >= self.pick_rate_override,
+            "low_sample": not meets_games,
+            "high_sample": entry["games"] >= self.high_sample_threshold,
+        }
+
+    def decision(self, kind, champion_id, lane_idx, other_id, other_lane_idx):
+        """
+        entry_a = (a 파일의 b 항목), entry_b = (b 파일의 a 항목) 중 선택 결과.
+        {"source", "entry", "score", "include", "low_sample", "high_sample"} 또는 None.
+        score는 b 관점 승률입니다 (카운터에서 a 쪽 항목이면 100 - 승률).
+        """
+        pos = self.tensor.offset(champion_id, lane_idx, other_id, other_lane_idx)
+        if pos is not None:
+            return self._decision_at(kind, pos)
+        entry_a, entry_b = self.tensor.entry_pair(kind, champion_id, lane_idx, other_id, other_lane_idx)
+        return self._decide(kind, entry_a, entry_b)
+
+    def included_score(self, kind, champion_id, lane_idx, other_id, other_lane_idx):
+        """decision()이 점수에 반영되는 경우의 score만 반환합니다 (dict를 만들지 않음). 아니면 None."""
+        pos = self.tensor.offset(champion_id, lane_idx, other_id, other_lane_idx)
+        if pos is not None:
+            source, cell_flags, score = self._cell(kind, pos)
+            if source == SOURCE_NONE or not cell_flags & FLAG_INCLUDE:
+                return None
+            return score / 100.0
+        entry_a, entry_b = self.tensor.entry_pair(kind, champion_id, lane_idx, other_id, other_lane_idx)
+        decision = self._decide(kind, entry_a, entry_b)
+        if decision is None or not decision["include"]:
+            return None
+        return decision["score"]
+
+    def listed_decision(self, kind, champion_id, lane_idx, other_id, other_lane_idx):
+        """decision()과 같지만 a 파일에 b 항목이 있는 경우에만 반환합니다."""
+        pos = self.tensor.offset(champion_id, lane_idx, other_id, other_lane_idx)
+        if pos is None or self.tensor.table.games[kind][pos] == MISSING_GAMES:
+            return None
+        return self._decision_at(kind, pos)
+
+    def lane_batch(self, kind, champion_id, lane_idx, other_lane_idx):
+        """
+        a 파일의 other_lane 목록을 후보 축 배열 (후보 ID, 점수, 플래그) 튜플 세 개로 반환합니다.
+        점수는 선택된 항목의 b 관점 승률이며, 행/라인마다 한 번만 만들어 캐시합니다.
+        """
+        row = self.tensor.row_index(champion_id, lane_idx)
+        if row < 0 or other_lane_idx is None:
+            return (), (), ()
+        key = (kind, row, other_lane_idx)
+        batch = self._batches.get(key)
+        if batch is None:
+            stride = self.tensor.table.row_stride
+            start = row * stride + other_lane_idx
+            # 열 축 구간에서 항목이 있는 칸만 남김
+            sources, flags, scores = self._segment(kind, row, other_lane_idx)
+            games = self.tensor.table.games[kind][start:start + stride:LANE_COUNT]
+            columns = [
+                column for column, other_id in enumerate(self.tensor.column_champion)
+                if other_id is not None and games[column] != MISSING_GAMES and sources[column] != SOURCE_NONE
+            ]
+            batch = (
+                tuple(self.tensor.column_champion[column] for column in columns),
+                tuple(scores[column] / 100.0 for column in columns),
+                tuple(flags[column] for column in columns),
+            )
+            self._batches[key] = batch
+        return batch
+
+    def iter_lane_decisions(self, kind, champion_id, lane_idx, other_lane_idx):
+        """a 파일의 other_lane 목록을 (other_id, decision) 형태로 순회합니다."""
+        row = self.tensor.row_index(champion_id, lane_idx)
+        if row < 0 or other_lane_idx is None:
+            return
+        base = row * self.tensor.table.row_stride + other_lane_idx
+        games = self.tensor.table.games[kind]
+        for column, other_id in enumerate(self.tensor.column_champion):
+            if other_id is None:
+                continue
+            pos = base + column * LANE_COUNT
+            if games[pos] == MISSING_GAMES:
+                continue
+            yield other_id, self._decision_at(kind, pos)
@@ -1,8 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
-import json
 from pathlib import Path
 from common import LANES
+from matchup_tensor import KIND_SYNERGY, LANE_INDEX
 
 HIGHLIGHT_WIN_RATE = 54.0
 HIGHLIGHT_PICK_RATE = 2.0
@@ -130,7 +130,8 @@ class OpDuosTab:
 
     def load_synergy_highlights(self, pick_threshold, games_threshold):
         highlights = []
-        if not self.data_dir.exists():
+        tensor = self.app.matchup_tensor
+        if not len(tensor):
             return highlights
 
         my_lane = self.my_lane_var.get() if hasattr(self, "my_lane_var") else "bottom"
@@ -144,18 +145,14 @@ class OpDuosTab:
         if my_lane == partner_lane:
             return highlights
 
+        my_lane_idx = LANE_INDEX[my_lane]
+        partner_lane_idx = LANE_INDEX[partner_lane]
+
         # 나의 라인에 해당하는 데이터 파일 찾기
-        lane_file_pattern = f"*_{my_lane}.json"
-        for path in self.data_dir.glob(lane_file_pattern):
-            try:
-                with path.open("r", encoding="utf-8") as file:
-                    payload = json.load(file)
-            except (IOError, json.JSONDecodeError):
+        for champion_id in range(len(tensor)):
+            stem = tensor.data_stem(champion_id, my_lane_idx)
+            if stem is None:
                 continue
-
-            stem = path.stem
-            if stem.endswith(f"_{my_lane}"):
-                stem = stem[:-(len(my_lane) + 1)]
                 
             # Accessing app method
             if self.app.is_champion_ignored(stem):
@@ -164,21 +161,17 @@ class OpDuosTab:
             # Accessing app method
             my_champ_name = self.app.format_display_name(stem)
 
-            # 함께할 라인의 시너지 데이터 가져오기
-            partner_entries = payload.get("synergy", {}).get(partner_lane, {})
-            for entry in partner_entries.values():
-                partner_name = entry.get("Name") or entry.get("name")
-                if not partner_name:
-                    continue
+            # 함께할 라인의 시너지 데이터 가져오기 (매핑된 숫자 배열에서 바로 읽음)
+            for partner_id, entry in tensor.iter_lane_entries(KIND_SYNERGY, champion_id, my_lane_idx, partner_lane_idx):
+                partner_name = tensor.data_names[partner_id]
                     
                 # Accessing app method
                 if self.app.is_champion_ignored(partner_name):
                     continue
                 
-                # Accessing app static methods (or methods)
-                win_rate = self.app.parse_float(str(entry.get("win_rate", "")).replace("%", ""))
-                pick_rate = self.app.parse_float(str(entry.get("pick_rate", "")).replace("%", ""))
-                games = self.app.parse_int(entry.get("games"))
+                win_rate = entry["win_rate"]
+                pick_rate = entry["pick_rate"]
+                games = entry["games"]
 
                 if win_rate < HIGHLIGHT_WIN_RATE or pick_rate < pick_threshold or games < games_threshold:
                     continue
@@ -6,7 +6,7 @@ New-Item -ItemType Directory -Force -Path $releaseDir | Out-Null
 
 Write-Host "Copying files..."
 Copy-Item "dist/TtimoTtabbong_$version.exe" -Destination $releaseDir
-Copy-Item "data" -Destination $releaseDir -Recurse
+Copy-Item "champion_data.bundle" -Destination $releaseDir
 Copy-Item "ignored_champions.json" -Destination $releaseDir
 Copy-Item "ui_settings.json" -Destination $releaseDir
 Copy-Item "credits.json" -Destination $releaseDir
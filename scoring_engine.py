@@ -0,0 +1,630 @@
+"""
+Tkinter와 무관한 밴픽 점수 계산 엔진.
+
+GUI는 새로 고칠 때마다 위젯 상태를 DraftState 하나로 한 번만 읽어 넘기고,
+ScoringEngine은 매치업 텐서와 DraftState만으로 슬롯 점수, 추천 목록, 태그/설명을 계산합니다.
+(디스플레이 없이 프로파일링/벤치마크 가능)
+"""
+
+import heapq
+from dataclasses import dataclass, replace
+from operator import itemgetter
+
+from common import LANES, WARNING_ICON
+from matchup_tensor import (
+    FLAG_A_WINS,
+    FLAG_HIGH_SAMPLE,
+    FLAG_INCLUDE,
+    FLAG_LOW_SAMPLE,
+    KIND_COUNTER,
+    KIND_SYNERGY,
+    LANE_INDEX,
+    MatchupDecisions,
+)
+
+BANPICK_HIGH_SAMPLE_THRESHOLD = 10000
+BANPICK_PRE_PICK_POPULARITY_THRESHOLD = 1.5
+SYNERGY_OP_THRESHOLD = 55.0
+
+RECOMMEND_LOW_SAMPLE_TAG = "데이터 부족"
+RECOMMEND_HIGH_SAMPLE_TAG = "신뢰도 높음"
+RECOMMEND_FULL_COUNTER_TAG = "올카운터"
+RECOMMEND_OP_SYNERGY_TAG = "OP 시너지"
+RECOMMEND_PRE_PICK_TAG = "선픽 카드"
+
+SIDE_KEYS = ("allies", "enemies")
+
+# 추천 항목별 상태 비트 (RecommendationState.flag_counts 키)
+_LOW_SAMPLE = 2
+_NOT_HIGH_SAMPLE = 4
+_OP_SYNERGY = 8
+_COUNTER_LOST = 16
+
+# 추천 순위 비교 키 (총점)
+_score_key = itemgetter(0)
+
+
+@dataclass(frozen=True)
+class SlotState:
+    """밴픽 슬롯 하나의 상태 (위젯 값 스냅샷)."""
+    side: str
+    index: int
+    canonical_name: str | None = None
+    display_name: str | None = None
+    selected_lane: str | None = None
+    # 라인 콤보박스에 보이는 값 (소문자). 추천 대상 슬롯을 찾을 때 사용
+    lane_choice: str | None = None
+    excluded: bool = False
+
+
+@dataclass(frozen=True)
+class DraftState:
+    """
+    점수 계산에 필요한 밴픽 상태 전체.
+    lane_weights: {"counter": 5×5, "synergy": 5×5} (build_lane_weight_matrices 결과)
+    banned/ignored: 소문자 챔피언 이름 집합
+    """
+    allies: tuple = ()
+    enemies: tuple = ()
+    my_lane: str | None = None
+    banned: frozenset = frozenset()
+    ignored: frozenset = frozenset()
+    min_games: int = 0
+    pick_rate_override: float = 0.0
+    lane_weights: dict | None = None
+
+    def side(self, side_key):
+        return self.allies if side_key == "allies" else self.enemies
+
+    def slots(self):
+        return self.allies + self.enemies
+
+    def score_signature(self):
+        """슬롯 점수에 영향을 주는 값만 모은 해시 가능한 키 (가중치 행렬은 객체 자체로 구분)."""
+        return (self.allies, self.enemies, self.min_games, self.pick_rate_override)
+
+
+def empty_score_details():
+    return {
+        "synergy_entries": [],  # [(champion_name, lane, win_rate, weight, weighted_score)]
+        "counter_entries": [],  # [(champion_name, lane, win_rate, counter_score, weight, weighted_score)]
+        "excluded_synergy": [], # [(champion_name, lane, games, pick_rate, win_rate)]
+        "excluded_counter": [], # [(champion_name, lane, games, pick_rate, win_rate)]
+        "synergy_score": 0.0,
+        "counter_score": 0.0,
+        "synergy_weight_sum": 0.0,
+        "counter_weight_sum": 0.0,
+        "total_score": 0.0
+    }
+
+
+class SlotContribution:
+    """슬롯 하나가 후보 축에 더하는 값 (RecommendationState가 보관)."""
+
+    __slots__ = ("signature", "kind", "source_name", "slot_id", "slot_lane_idx", "weight", "touched", "included")
+
+    def __init__(self, signature, kind, source_name, slot_id, slot_lane_idx, weight):
+        self.signature = signature
+        self.kind = kind
+        self.source_name = source_name
+        self.slot_id = slot_id
+        self.slot_lane_idx = slot_lane_idx
+        self.weight = weight
+        # 추천 목록에 등장하는 후보 (등장 순서용)
+        self.touched = []
+        # 점수에 반영되는 항목 [(후보 ID, 점수 × 가중치, 상태 비트)]
+        self.included = []
+
+
+class RecommendationState:
+    """
+    내 라인 추천용 누적 상태.
+
+    슬롯별 기여를 보관하고, 슬롯이 바뀌면 이전 기여를 빼고 새 기여만 더합니다.
+    임계값(a/b 선택 표), 내 라인, 가중치가 바뀌면 새 상태를 만들어 전체를 다시 계산합니다.
+    """
+
+    def __init__(self, tensor, decisions, target_lane_idx, synergy_weights, counter_weights):
+        self.tensor = tensor
+        self.decisions = decisions
+        self.target_lane_idx = target_lane_idx
+        self.weights = {KIND_SYNERGY: tuple(synergy_weights), KIND_COUNTER: tuple(counter_weights)}
+        count = tensor.champion_count
+        self.sums = {kind: [0.0] * count for kind in (KIND_SYNERGY, KIND_COUNTER)}
+        self.weight_sums = {kind: [0.0] * count for kind in (KIND_SYNERGY, KIND_COUNTER)}  # 가중치 합 (정규화용)
+        # 반영된 항목 수 (0이 되면 합계를 정확히 0으로 되돌림)
+        self.included_counts = {kind: [0] * count for kind in (KIND_SYNERGY, KIND_COUNTER)}
+        # 상태 비트별 항목 수 (OR 플래그를 빼기 위해 개수로 관리)
+        self.flag_counts = {bit: [0] * count for bit in (_LOW_SAMPLE, _NOT_HIGH_SAMPLE, _OP_SYNERGY, _COUNTER_LOST)}
+        self.contributions = {}
+        # 마지막 sync에서 다시 계산한 슬롯 수
+        self.changed_slots = 0
+
+    def matches(self, tensor, decisions, target_lane_idx, synergy_weights, counter_weights) -> bool:
+        return (
+            self.tensor is tensor
+            and self.decisions is decisions
+            and self.target_lane_idx == target_lane_idx
+            and self.weights[KIND_SYNERGY] == tuple(synergy_weights)
+            and self.weights[KIND_COUNTER] == tuple(counter_weights)
+        )
+
+    def sync(self, draft: DraftState):
+        """draft의 슬롯 중 바뀐 슬롯만 다시 계산합니다. (아군 → 시너지, 상대 → 카운터)"""
+        self.changed_slots = 0
+        for side_key, kind in (("allies", KIND_SYNERGY), ("enemies", KIND_COUNTER)):
+            for slot in draft.side(side_key):
+                self._sync_slot(kind, slot)
+
+    def _sync_slot(self, kind, slot: SlotState):
+        key = (slot.side, slot.index)
+        slot_id = None if slot.excluded else self.tensor.champion_id(slot.canonical_name)
+        slot_lane_idx = LANE_INDEX.get(slot.selected_lane)
+        signature = (kind, slot_id, slot_lane_idx)
+        source_name = slot.display_name or slot.canonical_name or "Unknown"
+        previous = self.contributions.get(key)
+        if previous is not None and previous.signature == signature:
+            previous.source_name = source_name
+            return
+        if previous is not None:
+            self._apply(previous, -1)
+        contribution = self._build(signature, source_name)
+        self._apply(contribution, 1)
+        self.contributions[key] = contribution
+        self.changed_slots += 1
+
+    def _build(self, signature, source_name):
+        kind, slot_id, slot_lane_idx = signature
+        weight = self.weights[kind][slot_lane_idx] if slot_lane_idx is not None else 0.0
+        contribution = SlotContribution(signature, kind, source_name, slot_id, slot_lane_idx, weight)
+        if slot_id is None:
+            return contribution
+        candidate_ids, scores, flags = self.decisions.lane_batch(kind, slot_id, slot_lane_idx, self.target_lane_idx)
+        is_counter = kind == KIND_COUNTER
+        touched = contribution.touched
+        included = contribution.included
+        for candidate_id, score, cell_flags in zip(candidate_ids, scores, flags):
+            if not cell_flags & FLAG_INCLUDE:
+                # 제외 표시만 붙는 후보
+                touched.append(candidate_id)
+                continue
+            if weight <= 0:
+                continue
+            touched.append(candidate_id)
+            bits = 0
+            if cell_flags & FLAG_LOW_SAMPLE:
+                bits |= _LOW_SAMPLE
+            if not cell_flags & FLAG_HIGH_SAMPLE:
+                bits |= _NOT_HIGH_SAMPLE
+            if is_counter:
+                # 상대(a) 승률이 50% 이상이면 "올카운터" 아님
+                if cell_flags & FLAG_A_WINS:
+                    bits |= _COUNTER_LOST
+            elif score >= SYNERGY_OP_THRESHOLD:
+                bits |= _OP_SYNERGY
+            included.append((candidate_id, score * weight, bits))
+        return contribution
+
+    def _apply(self, contribution, sign):
+        kind = contribution.kind
+        sums = self.sums[kind]
+        weight_sums = self.weight_sums[kind]
+        included_counts = self.included_counts[kind]
+        signed_weight = sign * contribution.weight
+        for candidate_id, weighted, bits in contribution.included:
+            included_counts[candidate_id] += sign
+            if included_counts[candidate_id]:
+                sums[candidate_id] += sign * weighted
+                weight_sums[candidate_id] += signed_weight
+            else:
+                sums[candidate_id] = 0.0
+                weight_sums[candidate_id] = 0.0
+            if bits:
+                for bit, counts in self.flag_counts.items():
+                    if bits & bit:
+                        counts[candidate_id] += sign
+
+    def ordered_contributions(self, draft: DraftState):
+        """슬롯 순서(아군 → 상대)대로 기여를 반환합니다."""
+        ordered = []
+        for side_key in ("allies", "enemies"):
+            for slot in draft.side(side_key):
+                contribution = self.contributions.get((slot.side, slot.index))
+                if contribution is not None:
+                    ordered.append(contribution)
+        return ordered
+
+    def candidate_order(self, contributions):
+        """후보가 처음 등장한 순서 (같은 점수일 때 정렬 순서를 유지하기 위함)."""
+        seen = set()
+        order = []
+        for contribution in contributions:
+            for candidate_id in contribution.touched:
+                if candidate_id not in seen:
+                    seen.add(candidate_id)
+                    order.append(candidate_id)
+        return order
+
+
+class ScoringEngine:
+    """
+    매치업 텐서 하나에 묶인 점수 계산기.
+    champion_id_for_name: 슬롯/밴/무시 목록의 이름을 텐서 ID로 바꾸는 함수 (기본: tensor.lookup_id)
+    """
+
+    def __init__(self, tensor, champion_id_for_name=None):
+        self.tensor = tensor
+        self.champion_id_for_name = champion_id_for_name or tensor.lookup_id
+        self._decisions = None
+        # (챔피언 ID, 라인) → 선픽 카드 여부 (텐서에만 의존하므로 엔진 수명 동안 유지)
+        self._pre_pick_cache = {}
+        # 라인 인덱스 → 추천 누적 상태 (recommendation_state 참고, 라인마다 따로 유지)
+        self._recommendation_states = {}
+        # 현재 draft 상태의 슬롯 점수 캐시: (side, index, target_lane) → (total_score, details)
+        self._score_cache = {}
+        self._score_cache_draft = None
+        self._score_cache_key = None
+
+    def decisions(self, min_games, pick_rate_override):
+        """임계값이 바뀐 경우에만 a/b 선택 표를 다시 계산합니다."""
+        decisions = self._decisions
+        if decisions is None or not decisions.matches(self.tensor, min_games, pick_rate_override):
+            decisions = MatchupDecisions(self.tensor, min_games, pick_rate_override, BANPICK_HIGH_SAMPLE_THRESHOLD)
+            self._decisions = decisions
+        return decisions
+
+    def champion_ids(self, names) -> set:
+        ids = set()
+        for name in names:
+            champion_id = self.champion_id_for_name(name) if name else None
+            if champion_id is not None:
+                ids.add(champion_id)
+        return ids
+
+    def score_slot(self, draft: DraftState, slot: SlotState, target_lane=None):
+        """
+        슬롯 점수와 상세 정보 (total_score, details)를 반환합니다.
+        slot은 draft에 들어 있는 SlotState 객체여야 합니다 (같은 팀에서 자기 자신을 건너뛰기 위함).
+
+        결과는 draft 상태(슬롯/임계값 + 가중치 행렬)별로 캐시되어 슬롯 표시, 팀 조합 점수,
+        툴팁이 같은 값을 공유합니다. 반환된 details는 수정하지 마세요.
+        """
+        cache = self._score_cache_for(draft)
+        key = (slot.side, slot.index, target_lane)
+        result = cache.get(key)
+        if result is None:
+            result = self.compute_slot_score(draft, slot, target_lane)
+            cache[key] = result
+        return result
+
+    def _score_cache_for(self, draft: DraftState):
+        """draft 상태가 바뀐 경우에만 슬롯 점수 캐시를 비웁니다."""
+        if draft is self._score_cache_draft:
+            return self._score_cache
+        key = (draft.score_signature(), draft.lane_weights)
+        previous = self._score_cache_key
+        if previous is None or previous[1] is not draft.lane_weights or previous[0] != key[0]:
+            self._score_cache = {}
+            self._score_cache_key = key
+        self._score_cache_draft = draft
+        return self._score_cache
+
+    def compute_slot_score(self, draft: DraftState, slot: SlotState, target_lane=None):
+        """score_slot과 같은 계산이지만 캐시를 거치지 않습니다 (가상의 draft 평가용)."""
+        details = empty_score_details()
+
+        if not slot.canonical_name or not slot.selected_lane:
+            return 0.0, details
+        if slot.excluded:
+            return 0.0, details
+
+        opponent_side = "enemies" if slot.side == "allies" else "allies"
+        champion_lane = target_lane if target_lane else slot.selected_lane
+
+        tensor = self.tensor
+        my_id = self.champion_id_for_name(slot.canonical_name)
+        my_lane_idx = LANE_INDEX.get(champion_lane)
+        # 데이터 파일이 없는 (챔피언, 라인)은 0점
+        if my_lane_idx is None or not tensor.has_data(my_id, my_lane_idx):
+            return 0.0, details
+
+        synergy_sum = 0.0
+        synergy_weight_sum = 0.0  # 가중치 합 (정규화용)
+        counter_sum = 0.0
+        counter_weight_sum = 0.0  # 가중치 합 (정규화용)
+
+        # a/b 선택 결과는 임계값별로 미리 계산된 표에서 읽음
+        decisions = self.decisions(draft.min_games, draft.pick_rate_override)
+        # 내 라인 기준 가중치 행 (인덱스: 아군/상대 라인)
+        synergy_weights = draft.lane_weights["synergy"][my_lane_idx]
+        counter_weights = draft.lane_weights["counter"][my_lane_idx]
+
+        # 시너지 점수 계산 (같은 팀)
+        for friend in draft.side(slot.side):
+            if friend is slot:
+                continue
+            if friend.excluded:
+                continue
+
+            source_lane = friend.selected_lane
+            friend_name = friend.display_name or friend.canonical_name or "Unknown"
+            friend_id = tensor.champion_id(friend.canonical_name)
+            friend_lane_idx = LANE_INDEX.get(source_lane)
+
+            # 1. Look for ME in Friend's Dataset / 2. Look for Friend in MY Dataset
+            # 둘 중 선택된 항목 (기준: 최소 판수/픽률 충족 여부, 판수)
+            decision = decisions.decision(KIND_SYNERGY, friend_id, friend_lane_idx, my_id, my_lane_idx)
+            if not decision:
+                continue
+
+            final_entry = decision["entry"]
+            games = final_entry["games"]
+            pick_rate = final_entry["pick_rate"]
+            win_rate = decision["score"]
+
+            if not decision["include"]:
+                details["excluded_synergy"].append((friend_name, source_lane, games, pick_rate, win_rate))
+                continue
+
+            weight = synergy_weights[friend_lane_idx]
+            if weight <= 0:
+                continue
+
+            weighted_score = win_rate * weight
+            synergy_sum += weighted_score
+            synergy_weight_sum += weight
+            details["synergy_entries"].append((friend_name, source_lane, win_rate, weight, weighted_score))
+
+        # 카운터 점수 계산 (상대팀)
+        for enemy in draft.side(opponent_side):
+            if enemy.excluded:
+                continue
+
+            source_lane = enemy.selected_lane
+            enemy_name = enemy.display_name or enemy.canonical_name or "Unknown"
+            enemy_id = tensor.champion_id(enemy.canonical_name)
+            enemy_lane_idx = LANE_INDEX.get(source_lane)
+
+            # 1. Look for ME in Enemy's Dataset (Enemy vs Me) / 2. Look for Enemy in MY Dataset (Me vs Enemy)
+            decision = decisions.decision(KIND_COUNTER, enemy_id, enemy_lane_idx, my_id, my_lane_idx)
+            if not decision:
+                continue
+
+            final_entry = decision["entry"]
+            games = final_entry["games"]
+            pick_rate = final_entry["pick_rate"]
+            win_rate_raw = final_entry["win_rate"]
+            # Enemy vs Me(source 'a')이면 My Win Rate = 100 - EnemyWinRate, Me vs Enemy(source 'b')이면 그대로.
+            # 카운터 점수는 My Win Rate를 그대로 씀 (표에 미리 계산됨)
+            my_win_rate = decision["score"]
+
+            if not decision["include"]:
+                details["excluded_counter"].append((enemy_name, source_lane, games, pick_rate, my_win_rate))
+                continue
+
+            weight = counter_weights[enemy_lane_idx]
+            if weight <= 0:
+                continue
+
+            weighted_score = my_win_rate * weight
+            counter_sum += weighted_score
+            counter_weight_sum += weight
+            details["counter_entries"].append((enemy_name, source_lane, win_rate_raw, my_win_rate, weight, weighted_score))
+
+        # 가중치 합으로 나눠서 정규화 (라인 간 비교 가능하게)
+        synergy_score = synergy_sum / synergy_weight_sum if synergy_weight_sum > 0 else 0.0
+        counter_score = counter_sum / counter_weight_sum if counter_weight_sum > 0 else 0.0
+        total_score = synergy_score + counter_score
+
+        details["synergy_score"] = synergy_score
+        details["counter_score"] = counter_score
+        details["synergy_weight_sum"] = synergy_weight_sum
+        details["counter_weight_sum"] = counter_weight_sum
+        details["total_score"] = total_score
+
+        return total_score, details
+
+    def team_stats(self, draft: DraftState, side_key, use_cache=True):
+        """
+        팀 조합 점수 (total, avg, is_complete).
+        5개 슬롯 모두 유효 점수(>0)를 가진 경우에만 완성 상태로 보고 평균을 냅니다.
+        use_cache=False: 화면에 표시 중인 상태가 아닌 가상의 draft를 평가할 때 (점수 캐시 유지)
+        """
+        score_slot = self.score_slot if use_cache else self.compute_slot_score
+        slots = draft.side(side_key)
+        total = 0.0
+        valid_scores = []
+        for slot in slots:
+            if slot.canonical_name and slot.selected_lane:
+                score, _details = score_slot(draft, slot)
+                if score > 0:
+                    total += score
+                    valid_scores.append(score)
+        is_complete = len(slots) == 5 and len(valid_scores) == 5
+        avg = total / len(valid_scores) if is_complete and valid_scores else 0.0
+        return total, avg, is_complete
+
+    def target_slot(self, draft: DraftState):
+        """추천 대상 슬롯: 라인 선택이 내 라인과 같은 아군 슬롯."""
+        for slot in draft.allies:
+            if slot.lane_choice and slot.lane_choice == draft.my_lane:
+                return slot
+        return None
+
+    def recommendation_state(self, draft: DraftState):
+        """
+        draft에 맞게 동기화된 RecommendationState.
+        임계값/내 라인/가중치가 그대로면 바뀐 슬롯의 기여만 다시 계산합니다.
+        """
+        decisions = self.decisions(draft.min_games, draft.pick_rate_override)
+        target_lane_idx = LANE_INDEX[draft.my_lane]
+        # 내 라인 기준 가중치 행 (인덱스: 아군/상대 라인)
+        synergy_weights = draft.lane_weights["synergy"][target_lane_idx]
+        counter_weights = draft.lane_weights["counter"][target_lane_idx]
+        state = self._recommendation_states.get(target_lane_idx)
+        if state is None or not state.matches(self.tensor, decisions, target_lane_idx, synergy_weights, counter_weights):
+            state = RecommendationState(self.tensor, decisions, target_lane_idx, synergy_weights, counter_weights)
+            self._recommendation_states[target_lane_idx] = state
+        state.sync(draft)
+        return state
+
+    def recommend(self, draft: DraftState, limit=None):
+        """
+        내 라인 추천 목록을 점수순으로 반환합니다 (limit: 상위 몇 개까지, None이면 전부).
+        각 항목: (이름, 총점, 시너지 점수, 카운터 점수, 시너지 출처, 카운터 출처, 데이터 부족 여부, 태그)
+        """
+        rows, _candidate_count = self.recommend_page(draft, 0, limit)
+        return rows
+
+    def recommend_all_lanes(self, draft: DraftState, limit=None):
+        """
+        다섯 라인 각각을 내 라인으로 본 추천 목록을 한 번에 계산합니다. {라인: recommend() 결과}
+        라인마다 추천 대상 아군 슬롯(라인 선택값이 그 라인인 슬롯)이 없으면 빈 목록입니다.
+        라인별 누적 상태는 따로 유지되므로 슬롯 하나가 바뀌면 라인마다 그 슬롯의 기여만 다시 계산합니다.
+        """
+        return {lane: self.recommend(replace(draft, my_lane=lane), limit) for lane in LANES}
+
+    def recommend_page(self, draft: DraftState, offset=0, limit=None):
+        """
+        점수순 추천 목록 중 [offset, offset + limit) 구간과 전체 후보 수를 반환합니다.
+
+        슬롯별 기여는 후보 챔피언 ID를 축으로 하는 평평한 배열에 누적되어 있고
+        (RecommendationState), 선택/밴/무시 필터는 같은 축의 마스크로 적용합니다.
+        점수는 숫자로만 비교해 힙으로 상위 항목만 고르고,
+        출처/태그 문자열은 반환되는 행에 대해서만 만듭니다.
+        """
+        ranked = self._rank_candidates(draft)
+        if ranked is None:
+            return [], 0
+        state, scored = ranked
+        if limit is None:
+            top = sorted(scored, key=_score_key, reverse=True)
+        else:
+            # 힙 선택 (동점은 등장 순서 유지 = 정렬 후 자르기와 같은 결과)
+            top = heapq.nlargest(offset + limit, scored, key=_score_key)
+        rows = [self._recommendation_row(state, draft, item) for item in top[offset:]]
+        return rows, len(scored)
+
+    def _rank_candidates(self, draft: DraftState):
+        """(RecommendationState, [(총점, 후보 ID, 시너지 점수, 카운터 점수), ...]) 또는 None."""
+        my_lane = draft.my_lane
+        if not my_lane or my_lane not in LANES:
+            return None
+
+        target_slot = self.target_slot(draft)
+        if not target_slot:
+            return None
+
+        tensor = self.tensor
+        state = self.recommendation_state(draft)
+        target_lane_idx = state.target_lane_idx
+
+        # 추천에서 뺄 챔피언 (선택됨/밴/무시) 마스크
+        excluded = bytearray(tensor.champion_count)
+        excluded_names = list(draft.banned) + list(draft.ignored)
+        for slot in draft.slots():
+            # 내 라인(target_slot)에 있는 챔피언은 제외 목록에 넣지 않음
+            if slot is not target_slot:
+                excluded_names.extend((slot.display_name, slot.canonical_name))
+        for champion_id in self.champion_ids(excluded_names):
+            excluded[champion_id] = 1
+
+        synergy_sum, counter_sum = state.sums[KIND_SYNERGY], state.sums[KIND_COUNTER]
+        synergy_weight_sum, counter_weight_sum = state.weight_sums[KIND_SYNERGY], state.weight_sums[KIND_COUNTER]
+
+        scored = []
+        for candidate_id in state.candidate_order(state.ordered_contributions(draft)):
+            if excluded[candidate_id]:
+                continue
+            # 데이터 파일 존재 여부 확인 (추천 목록에서도 제외)
+            if not tensor.has_data(candidate_id, target_lane_idx):
+                continue
+
+            # 가중치 합으로 나눠서 정규화 (라인 간 비교 가능하게)
+            synergy_weight = synergy_weight_sum[candidate_id]
+            counter_weight = counter_weight_sum[candidate_id]
+            synergy_score = synergy_sum[candidate_id] / synergy_weight if synergy_weight > 0 else 0.0
+            counter_score = counter_sum[candidate_id] / counter_weight if counter_weight > 0 else 0.0
+            total = synergy_score + counter_score
+            if total == 0:
+                continue
+            scored.append((total, candidate_id, synergy_score, counter_score))
+        return state, scored
+
+    def _recommendation_row(self, state, draft: DraftState, item):
+        """힙에서 고른 항목 하나를 표시용 행으로 만듭니다 (태그/출처 문자열)."""
+        total, candidate_id, synergy_score, counter_score = item
+        synergy_weight = state.weight_sums[KIND_SYNERGY][candidate_id]
+        counter_weight = state.weight_sums[KIND_COUNTER][candidate_id]
+
+        has_low_sample = state.flag_counts[_LOW_SAMPLE][candidate_id] > 0
+        tags = []
+        if has_low_sample:
+            tags.append(RECOMMEND_LOW_SAMPLE_TAG)
+        if counter_weight > 0 and not state.flag_counts[_COUNTER_LOST][candidate_id]:
+            tags.append(RECOMMEND_FULL_COUNTER_TAG)
+        if not state.flag_counts[_NOT_HIGH_SAMPLE][candidate_id] and (synergy_weight > 0 or counter_weight > 0):
+            tags.append(RECOMMEND_HIGH_SAMPLE_TAG)
+        if state.flag_counts[_OP_SYNERGY][candidate_id]:
+            tags.append(RECOMMEND_OP_SYNERGY_TAG)
+        if self.qualifies_for_pre_pick(candidate_id, draft.my_lane):
+            tags.append(RECOMMEND_PRE_PICK_TAG)
+
+        synergy_sources, counter_sources = self._source_labels(
+            state.decisions, state.ordered_contributions(draft), candidate_id, state.target_lane_idx
+        )
+        return (
+            self.tensor.data_names[candidate_id],
+            total,
+            synergy_score,
+            counter_score,
+            synergy_sources,
+            counter_sources,
+            has_low_sample,
+            tags
+        )
+
+    @staticmethod
+    def _source_labels(decisions, contributions, candidate_id, target_lane_idx):
+        """후보 하나의 슬롯별 출처 문자열 (시너지 목록, 카운터 목록)."""
+        synergy_sources = []
+        counter_sources = []
+        for contribution in contributions:
+            if contribution.slot_id is None:
+                continue
+            decision = decisions.listed_decision(
+                contribution.kind, contribution.slot_id, contribution.slot_lane_idx, candidate_id, target_lane_idx
+            )
+            if decision is None:
+                continue
+            labels = counter_sources if contribution.kind == KIND_COUNTER else synergy_sources
+            if not decision["include"]:
+                entry = decision["entry"]
+                labels.append(f"{contribution.source_name}(제외: {entry['games']}판, {entry['pick_rate']:.1f}%)")
+                continue
+            if contribution.weight <= 0:
+                continue
+            label = f"{contribution.source_name}({decision['score']:.2f})"
+            if decision["low_sample"]:
+                label = f"{WARNING_ICON} {label}"
+            labels.append(label)
+        return synergy_sources, counter_sources
+
+    def qualifies_for_pre_pick(self, champion_id, lane) -> bool:
+        if champion_id is None or lane not in LANES:
+            return False
+        cache_key = (champion_id, lane)
+        if cache_key in self._pre_pick_cache:
+            return self._pre_pick_cache[cache_key]
+        lane_idx = LANE_INDEX[lane]
+        qualifies = False
+        # 같은 라인 카운터 항목 중 인기 있는 상대에게 모두 50% 이상이면 선픽 가능
+        for _other_id, details in self.tensor.iter_lane_entries(KIND_COUNTER, champion_id, lane_idx, lane_idx):
+            qualifies = True
+            if details["pick_rate"] <= BANPICK_PRE_PICK_POPULARITY_THRESHOLD:
+                continue
+            if details["win_rate"] < 50.0:
+                qualifies = False
+                break
+        self._pre_pick_cache[cache_key] = qualifies
+        return qualifies
@@ -9,6 +9,8 @@ import json
 import os
 import urllib3
 
+from champion_data import BUNDLE_FILENAME, SCHEMA_VERSION, SCHEMA_VERSION_KEY, pack_data_directory, to_float, to_int
+
 
 def load_champion_names():
     alias_file = os.path.join(os.path.dirname(__file__), "champion_aliases.json")
@@ -57,17 +59,15 @@ def format_data(element):
     img_elements = element.find_elements(By.TAG_NAME, 'img')
     img_alt = img_elements[0].get_attribute('alt') if img_elements else 'error'
 
-    try:
-        win_rate_value = float(text[0].replace('%', ''))
-        win_rate_diff = round(win_rate_value - 50, 2)
-    except (ValueError, IndexError):
-        win_rate_diff = 'N/A'
+    # schema v2: 숫자로 저장 (읽을 수 없는 값은 None)
+    win_rate = to_float(text[0]) if len(text) >= 1 else None
+    win_rate_diff = round(win_rate - 50, 2) if win_rate is not None else None
 
     return {
         "Name": img_alt,
-        "win_rate": text[0] if len(text) >= 1 else 'N/A',
-        "popularity": text[3] if len(text) >= 5 else 'N/A',
-        "games": text[4] if len(text) >= 5 else 'N/A',
+        "win_rate": win_rate,
+        "popularity": to_float(text[3]) if len(text) >= 5 else None,
+        "games": to_int(text[4]) if len(text) >= 5 else None,
         "win_rate_diff": win_rate_diff
     }
 
@@ -97,11 +97,11 @@ def format_synergy_data(element, debug=False):
             print("[synergy-parse] img missing")
         return {
             "Name": 'error',
-            "win_rate": 'N/A',
-            "delta_1": 'N/A',
-            "delta_2": 'N/A',
-            "pick_rate": 'N/A',
-            "games": 'N/A'
+            "win_rate": None,
+            "delta_1": None,
+            "delta_2": None,
+            "pick_rate": None,
+            "games": None
         }
 
     # 텍스트를 단순 split (format_data와 동일한 방식)
@@ -111,13 +111,14 @@ def format_synergy_data(element, debug=False):
         parts = []
 
     def pick(idx):
-        return parts[idx] if len(parts) > idx and parts[idx] else 'N/A'
+        return parts[idx] if len(parts) > idx and parts[idx] else None
 
-    win_rate = pick(0)
-    delta_1 = pick(1)
-    delta_2 = pick(2)
-    pick_rate = pick(3)
-    games = pick(4)
+    # schema v2: 숫자로 저장 (읽을 수 없는 값은 None)
+    win_rate = to_float(pick(0))
+    delta_1 = to_float(pick(1))
+    delta_2 = to_float(pick(2))
+    pick_rate = to_float(pick(3))
+    games = to_int(pick(4))
 
     if debug:
         print(f"[synergy-parse] alt={img_alt}, parts_len={len(parts)}")
@@ -305,6 +306,7 @@ def scrape_web(driver, url, current_lane):
 
     # Combine counter and synergy data
     result = {
+        SCHEMA_VERSION_KEY: SCHEMA_VERSION,
         "counters": lane_data,
         "synergy": synergy_data
     }
@@ -532,5 +534,9 @@ def main():
     print("Loaded champion list. Starting optimized scrape...")
     scrape_and_save_subset(champion_lane_list)
 
+    # 앱이 읽는 묶음 파일도 새 데이터로 갱신
+    packed = pack_data_directory('data', BUNDLE_FILENAME)
+    print(f"Packed {packed} data files into {BUNDLE_FILENAME}")
+
 if __name__ == "__main__":
     main()
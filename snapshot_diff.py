@@ -0,0 +1,120 @@
+"""
+클라이언트 스냅샷 사이의 변경 내역.
+
+watcher는 직전 스냅샷과 비교해 바뀐 부분만 SnapshotChange로 만들어 UI에 넘기고,
+UI는 바뀐 슬롯(cellId)과 밴만 다시 반영하고, 슬롯 순서가 바뀐 진영만 전체를 다시 배치합니다.
+(phase만 바뀌면 상태 표시만 갱신)
+
+- 슬롯은 cellId로 구분합니다 (cellId가 없으면 진영 안의 순서).
+- 직전 스냅샷이 없으면 (동기화 시작, 새 게임) SnapshotDiff.full로 표시해 전체를 반영하게 합니다.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+
+CHANGE_PHASE = "phase"  # previous/value: phase (없으면 timer phase)
+CHANGE_PICK = "pick"  # 슬롯 챔피언(픽/호버) 변경. previous/value: championId (없으면 None)
+CHANGE_LANE = "lane"  # 슬롯 assignedPosition 변경 (소문자, 없으면 "")
+CHANGE_ORDER = "order"  # 진영 안의 슬롯 구성/순서(pickTurn 순) 변경 (픽 추가/취소 포함). previous/value: 슬롯 키 튜플
+CHANGE_BAN_ADDED = "ban_added"  # value: 밴된 championId
+CHANGE_BAN_REMOVED = "ban_removed"
+
+# 슬롯 배치를 다시 해야 하는 변경
+SLOT_CHANGES = frozenset({CHANGE_PICK, CHANGE_LANE, CHANGE_ORDER})
+BAN_CHANGES = frozenset({CHANGE_BAN_ADDED, CHANGE_BAN_REMOVED})
+
+_SIDES = ("allies", "enemies")
+# 진영별 밴 키 (watcher 스냅샷 키, 예전 스냅샷의 bans 구조 키)
+_BAN_KEYS = {"allies": ("allyBans", "myTeamBans"), "enemies": ("enemyBans", "theirTeamBans")}
+
+
+@dataclass(frozen=True)
+class SnapshotChange:
+    kind: str
+    side: str | None = None  # "allies" / "enemies" (phase는 None)
+    slot: object = None  # cellId (없으면 진영 안의 순서)
+    previous: object = None
+    value: object = None
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    changes: tuple = ()
+    full: bool = False
+
+    def __bool__(self):
+        return self.full or bool(self.changes)
+
+    def slot_changes(self, side):
+        """진영의 슬롯 변경 (픽/라인/순서)."""
+        return [change for change in self.changes if change.side == side and change.kind in SLOT_CHANGES]
+
+    def bans_changed(self) -> bool:
+        return self.full or any(change.kind in BAN_CHANGES for change in self.changes)
+
+    def phase_changed(self) -> bool:
+        return self.full or any(change.kind == CHANGE_PHASE for change in self.changes)
+
+
+def snapshot_phase(snapshot):
+    """스냅샷의 phase (없으면 timer의 phase)."""
+    timer = snapshot.get("timer")
+    timer_phase = timer.get("phase") if isinstance(timer, dict) else None
+    return snapshot.get("phase") or timer_phase
+
+
+def ban_ids(snapshot, side):
+    """진영의 밴 championId 목록 (양수만). allyBans/enemyBans가 없으면 bans 구조에서 읽습니다."""
+    primary, fallback = _BAN_KEYS[side]
+    ids = snapshot.get(primary)
+    if not isinstance(ids, list):
+        bans = snapshot.get("bans")
+        ids = bans.get(fallback) if isinstance(bans, dict) else None
+        if not isinstance(ids, list):
+            ids = []
+    return [cid for cid in ids if isinstance(cid, int) and cid > 0]
+
+
+def _slots(entries):
+    """{슬롯 키: (championId 또는 이름, 라인)}과 순서대로의 슬롯 키 튜플."""
+    slots = {}
+    for position, entry in enumerate(entries or ()):
+        cell_id = entry.get("cellId")
+        key = cell_id if cell_id is not None else ("#", position)
+        champion = entry.get("championId") or entry.get("name") or None
+        lane = (entry.get("assignedPosition") or "").lower()
+        slots[key] = (champion, lane)
+    return slots, tuple(slots)
+
+
+def diff_snapshots(previous, current):
+    """previous → current 변경 내역. previous가 없으면 전체 반영 (full)."""
+    if not previous:
+        return SnapshotDiff(full=True)
+
+    changes = []
+    old_phase, new_phase = snapshot_phase(previous), snapshot_phase(current)
+    if old_phase != new_phase:
+        changes.append(SnapshotChange(CHANGE_PHASE, previous=old_phase, value=new_phase))
+
+    for side in _SIDES:
+        old_slots, old_order = _slots(previous.get(side))
+        new_slots, new_order = _slots(current.get(side))
+        for key in new_order + tuple(key for key in old_order if key not in new_slots):
+            old_champion, old_lane = old_slots.get(key, (None, ""))
+            new_champion, new_lane = new_slots.get(key, (None, ""))
+            if old_champion != new_champion:
+                changes.append(SnapshotChange(CHANGE_PICK, side, key, old_champion, new_champion))
+            if old_lane != new_lane:
+                changes.append(SnapshotChange(CHANGE_LANE, side, key, old_lane, new_lane))
+        # 슬롯이 추가/삭제되거나 순서가 바뀌면 UI 슬롯 배치가 달라짐
+        if old_order != new_order:
+            changes.append(SnapshotChange(CHANGE_ORDER, side, None, old_order, new_order))
+
+        old_bans, new_bans = Counter(ban_ids(previous, side)), Counter(ban_ids(current, side))
+        for champion_id in (new_bans - old_bans).elements():
+            changes.append(SnapshotChange(CHANGE_BAN_ADDED, side, value=champion_id))
+        for champion_id in (old_bans - new_bans).elements():
+            changes.append(SnapshotChange(CHANGE_BAN_REMOVED, side, previous=champion_id))
+
+    return SnapshotDiff(tuple(changes))
@@ -0,0 +1,59 @@
+from ban_advisor import BanAdvisor
+from matchup_tensor import compile_matchup_tensor
+from scoring_engine import ScoringEngine, SlotState
+
+
+def _counter(win_rate):
+    return {"win_rate": win_rate, "popularity": "5.00", "games": "5,000"}
+
+
+PAYLOADS = {
+    # Zed 파일: Ahri 상대로 56%, Garen 상대로 48%
+    "zed_middle.json": {"counters": {"middle": {"Ahri": _counter("56.00")}, "top": {"Garen": _counter("48.00")}}, "synergy": {}},
+    "darius_top.json": {"counters": {"middle": {"Ahri": _counter("51.00")}, "top": {"Garen": _counter("55.00")}}, "synergy": {}},
+    "ahri_middle.json": {"counters": {"top": {"Darius": _counter("50.00")}}, "synergy": {}},
+    "garen_top.json": {"counters": {"middle": {"Zed": _counter("50.00")}}, "synergy": {}},
+    "lee_sin_jungle.json": {"counters": {}, "synergy": {"middle": {"Zed": {"win_rate": "53.00", "pick_rate": "5.00", "games": "5,000"}}}},
+}
+
+def test_ally_drop_matches_scoring_engine(resolve_name, make_draft):
+    engine = ScoringEngine(compile_matchup_tensor(PAYLOADS, resolve_name))
+    allies = [SlotState("allies", 0, "Ahri", "Ahri", "middle", "middle"), SlotState("allies", 1, "Garen", "Garen", "top", "top")]
+    # 모든 아군 라인이 채워진 것으로 보고 이미 고른 아군 기준만 비교
+    allies += [SlotState("allies", idx, None, None, lane, lane) for idx, lane in ((2, "jungle"), (3, "bottom"), (4, "support"))]
+    enemies = [SlotState("enemies", 0, "Darius", "Darius", "top", "top")]
+    draft = make_draft(allies, enemies)
+
+    threats = {threat.name: threat for threat in BanAdvisor(engine).rank(draft)}
+    assert "Darius" not in threats and "Ahri" not in threats
+
+    with_zed = make_draft(allies, enemies + [SlotState("enemies", 1, "Zed", "Zed", "middle", "middle")])
+    before, _avg, _complete = engine.team_stats(draft, "allies", use_cache=False)
+    after, _avg, _complete = engine.team_stats(with_zed, "allies", use_cache=False)
+    zed = threats["Zed"]
+    assert zed.lane == "middle"
+    # 빈 아군 라인(jungle/bottom/support)은 Zed 파일에 항목이 없어 기대 감소 0
+    assert abs(zed.ally_drop - (before - after)) < 1e-9
+    assert zed.enemy_synergy == 0.0
+
+
+def test_rank_respects_bans_lanes_and_enemy_synergy(resolve_name, make_draft):
+    engine = ScoringEngine(compile_matchup_tensor(PAYLOADS, resolve_name))
+    advisor = BanAdvisor(engine)
+
+    empty = advisor.rank(make_draft())
+    assert [threat.threat for threat in empty] == sorted((threat.threat for threat in empty), reverse=True)
+    # 빈 드래프트: Zed(미드, Ahri 상대 56%)와 Darius(탑, Garen 상대 55%)가 위협적
+    assert {threat.name for threat in empty[:2]} == {"Zed", "Darius"}
+    assert len(advisor.rank(make_draft(), limit=1)) == 1
+
+    assert "Zed" not in [threat.name for threat in advisor.rank(make_draft(banned=frozenset({"zed"})))]
+    # 상대 미드가 이미 정해지면 미드 후보는 제외
+    taken = advisor.rank(make_draft(enemies=[SlotState("enemies", 0, "Ahri", "Ahri", "middle", "middle")]))
+    assert all(threat.lane != "middle" for threat in taken)
+
+    # 상대 Lee Sin과의 시너지(53%)가 위협도에 더해짐
+    with_lee = advisor.rank(make_draft(enemies=[SlotState("enemies", 0, "LeeSin", "Lee Sin", "jungle", "jungle")]))
+    zed = next(threat for threat in with_lee if threat.name == "Zed")
+    assert abs(zed.enemy_synergy - 3.0) < 1e-9
+    assert abs(zed.threat - (zed.ally_drop + 3.0)) < 1e-9
@@ -0,0 +1,187 @@
+import json
+
+import pytest
+
+from champion_data import (
+    SCHEMA_VERSION,
+    BundleFormatError,
+    DataCatalog,
+    DataStore,
+    DataBundle,
+    migrate_data_directory,
+    migrate_payload,
+    pack_data_directory,
+    schema_version,
+)
+from matchup_tensor import KIND_COUNTER, KIND_SYNERGY, LANE_INDEX, MatchupTensor, compile_matchup_table
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    directory = tmp_path / "data"
+    directory.mkdir()
+    payloads = {
+        "ahri_middle.json": {"counters": {"top": {"Garen": {"games": "1,234", "win_rate": "51.20"}}}, "synergy": {}},
+        "lee_sin_jungle.json": {"counters": {}, "synergy": {"middle": {"아리": {"games": "980", "win_rate": "49.90"}}}},
+    }
+    for filename, payload in payloads.items():
+        (directory / filename).write_text(json.dumps(payload, ensure_ascii=False, indent=4), encoding="utf-8")
+    (directory / "README.txt").write_text("not data", encoding="utf-8")
+    return directory, payloads
+
+
+def test_pack_round_trip(data_dir, tmp_path):
+    directory, payloads = data_dir
+    bundle_path = tmp_path / "champion_data.bundle"
+
+    assert pack_data_directory(directory, bundle_path) == 2
+
+    bundle = DataBundle(bundle_path)
+    assert sorted(bundle.filenames()) == sorted(payloads)
+    assert "README.txt" not in bundle
+    # 묶음 파일에는 schema v2로 변환되어 저장됨
+    assert bundle.read("lee_sin_jungle.json") == migrate_payload(payloads["lee_sin_jungle.json"])
+    assert bundle.read("missing_top.json") is None
+    assert bundle.read_all() == {name: migrate_payload(payload) for name, payload in payloads.items()}
+
+
+def test_mapped_matchup_table_matches_compiled(data_dir, tmp_path):
+    directory, payloads = data_dir
+    bundle_path = tmp_path / "champion_data.bundle"
+    pack_data_directory(directory, bundle_path)
+
+    mapped = DataBundle(bundle_path).matchup_table()
+    compiled = compile_matchup_table(payloads)
+    assert mapped.rows == compiled.rows
+    assert mapped.columns == compiled.columns
+    for (_kind, _field, mapped_values), (_k, _f, compiled_values) in zip(mapped.iter_arrays(), compiled.iter_arrays()):
+        assert isinstance(mapped_values, memoryview)
+        assert mapped_values.tolist() == compiled_values.tolist()
+
+    names = {"ahri": "Ahri", "lee sin": "LeeSin", "garen": "Garen", "아리": "Ahri"}
+    tensor = MatchupTensor(mapped, lambda name: names.get(name.lower()))
+    ahri, lee, garen = (tensor.champion_id(name) for name in ("Ahri", "LeeSin", "Garen"))
+    assert tensor.entry(KIND_COUNTER, ahri, LANE_INDEX["middle"], garen, LANE_INDEX["top"]) == {
+        "games": 1234, "pick_rate": 0.0, "win_rate": 51.2
+    }
+    assert tensor.entry(KIND_SYNERGY, lee, LANE_INDEX["jungle"], ahri, LANE_INDEX["middle"])["games"] == 980
+
+
+def test_catalog_matches_tensor_totals(data_dir, tmp_path):
+    directory, _payloads = data_dir
+    bundle_path = tmp_path / "champion_data.bundle"
+    pack_data_directory(directory, bundle_path)
+
+    names = {"ahri": "Ahri", "lee sin": "LeeSin", "garen": "Garen", "아리": "Ahri"}
+    tensor = MatchupTensor(DataBundle(bundle_path).matchup_table(), lambda name: names.get(name.lower()))
+    catalog = DataCatalog(tensor)
+    ahri, lee, garen = (tensor.champion_id(name) for name in ("Ahri", "LeeSin", "Garen"))
+    middle = LANE_INDEX["middle"]
+
+    for cid in range(tensor.champion_count):
+        assert catalog.lane_games(cid) == tuple(
+            tensor.lane_games_total(KIND_COUNTER, cid, lane_idx) for lane_idx in range(len(LANE_INDEX))
+        )
+        assert catalog.pick_games(cid) == tuple(
+            tensor.lane_games_total(KIND_COUNTER, cid, lane_idx, (lane_idx,)) or 0 for lane_idx in range(len(LANE_INDEX))
+        )
+        for lane_idx in range(len(LANE_INDEX)):
+            assert catalog.has_file(cid, lane_idx) == tensor.has_data(cid, lane_idx)
+
+    assert catalog.best_lane(ahri) == "middle"
+    # 파일은 있지만 카운터 판수가 0이어도 그 라인
+    assert catalog.best_lane(lee) == "jungle"
+    assert catalog.best_lane(garen) is None and catalog.best_lane(None) is None
+    assert not catalog.has_file(None, middle)
+
+    # 원본 파일 수정 시각은 묶음 파일에 함께 저장됨
+    assert catalog.mtime(ahri, middle) == (directory / "ahri_middle.json").stat().st_mtime
+    assert catalog.mtime(ahri, LANE_INDEX["top"]) is None
+
+
+def test_migrate_payload_converts_display_strings():
+    payload = {
+        "counters": {"top": {"Garen": {"Name": "Garen", "win_rate": "51.20", "popularity": "7.5", "games": "1,234", "win_rate_diff": 1.2}}},
+        "synergy": {"support": {"Sona": {"Name": "Sona", "win_rate": "49.90", "delta_1": "-0.8", "delta_2": "N/A", "pick_rate": "1.10", "games": "980"}}},
+    }
+    migrated = migrate_payload(payload)
+
+    assert schema_version(payload) == 1
+    assert schema_version(migrated) == SCHEMA_VERSION
+    assert migrated["counters"]["top"]["Garen"] == {
+        "Name": "Garen", "win_rate": 51.2, "popularity": 7.5, "games": 1234, "win_rate_diff": 1.2
+    }
+    assert migrated["synergy"]["support"]["Sona"] == {
+        "Name": "Sona", "win_rate": 49.9, "delta_1": -0.8, "delta_2": None, "pick_rate": 1.1, "games": 980
+    }
+    assert migrate_payload(migrated) is migrated
+    # 원본은 그대로
+    assert payload["counters"]["top"]["Garen"]["games"] == "1,234"
+
+
+def test_migrate_data_directory_is_one_shot(data_dir):
+    directory, payloads = data_dir
+
+    assert migrate_data_directory(directory) == 2
+    migrated = json.loads((directory / "ahri_middle.json").read_text(encoding="utf-8"))
+    assert migrated == migrate_payload(payloads["ahri_middle.json"])
+    assert migrate_data_directory(directory) == 0
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "champion_data.bundle"
+    path.write_bytes(b"PK\x03\x04 not a bundle")
+    with pytest.raises(BundleFormatError):
+        DataBundle(path)
+
+
+def test_data_store_degrades_until_ready(data_dir):
+    import threading
+
+    directory, payloads = data_dir
+    release = threading.Event()
+    progress_events = []
+    ready_events = []
+
+    def loader(progress):
+        release.wait(5)
+        progress(1, 2, "ahri_middle.json")
+        progress(2, 2, "lee_sin_jungle.json")
+        return compile_matchup_table(payloads)
+
+    names = {"ahri": "Ahri", "lee sin": "LeeSin", "garen": "Garen", "아리": "Ahri"}
+    store = DataStore(lambda name: names.get(name.lower()), loader=loader)
+    store.add_progress_listener(lambda done, total, message: progress_events.append((done, total)))
+    store.add_ready_listener(ready_events.append)
+    store.start()
+
+    # 로딩 중에는 빈 텐서로 동작
+    assert not store.wait(0.05)
+    assert len(store.tensor) == 0
+    assert store.catalog.best_lane(None) is None
+    assert store.tensor.entry(KIND_COUNTER, None, 0, None, 0) is None
+
+    release.set()
+    assert store.wait(5)
+    assert store.is_ready and store.error is None
+    assert progress_events == [(1, 2), (2, 2)]
+    assert ready_events == [store]
+    assert store.tensor.champion_id("Garen") is not None
+    assert store.catalog.tensor is store.tensor
+    assert store.catalog.best_lane(store.tensor.champion_id("Ahri")) == "middle"
+
+    # 이미 끝난 뒤 등록한 리스너는 바로 호출됨
+    late = []
+    store.add_ready_listener(late.append)
+    assert late == [store]
+
+
+def test_data_store_reports_loader_failure():
+    def loader(_progress):
+        raise OSError("disk gone")
+
+    store = DataStore(lambda name: None, loader=loader)
+    store.load()
+    assert store.is_ready
+    assert isinstance(store.error, OSError)
+    assert len(store.tensor) == 0
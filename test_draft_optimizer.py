@@ -0,0 +1,99 @@
+import itertools
+import random
+
+from draft_optimizer import RemainingSlotsOptimizer
+from matchup_tensor import compile_matchup_tensor
+from scoring_engine import DraftState, ScoringEngine, SlotState
+
+CHAMPIONS = {
+    "top": ["Garen", "Darius"],
+    "jungle": ["Amumu", "Viego", "Vi"],
+    "middle": ["Ahri", "Zed"],
+    "bottom": ["Jinx", "Ezreal"],
+    "support": ["Nami", "Leona", "Lulu"],
+}
+
+
+def _payloads(seed=3):
+    rnd = random.Random(seed)
+    payloads = {}
+    for lane, names in CHAMPIONS.items():
+        for name in names:
+            synergy = {}
+            counters = {}
+            for other_lane, others in CHAMPIONS.items():
+                synergy[other_lane] = {
+                    other: {"win_rate": f"{rnd.uniform(46, 56):.2f}", "pick_rate": "5.00", "games": "5,000"}
+                    for other in others if other != name
+                }
+                counters[other_lane] = {
+                    other: {"win_rate": f"{rnd.uniform(44, 56):.2f}", "popularity": "5.00", "games": "5,000"}
+                    for other in others if other != name
+                }
+            payloads[f"{name.lower()}_{lane}.json"] = {"counters": counters, "synergy": synergy}
+    return payloads
+
+
+ALLIES = (
+    SlotState("allies", 0, "Garen", "Garen", "top", "top"),
+    SlotState("allies", 1, None, None, None, "jungle"),
+    SlotState("allies", 2, "Ahri", "Ahri", "middle", "middle"),
+    SlotState("allies", 3, "Jinx", "Jinx", "bottom", "bottom"),
+    SlotState("allies", 4, None, None, None, "support"),
+)
+ENEMIES = (
+    SlotState("enemies", 0, "Darius", "Darius", "top", "top"),
+    SlotState("enemies", 1, "Zed", "Zed", "middle", "middle"),
+)
+
+
+def _brute_force(engine, draft):
+    best = None
+    for jungle, support in itertools.product(CHAMPIONS["jungle"], CHAMPIONS["support"]):
+        if jungle.lower() in draft.banned or support.lower() in draft.banned:
+            continue
+        allies = list(draft.allies)
+        allies[1] = SlotState("allies", 1, jungle, jungle, "jungle", "jungle")
+        allies[4] = SlotState("allies", 4, support, support, "support", "support")
+        total, _avg, _complete = engine.team_stats(DraftState(**{**draft.__dict__, "allies": tuple(allies)}), "allies", use_cache=False)
+        if best is None or total > best[0]:
+            best = (total, jungle, support)
+    return best
+
+
+def test_optimizer_matches_brute_force(resolve_name, make_draft):
+    engine = ScoringEngine(compile_matchup_tensor(_payloads(), resolve_name))
+    optimizer = RemainingSlotsOptimizer(engine)
+    draft = make_draft(ALLIES, ENEMIES)
+
+    plans = optimizer.optimize(draft)
+    total, jungle, support = _brute_force(engine, draft)
+    best = plans[0]
+    assert [(index, lane, name) for index, lane, name, _score in best.assignments] == [
+        (1, "jungle", jungle), (4, "support", support)
+    ]
+    assert abs(best.team_total - total) < 1e-9
+    assert best.complete
+    assert [plan.team_total for plan in plans] == sorted((plan.team_total for plan in plans), reverse=True)
+
+
+def test_optimizer_respects_bans_and_taken_lanes(resolve_name, make_draft):
+    engine = ScoringEngine(compile_matchup_tensor(_payloads(), resolve_name))
+    optimizer = RemainingSlotsOptimizer(engine)
+    first = optimizer.optimize(make_draft(ALLIES, ENEMIES))[0]
+    best_jungle = first.assignments[0][2]
+
+    banned = make_draft(ALLIES, ENEMIES, banned=frozenset({best_jungle.lower()}))
+    plans = optimizer.optimize(banned)
+    assert plans and all(plan.assignments[0][2] != best_jungle for plan in plans)
+    assert plans[0].team_total == _brute_force(engine, banned)[0]
+
+    # 빈 슬롯의 라인 선택이 이미 선택된 라인이면 남은 라인으로 배정
+    allies = list(ALLIES)
+    allies[4] = SlotState("allies", 4, None, None, None, "middle")
+    plan = optimizer.optimize(make_draft(allies, ENEMIES))[0]
+    assert sorted(lane for _index, lane, _name, _score in plan.assignments) == ["jungle", "support"]
+
+    full = make_draft([slot if slot.canonical_name else SlotState("allies", slot.index, "Vi", "Vi", "jungle", "jungle")
+                       for slot in ALLIES[:4]], ENEMIES)
+    assert optimizer.optimize(full) == []
@@ -0,0 +1,88 @@
+import itertools
+import random
+
+from common import LANES
+from lane_assignment import assign_lanes, solve_assignment
+
+
+def _backtracking_assign(candidates, available_lanes):
+    """이전 구현(전수 백트래킹 + 탐욕 보정)과 같은 규칙의 기준 구현."""
+    best_assignment, best_score = {}, -1
+
+    def backtrack(position, used, score):
+        nonlocal best_assignment, best_score
+        if position >= len(candidates):
+            if score > best_score:
+                best_score, best_assignment = score, dict(used)
+            return
+        key, rates = candidates[position]
+        possible = [lane for lane in available_lanes if rates.get(lane, 0) > 0] if rates else list(available_lanes)
+        for lane in possible:
+            if lane in used.values():
+                continue
+            used[key] = lane
+            backtrack(position + 1, used, score + rates.get(lane, 0))
+            del used[key]
+        if not possible:
+            backtrack(position + 1, used, score)
+
+    backtrack(0, {}, 0)
+    assigned = dict(best_assignment)
+    options = sorted(
+        ((rates[lane], key, lane) for key, rates in candidates if key not in assigned
+         for lane in available_lanes if lane in rates and lane not in assigned.values()),
+        key=lambda option: option[0],
+        reverse=True,
+    )
+    for _games, key, lane in options:
+        if key not in assigned and lane not in assigned.values():
+            assigned[key] = lane
+    return assigned
+
+
+def test_solve_assignment_matches_brute_force():
+    rng = random.Random(7)
+    for _ in range(200):
+        rows = rng.randint(1, 5)
+        cols = rng.randint(rows, 5)
+        cost = [[rng.randint(-50, 50) for _ in range(cols)] for _ in range(rows)]
+        columns = solve_assignment(cost)
+        assert len(set(columns)) == rows
+        best = min(
+            sum(cost[row][col] for row, col in enumerate(perm))
+            for perm in itertools.permutations(range(cols), rows)
+        )
+        assert sum(cost[row][col] for row, col in enumerate(columns)) == best
+
+
+def test_assign_lanes_prefers_total_games():
+    candidates = [
+        ("Viego", {"jungle": 52000, "middle": 800}),
+        ("Amumu", {"jungle": 21000, "support": 9000}),
+        ("Diana", {"jungle": 30000, "middle": 14000}),
+    ]
+    assert assign_lanes(candidates, LANES) == {"Viego": "jungle", "Amumu": "support", "Diana": "middle"}
+    # 고정된 라인은 후보에서 빠짐
+    assert assign_lanes(candidates[1:2], [lane for lane in LANES if lane != "jungle"]) == {"Amumu": "support"}
+
+
+def test_assign_lanes_edge_cases():
+    # 데이터가 없는 챔피언은 남은 라인을 받고, 남은 라인에 판수가 없는 챔피언은 배정하지 않음
+    assert assign_lanes([("A", {"top": 10}), ("B", {})], ["top", "jungle"]) == {"A": "top", "B": "jungle"}
+    assert assign_lanes([("A", {"top": 10})], ["middle"]) == {}
+    # 전원 배정이 불가능하면 판수가 큰 순서로 탐욕 배정
+    assert assign_lanes([("A", {"top": 10}), ("B", {"top": 20})], ["top", "middle"]) == {"B": "top"}
+    assert assign_lanes([], LANES) == {}
+
+
+def test_assign_lanes_matches_backtracking():
+    rng = random.Random(11)
+    for _ in range(300):
+        available = rng.sample(LANES, rng.randint(1, 5))
+        available.sort(key=LANES.index)
+        candidates = []
+        for key in range(rng.randint(1, 5)):
+            lanes = rng.sample(LANES, rng.randint(1, 3))
+            # 최적 배정이 하나로 정해지도록 서로 다른 판수 사용
+            candidates.append((key, {lane: rng.randint(1, 10 ** 6) for lane in lanes}))
+        assert assign_lanes(candidates, available) == _backtracking_assign(candidates, available)
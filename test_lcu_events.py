@@ -0,0 +1,215 @@
+import json
+import socket
+import struct
+import threading
+import urllib.request
+
+import pytest
+
+from lcu_events import (
+    CHAMP_SELECT_SESSION_URIS,
+    MAX_FRAME_BYTES,
+    LcuEventStream,
+    LcuEventStreamError,
+    LcuReplayServer,
+    _FrameSocket,
+    encode_frame,
+    event_topic,
+    load_recorded_sessions,
+)
+
+
+@pytest.fixture
+def lcu_log(tmp_path, monkeypatch):
+    """watcher 테스트의 LCU/디버그 로그와 스냅샷 저장을 실제 logs/ 대신 tmp_path로 돌림"""
+    pytest.importorskip("requests")
+    import lobby_manager
+    from log_pipeline import BatchingLogWriter
+
+    writer = BatchingLogWriter(tmp_path / "lcu_responses.log", lobby_manager.LCU_LOG_WRITER.formatter)
+    debug_writer = BatchingLogWriter(tmp_path / "debug.log")
+    monkeypatch.setattr(lobby_manager, "LCU_LOG_WRITER", writer)
+    monkeypatch.setattr(lobby_manager, "DEBUG_LOG_WRITER", debug_writer)
+    monkeypatch.setattr(lobby_manager, "DEBUG_DATA_DIR", tmp_path)
+    logger = lobby_manager.LCU_LOGGER
+    handlers, level = logger.handlers[:], logger.level
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(writer.handler)
+    try:
+        yield writer
+    finally:
+        logger.removeHandler(writer.handler)
+        for handler in handlers:
+            logger.addHandler(handler)
+        logger.setLevel(level)
+        writer.stop()
+        debug_writer.stop()
+
+
+def _session(*champion_ids, phase="BAN_PICK"):
+    return {
+        "phase": phase,
+        "localPlayerCellId": 0,
+        "myTeam": [{"cellId": cell, "championId": cid, "assignedPosition": ""} for cell, cid in enumerate(champion_ids)],
+        "theirTeam": [],
+        "actions": [],
+    }
+
+
+def test_event_topic_name():
+    assert event_topic("/lol-champ-select/v1/session") == "OnJsonApiEvent_lol-champ-select_v1_session"
+
+
+def test_stream_receives_replayed_sessions_in_order():
+    pytest.importorskip("websocket")
+    # 큰 세션(확장 길이 프레임)도 그대로 전달되는지 확인
+    large = _session(103, 64)
+    large["padding"] = "x" * 70000
+    sessions = [_session(103), large, None]
+
+    with LcuReplayServer(sessions) as server:
+        stream = LcuEventStream(server.base_url, server.auth)
+        stream.connect()
+        try:
+            events = [stream.receive(2.0) for _ in sessions]
+            assert stream.receive(0.05) is None
+        finally:
+            stream.close()
+
+    assert [event.uri for event in events] == [CHAMP_SELECT_SESSION_URIS[0]] * 3
+    assert [event.event_type for event in events] == ["Update", "Update", "Delete"]
+    assert events[0].data == sessions[0]
+    assert events[1].data == large
+    assert events[2].data is None
+    assert not stream.connected
+
+
+def test_stream_rejects_wrong_credentials():
+    pytest.importorskip("websocket")
+    with LcuReplayServer([]) as server:
+        stream = LcuEventStream(server.base_url, ("riot", "wrong"))
+        with pytest.raises(LcuEventStreamError):
+            stream.connect()
+
+
+def test_replay_server_answers_rest_requests():
+    pytest.importorskip("websocket")
+    with LcuReplayServer([]) as server:
+        stream = LcuEventStream(server.base_url, server.auth)
+        stream.connect()
+        assert server.subscribed.wait(2.0)
+        server.publish(_session(1))
+        assert stream.receive(2.0).data == _session(1)
+        stream.close()
+
+        request = urllib.request.Request(f"{server.base_url}{CHAMP_SELECT_SESSION_URIS[0]}")
+        request.add_header("Authorization", "Basic cmlvdDpyZXBsYXk=")
+        with urllib.request.urlopen(request, timeout=2.0) as response:
+            assert json.loads(response.read()) == _session(1)
+
+
+def test_server_frames_reassemble_masked_fragments_and_answer_ping():
+    client_sock, server_sock = socket.socketpair()
+    server = _FrameSocket(server_sock)
+    try:
+        # 첫 조각(FIN 없음) → ping → 연속 조각(FIN), 클라이언트 프레임은 마스킹됨
+        first = bytearray(encode_frame(b'[5, "t", ', 0x1, mask=True))
+        first[0] &= 0x7F
+        client_sock.sendall(bytes(first) + encode_frame(b"hi", 0x9, mask=True) + encode_frame(b"{}]", 0x0, mask=True))
+
+        assert server.read_message(1.0) == (0x1, b'[5, "t", {}]')
+        # pong은 마스킹 없이 보냄
+        assert client_sock.recv(16) == b"\x8a\x02hi"
+        assert server.read_message(0.01) is None
+    finally:
+        client_sock.close()
+        server_sock.close()
+
+
+def test_server_frames_reject_oversized_length():
+    client_sock, server_sock = socket.socketpair()
+    server = _FrameSocket(server_sock)
+    try:
+        client_sock.sendall(b"\x81\xff" + struct.pack("!Q", MAX_FRAME_BYTES + 1))
+        with pytest.raises(LcuEventStreamError):
+            server.read_frame(1.0)
+    finally:
+        client_sock.close()
+        server_sock.close()
+
+
+def test_load_recorded_sessions(tmp_path):
+    (tmp_path / "b.json").write_text(json.dumps([_session(2), None]), encoding="utf-8")
+    (tmp_path / "a.json").write_text(json.dumps(_session(1)), encoding="utf-8")
+    assert load_recorded_sessions(tmp_path) == [_session(1), _session(2), None]
+
+
+def test_watcher_emits_snapshots_from_events(tmp_path, lcu_log):
+    pytest.importorskip("websocket")
+    from lobby_manager import LeagueClientWatcher
+
+    with LcuReplayServer([]) as server:
+        lockfile = tmp_path / "lockfile"
+        lockfile.write_text(f"LeagueClient:1:{server.port}:replay:http", encoding="utf-8")
+        watcher = LeagueClientWatcher()
+        watcher._lockfile_path = str(lockfile)
+        watcher._champion_cache = {103: "Ahri", 64: "LeeSin"}
+
+        received = []
+        changed = threading.Event()
+
+        def on_snapshot(snapshot, _message, diff):
+            received.append((snapshot, diff))
+            changed.set()
+
+        watcher.start(on_snapshot)
+        try:
+            assert server.subscribed.wait(3.0)
+            server.publish(_session(103))
+            assert changed.wait(2.0)
+            changed.clear()
+            server.publish(_session(103, 64))
+            assert changed.wait(2.0)
+        finally:
+            watcher.stop()
+
+    assert [[entry["name"] for entry in snapshot["allies"]] for snapshot, _diff in received] == [["Ahri"], ["Ahri", "LeeSin"]]
+    # 첫 스냅샷은 전체 반영, 이후에는 바뀐 슬롯만
+    assert received[0][1].full
+    assert [(change.kind, change.side, change.slot, change.value) for change in received[1][1].changes] == [
+        ("pick", "allies", 1, 64)
+    ]
+
+
+def test_watcher_remembers_session_endpoint(tmp_path, lcu_log):
+    from lobby_manager import LeagueClientWatcher
+
+    legacy = CHAMP_SELECT_SESSION_URIS[1]
+    with LcuReplayServer([], uri=legacy) as server:
+        server.publish(_session(103))
+        lockfile = tmp_path / "lockfile"
+        lockfile.write_text(f"LeagueClient:1:{server.port}:replay:http", encoding="utf-8")
+        watcher = LeagueClientWatcher(use_event_stream=False)
+        watcher._lockfile_path = str(lockfile)
+        watcher._champion_cache = {103: "Ahri"}
+
+        try:
+            snapshot, _message = watcher.fetch_snapshot()
+            assert snapshot["allies"][0]["name"] == "Ahri"
+            assert watcher._session_endpoint == legacy
+            watcher.fetch_snapshot()
+            # 두 번째 조회는 기억한 레거시 엔드포인트만 사용
+            assert watcher.latency.snapshot()[legacy]["count"] == 2
+            assert watcher.latency.snapshot()[CHAMP_SELECT_SESSION_URIS[0]]["count"] == 1
+        finally:
+            watcher.stop()
+
+    assert lcu_log.flush()
+    lines = (tmp_path / "lcu_responses.log").read_text(encoding="utf-8").splitlines()
+    # 응답 로그만 비교 (지연 요약 줄 제외)
+    assert [line.split("] ", 1)[1] for line in lines if " GET " in line] == [
+        f"[source=watcher] GET {CHAMP_SELECT_SESSION_URIS[0]} status=404",
+        f"[source=watcher] GET {legacy} status=200 phase=BAN_PICK timer_phase=None allies=[champId=103,pos=] enemies=[]",
+        f"[source=watcher] GET {legacy} status=200 phase=BAN_PICK timer_phase=None allies=[champId=103,pos=] enemies=[]",
+    ]
@@ -0,0 +1,109 @@
+import logging
+import threading
+
+from log_pipeline import BatchingLogWriter
+
+
+def _read(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_lines_are_written_in_order(tmp_path):
+    path = tmp_path / "logs" / "out.log"
+    writer = BatchingLogWriter(path, batch_size=8)
+    try:
+        for index in range(50):
+            writer.write_line(f"line {index}")
+        assert writer.flush()
+        assert _read(path) == [f"line {index}" for index in range(50)]
+    finally:
+        writer.stop()
+
+
+def test_truncate_keeps_queue_order(tmp_path):
+    path = tmp_path / "out.log"
+    path.write_text("old\n", encoding="utf-8")
+    writer = BatchingLogWriter(path)
+    try:
+        writer.write_line("before")
+        writer.truncate()
+        writer.write_line("after")
+        assert writer.flush()
+        assert _read(path) == ["after"]
+    finally:
+        writer.stop()
+
+
+def test_rotates_when_file_exceeds_max_bytes(tmp_path):
+    path = tmp_path / "out.log"
+    writer = BatchingLogWriter(path, max_bytes=20, backup_count=2, batch_size=1)
+    try:
+        for index in range(4):
+            writer.write_line(f"entry-{index}-xxxxxx")
+        assert writer.flush()
+    finally:
+        writer.stop()
+
+    assert _read(path) == ["entry-3-xxxxxx"]
+    assert _read(tmp_path / "out.log.1") == ["entry-2-xxxxxx"]
+    assert _read(tmp_path / "out.log.2") == ["entry-1-xxxxxx"]
+    assert not (tmp_path / "out.log.3").exists()
+
+
+def test_logger_records_are_formatted_on_writer_thread(tmp_path):
+    path = tmp_path / "out.log"
+    writer = BatchingLogWriter(path, logging.Formatter("[%(levelname)s] %(message)s"))
+    logger = logging.getLogger("test_log_pipeline")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(writer.handler)
+    try:
+        logger.info("phase=%s picks=%d", "BAN_PICK", 3)
+        logger.debug("dropped")
+        logger.error("failed")
+        assert writer.flush()
+        assert _read(path) == ["[INFO] phase=BAN_PICK picks=3", "[ERROR] failed"]
+    finally:
+        logger.removeHandler(writer.handler)
+        writer.stop()
+
+
+def test_stop_writes_pending_lines(tmp_path):
+    path = tmp_path / "out.log"
+    writer = BatchingLogWriter(path)
+    for index in range(100):
+        writer.write_line(str(index))
+    writer.stop()
+    assert _read(path) == [str(index) for index in range(100)]
+    # 멈춘 뒤의 기록은 스레드를 다시 띄우지 않고 바로 씀
+    writer.write_line("again")
+    writer.truncate()
+    writer.write_line("after truncate")
+    assert writer._thread is None
+    assert _read(path) == ["after truncate"]
+
+
+def test_stop_during_concurrent_logging_keeps_one_writer_thread(tmp_path):
+    path = tmp_path / "out.log"
+    writer = BatchingLogWriter(path)
+    name = f"log-writer:{path.name}"
+    started = threading.Event()
+
+    def produce(offset):
+        started.set()
+        for index in range(500):
+            writer.write_line(f"{offset}-{index}")
+
+    producers = [threading.Thread(target=produce, args=(offset,)) for offset in range(4)]
+    for producer in producers:
+        producer.start()
+    started.wait(1.0)
+    writer.stop()
+    for producer in producers:
+        producer.join()
+
+    assert not [thread for thread in threading.enumerate() if thread.name == name]
+    lines = _read(path)
+    assert len(lines) == 2000
+    for offset in range(4):
+        assert [line for line in lines if line.startswith(f"{offset}-")] == [f"{offset}-{index}" for index in range(500)]
@@ -0,0 +1,207 @@
+from matchup_tensor import (
+    MatchupDecisions,
+    choose_matchup_source,
+    compile_matchup_tensor,
+    split_data_filename,
+    KIND_COUNTER,
+    KIND_SYNERGY,
+    LANE_INDEX,
+)
+
+
+PAYLOADS = {
+    "lee_sin_jungle.json": {
+        "counters": {
+            "middle": {"Ahri": {"Name": "Ahri", "win_rate": "48.31", "popularity": "7.20", "games": "12,345"}},
+        },
+        "synergy": {
+            "support": {"Amumu": {"win_rate": "52.07", "pick_rate": "1.35", "games": "980"}},
+        },
+    },
+    "ahri_middle.json": {
+        "counters": {
+            "jungle": {"Lee Sin": {"Name": "Lee Sin", "win_rate": "51.69", "popularity": "9.10", "games": "12,001"}},
+        },
+        "synergy": {},
+    },
+    "notes.txt": {},
+}
+
+
+def test_split_data_filename():
+    assert split_data_filename("lee_sin_jungle.json") == ("lee_sin", "jungle")
+    assert split_data_filename("ahri_mid.json") == (None, None)
+    assert split_data_filename("ahri_middle.txt") == (None, None)
+
+
+def test_entry_values_match_source_strings(resolve_name):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    lee = tensor.champion_id("LeeSin")
+    ahri = tensor.champion_id("ahri")
+
+    entry = tensor.entry(KIND_COUNTER, lee, LANE_INDEX["jungle"], ahri, LANE_INDEX["middle"])
+    assert entry == {"games": 12345, "pick_rate": 7.2, "win_rate": 48.31}
+
+    reverse = tensor.entry(KIND_COUNTER, ahri, LANE_INDEX["middle"], lee, LANE_INDEX["jungle"])
+    assert reverse == {"games": 12001, "pick_rate": 9.1, "win_rate": 51.69}
+
+
+def test_missing_entries_and_files(resolve_name):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    lee = tensor.champion_id("LeeSin")
+    ahri = tensor.champion_id("Ahri")
+    amumu = tensor.champion_id("Amumu")
+
+    assert tensor.entry(KIND_SYNERGY, lee, LANE_INDEX["top"], ahri, LANE_INDEX["middle"]) is None
+    assert tensor.entry(KIND_SYNERGY, None, LANE_INDEX["top"], ahri, LANE_INDEX["middle"]) is None
+    # Amumu은 다른 파일에 등장하지만 자기 데이터 파일은 없음
+    assert amumu is not None
+    assert not tensor.has_data(amumu, LANE_INDEX["support"])
+    assert tensor.has_data(lee, LANE_INDEX["jungle"])
+
+
+def test_iter_lane_entries_lists_only_present_entries(resolve_name):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    lee = tensor.champion_id("LeeSin")
+    listed = list(tensor.iter_lane_entries(KIND_SYNERGY, lee, LANE_INDEX["jungle"], LANE_INDEX["support"]))
+    assert [tensor.data_names[cid] for cid, _entry in listed] == ["Amumu"]
+    assert listed[0][1]["games"] == 980
+    assert list(tensor.iter_lane_entries(KIND_SYNERGY, lee, LANE_INDEX["jungle"], LANE_INDEX["top"])) == []
+
+
+def test_lane_dataset_builds_single_file_view(resolve_name):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    lee = tensor.champion_id("LeeSin")
+
+    dataset = tensor.lane_dataset(KIND_COUNTER, lee, LANE_INDEX["jungle"])
+    assert dataset["middle"] == {
+        "Ahri": {"Name": "Ahri", "games": 12345, "popularity": 7.2, "win_rate": 48.31, "win_rate_diff": -1.69}
+    }
+    assert dataset["top"] == {}
+    assert tensor.lane_dataset(KIND_COUNTER, lee, LANE_INDEX["top"]) is None
+
+
+def test_lane_games_total(resolve_name):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    ahri = tensor.champion_id("Ahri")
+    assert tensor.lane_games_total(KIND_COUNTER, ahri, LANE_INDEX["middle"]) == 12001
+    assert tensor.lane_games_total(KIND_COUNTER, ahri, LANE_INDEX["middle"], (LANE_INDEX["middle"],)) == 0
+    assert tensor.lane_games_total(KIND_COUNTER, ahri, LANE_INDEX["top"]) is None
+
+
+def test_lookup_id_uses_interned_data_names(resolve_name):
+    calls = []
+
+    def resolve(name):
+        calls.append(name)
+        return resolve_name(name)
+
+    tensor = compile_matchup_tensor(PAYLOADS, resolve)
+    lee = tensor.champion_id("LeeSin")
+    resolved_at_load = len(calls)
+
+    # canonical 이름, 데이터의 "Name" 값, 파일명 stem 모두 같은 ID
+    assert tensor.lookup_id("LeeSin") == lee
+    assert tensor.lookup_id(" lee sin ") == lee
+    assert tensor.lookup_id("lee_sin") == lee
+    assert tensor.lookup_id("Amumu") == tensor.champion_id("Amumu")
+    # 유사 검색은 하지 않음
+    assert tensor.lookup_id("lee") is None
+    assert tensor.lookup_id("") is None
+    assert len(calls) == resolved_at_load
+
+
+def test_reverse_index_pairs_both_directions(resolve_name):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    lee = tensor.champion_id("LeeSin")
+    ahri = tensor.champion_id("Ahri")
+    amumu = tensor.champion_id("Amumu")
+    jungle, middle, support = LANE_INDEX["jungle"], LANE_INDEX["middle"], LANE_INDEX["support"]
+
+    pairs = list(tensor.iter_lane_pairs(KIND_COUNTER, lee, jungle, middle))
+    assert pairs == [(
+        ahri,
+        tensor.entry(KIND_COUNTER, lee, jungle, ahri, middle),
+        tensor.entry(KIND_COUNTER, ahri, middle, lee, jungle),
+    )]
+    assert pairs[0][2]["games"] == 12001
+
+    # 반대쪽 파일이 없으면 None
+    assert list(tensor.iter_lane_pairs(KIND_SYNERGY, lee, jungle, support)) == [
+        (amumu, tensor.entry(KIND_SYNERGY, lee, jungle, amumu, support), None)
+    ]
+    # 정방향 칸이 없어도 반대쪽 항목은 찾음
+    assert tensor.entry_pair(KIND_COUNTER, amumu, support, lee, jungle) == (None, None)
+    forward, backward = tensor.entry_pair(KIND_SYNERGY, amumu, support, lee, jungle)
+    assert forward is None and backward["games"] == 980
+
+
+def test_choose_matchup_source_rule():
+    small = {"games": 100, "pick_rate": 0.5, "win_rate": 50.0}
+    popular = {"games": 100, "pick_rate": 2.0, "win_rate": 50.0}
+    big = {"games": 1000, "pick_rate": 0.5, "win_rate": 50.0}
+    assert choose_matchup_source(big, dict(big), 900, 1.5) == "a"
+    assert choose_matchup_source(big, {**big, "games": 1001}, 900, 1.5) == "b"
+    assert choose_matchup_source(small, popular, 900, 1.5) == "b"
+    assert choose_matchup_source(small, small, 900, 1.5) == "a"
+    assert choose_matchup_source(None, small, 900, 1.5) == "b"
+    assert choose_matchup_source(None, None, 900, 1.5) is None
+
+
+def test_decisions_match_direct_rule(resolve_name):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    lee = tensor.champion_id("LeeSin")
+    ahri = tensor.champion_id("Ahri")
+    amumu = tensor.champion_id("Amumu")
+    jungle, middle, support = LANE_INDEX["jungle"], LANE_INDEX["middle"], LANE_INDEX["support"]
+
+    # 양쪽 모두 유효 → games가 많은 a (Lee Sin 파일, 12345판). 카운터 a는 승률을 뒤집음
+    decisions = MatchupDecisions(tensor, 900, 1.5, 10000)
+    decision = decisions.decision(KIND_COUNTER, lee, jungle, ahri, middle)
+    assert decision["source"] == "a"
+    assert decision["entry"]["games"] == 12345
+    assert decision["score"] == 51.69
+    assert decision["include"] and decision["high_sample"] and not decision["low_sample"]
+
+    # 반대 방향 칸: b 파일(Lee Sin)의 항목이 더 많으므로 b, 승률 그대로
+    reverse = decisions.decision(KIND_COUNTER, ahri, middle, lee, jungle)
+    assert reverse["source"] == "b" and reverse["score"] == 48.31
+
+    # 임계값이 높으면 둘 다 무효 → a 우선, 제외 표시
+    strict = MatchupDecisions(tensor, 20000, 50.0, 10000)
+    assert strict.decision(KIND_SYNERGY, lee, jungle, amumu, support)["include"] is False
+    assert strict.matches(tensor, 20000, 50.0) and not strict.matches(tensor, 900, 50.0)
+
+    # a 파일이 없는 칸도 같은 규칙으로 처리
+    fallback = decisions.decision(KIND_SYNERGY, amumu, support, lee, jungle)
+    assert fallback["source"] == "b" and fallback["entry"]["games"] == 980 and not fallback["low_sample"]
+
+    listed = list(decisions.iter_lane_decisions(KIND_COUNTER, lee, jungle, middle))
+    assert listed == [(ahri, decision)]
+
+
+def test_lane_batch_matches_iterated_decisions(resolve_name):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    decisions = MatchupDecisions(tensor, 900, 1.5, 10000)
+    lee = tensor.champion_id("LeeSin")
+    jungle, support = LANE_INDEX["jungle"], LANE_INDEX["support"]
+
+    candidate_ids, scores, flags = decisions.lane_batch(KIND_SYNERGY, lee, jungle, support)
+    listed = list(decisions.iter_lane_decisions(KIND_SYNERGY, lee, jungle, support))
+    assert list(candidate_ids) == [cid for cid, _decision in listed]
+    assert list(scores) == [decision["score"] for _cid, decision in listed]
+    assert decisions.lane_batch(KIND_SYNERGY, lee, jungle, support) is decisions.lane_batch(KIND_SYNERGY, lee, jungle, support)
+    assert decisions.lane_batch(KIND_SYNERGY, lee, LANE_INDEX["top"], support) == ((), (), ())
+    assert decisions.listed_decision(KIND_SYNERGY, lee, jungle, candidate_ids[0], support) == listed[0][1]
+
+
+def test_decisions_compile_only_queried_segments(resolve_name):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    decisions = MatchupDecisions(tensor, 900, 1.5, 10000)
+    assert decisions._segments == {}
+    lee = tensor.champion_id("LeeSin")
+    jungle, support = LANE_INDEX["jungle"], LANE_INDEX["support"]
+
+    decisions.lane_batch(KIND_SYNERGY, lee, jungle, support)
+    row = tensor.row_index(lee, jungle)
+    assert list(decisions._segments) == [(KIND_SYNERGY, row, support)]
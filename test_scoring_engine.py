@@ -0,0 +1,148 @@
+import pytest
+
+from matchup_tensor import compile_matchup_tensor
+from scoring_engine import RECOMMEND_LOW_SAMPLE_TAG, ScoringEngine, SlotState
+from weight_settings_tab import build_lane_weight_matrices
+
+
+PAYLOADS = {
+    "ahri_middle.json": {
+        "counters": {"middle": {"Zed": {"win_rate": "47.00", "popularity": "9.00", "games": "20,000"}}},
+        "synergy": {"jungle": {"Lee Sin": {"win_rate": "52.00", "pick_rate": "3.00", "games": "5,000"}}},
+    },
+    "zed_middle.json": {
+        "counters": {"middle": {"Ahri": {"win_rate": "53.50", "popularity": "8.00", "games": "19,000"}}},
+        "synergy": {},
+    },
+    "garen_middle.json": {
+        "counters": {"middle": {"Zed": {"win_rate": "49.00", "popularity": "1.00", "games": "500"}}},
+        "synergy": {},
+    },
+    "lee_sin_jungle.json": {
+        "counters": {},
+        "synergy": {"middle": {
+            "Ahri": {"win_rate": "51.00", "pick_rate": "4.00", "games": "4,000"},
+            "Garen": {"win_rate": "50.50", "pick_rate": "2.00", "games": "600"},
+        }},
+    },
+}
+
+ENEMIES = (SlotState("enemies", 0, "Zed", "Zed", "middle", "middle"),)
+
+
+@pytest.fixture
+def lane_weights():
+    """미드 기준: 상대 미드 카운터와 아군 정글 시너지만 반영."""
+    return build_lane_weight_matrices({
+        "counter": {"lane_weight_map": {"middle": {"middle": 1.0}}},
+        "synergy": {"lane_weight_map": {"middle": {"jungle": 0.7}}},
+    })
+
+
+def _allies(my_champion="Ahri"):
+    return (
+        SlotState("allies", 0, "LeeSin", "Lee Sin", "jungle", "jungle"),
+        SlotState("allies", 1, my_champion, my_champion, "middle" if my_champion else None, "middle"),
+    )
+
+
+def test_score_slot_is_headless_and_normalized(resolve_name, make_draft):
+    engine = ScoringEngine(compile_matchup_tensor(PAYLOADS, resolve_name))
+    draft = make_draft(_allies(), ENEMIES)
+    score, details = engine.score_slot(draft, draft.allies[1])
+
+    # 시너지: Ahri 파일(5000판)이 Lee Sin 파일(4000판)보다 많아 b 쪽 52.00
+    assert details["synergy_entries"] == [("Lee Sin", "jungle", 52.0, 0.7, 52.0 * 0.7)]
+    # 카운터: Zed 파일(19000판)보다 Ahri 파일(20000판)이 많아 내 승률 47.00 그대로
+    assert details["counter_entries"] == [("Zed", "middle", 47.0, 47.0, 1.0, 47.0)]
+    assert score == 52.0 + 47.0
+
+    excluded = make_draft(_allies(), (SlotState("enemies", 0, "Zed", "Zed", "middle", "middle", excluded=True),))
+    assert engine.score_slot(excluded, excluded.allies[1])[1]["counter_entries"] == []
+
+
+def test_recommend_skips_selected_and_banned(resolve_name, make_draft):
+    engine = ScoringEngine(compile_matchup_tensor(PAYLOADS, resolve_name))
+
+    names = [row[0] for row in engine.recommend(make_draft(_allies(None), ENEMIES))]
+    assert names == ["Ahri", "Garen"]
+    garen = engine.recommend(make_draft(_allies(None), ENEMIES))[1]
+    assert RECOMMEND_LOW_SAMPLE_TAG in garen[7]
+
+    banned = make_draft(_allies(None), ENEMIES, banned=frozenset({"ahri"}))
+    assert [row[0] for row in engine.recommend(banned)] == ["Garen"]
+    # 상대가 이미 고른 챔피언도 제외
+    picked = make_draft(_allies(None), (SlotState("enemies", 0, "Garen", "Garen", "top", "top"),))
+    assert "Garen" not in [row[0] for row in engine.recommend(picked)]
+    assert engine.recommend(make_draft(_allies(), ENEMIES, my_lane="top")) == []
+
+
+def test_recommend_updates_only_changed_slots(resolve_name, make_draft):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    engine = ScoringEngine(tensor)
+    draft = make_draft(_allies(None), ENEMIES)
+    engine.recommend(draft)
+    state = engine.recommendation_state(draft)
+    assert state.changed_slots == 0
+
+    # 상대 슬롯 하나만 바꾸면 그 슬롯만 다시 계산하고, 새 엔진과 같은 결과
+    changed = make_draft(_allies(None), (SlotState("enemies", 0, "Ahri", "Ahri", "middle", "middle"),))
+    result = engine.recommend(changed)
+    assert engine.recommendation_state(changed) is state
+    assert ScoringEngine(tensor).recommend(changed) == result
+    engine.recommend(changed)
+    engine.recommend(draft)
+    assert state.changed_slots == 1
+    assert engine.recommend(draft) == ScoringEngine(tensor).recommend(draft)
+
+    # 임계값이 바뀌면 상태를 새로 만듦
+    strict = make_draft(_allies(None), ENEMIES, min_games=20000)
+    assert engine.recommendation_state(strict) is not state
+
+
+def test_score_slot_is_cached_per_draft_state(resolve_name, make_draft):
+    engine = ScoringEngine(compile_matchup_tensor(PAYLOADS, resolve_name))
+    draft = make_draft(_allies(), ENEMIES)
+    first = engine.score_slot(draft, draft.allies[1])
+    # 슬롯 점수와 팀 조합 점수가 같은 결과를 공유
+    engine.team_stats(draft, "allies")
+    assert engine.score_slot(draft, draft.allies[1]) is first
+    # 같은 상태로 새로 만든 draft도 캐시를 씀
+    same = make_draft(_allies(), ENEMIES)
+    assert engine.score_slot(same, same.allies[1]) is first
+
+    # 상대 슬롯/임계값/가중치가 바뀌면 다시 계산
+    changed = make_draft(_allies(), (SlotState("enemies", 0, "Zed", "Zed", "middle", "middle", excluded=True),))
+    assert engine.score_slot(changed, changed.allies[1])[0] == 52.0
+    strict = make_draft(_allies(), ENEMIES, min_games=30000)
+    assert engine.score_slot(strict, strict.allies[1]) is not first
+    reweighted = make_draft(_allies(), ENEMIES, lane_weights=build_lane_weight_matrices({}))
+    assert engine.score_slot(reweighted, reweighted.allies[1]) is not first
+
+
+def test_recommend_page_matches_full_sort(resolve_name, make_draft):
+    engine = ScoringEngine(compile_matchup_tensor(PAYLOADS, resolve_name))
+    draft = make_draft(_allies(None), ENEMIES)
+    full = engine.recommend(draft)
+
+    assert engine.recommend(draft, limit=1) == full[:1]
+    first, count = engine.recommend_page(draft, 0, 1)
+    second, _count = engine.recommend_page(draft, 1, 1)
+    assert count == len(full) == 2
+    assert first + second == full
+    assert engine.recommend_page(draft, 5, 1) == ([], 2)
+    assert engine.recommend_page(make_draft(_allies(), ENEMIES, my_lane="top"), 0, 20) == ([], 0)
+
+
+def test_recommend_all_lanes_matches_single_lane(resolve_name, make_draft):
+    tensor = compile_matchup_tensor(PAYLOADS, resolve_name)
+    engine = ScoringEngine(tensor)
+    draft = make_draft(_allies(None), ENEMIES)
+
+    by_lane = engine.recommend_all_lanes(draft)
+    assert by_lane["middle"] == ScoringEngine(tensor).recommend(draft)
+    # 라인 선택값이 jungle인 아군 슬롯(Lee Sin)이 대상
+    assert by_lane["jungle"] == ScoringEngine(tensor).recommend(make_draft(_allies(None), ENEMIES, my_lane="jungle"))
+    assert by_lane["top"] == []
+    # 라인별 상태가 유지되어 다시 계산해도 같은 결과
+    assert engine.recommend_all_lanes(draft, limit=1)["middle"] == by_lane["middle"][:1]
@@ -8,6 +8,8 @@ class TestSmartLaneAssignment:
         root = tk.Tk()
         root.withdraw()
         app = ChampionScraperApp(root)
+        # 라인 배정은 로딩이 끝나기 전에는 미뤄지므로 데이터 준비를 기다림
+        app.data_store.wait(10.0)
         yield app
         root.destroy()
 
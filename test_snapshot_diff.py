@@ -0,0 +1,95 @@
+from snapshot_diff import (
+    CHANGE_BAN_ADDED,
+    CHANGE_BAN_REMOVED,
+    CHANGE_LANE,
+    CHANGE_ORDER,
+    CHANGE_PHASE,
+    CHANGE_PICK,
+    SnapshotChange,
+    ban_ids,
+    diff_snapshots,
+)
+
+
+def _snapshot(allies=(), enemies=(), phase="BAN_PICK", ally_bans=(), enemy_bans=()):
+    def entries(picks):
+        return [{"cellId": cell, "championId": cid, "assignedPosition": lane} for cell, cid, lane in picks]
+
+    return {
+        "phase": phase,
+        "allies": entries(allies),
+        "enemies": entries(enemies),
+        "allyBans": list(ally_bans),
+        "enemyBans": list(enemy_bans),
+    }
+
+
+def test_first_snapshot_is_full():
+    diff = diff_snapshots(None, _snapshot())
+    assert diff.full and diff
+    assert diff.bans_changed() and diff.phase_changed()
+
+
+def test_identical_snapshots_have_no_changes():
+    snapshot = _snapshot([(0, 103, "middle")], ally_bans=[1])
+    diff = diff_snapshots(snapshot, _snapshot([(0, 103, "middle")], ally_bans=[1]))
+    assert not diff
+    assert diff.slot_changes("allies") == []
+
+
+def test_hover_and_lane_changes_are_per_slot():
+    previous = _snapshot([(0, 103, "middle"), (1, 64, "")], [(5, 122, "top")])
+    current = _snapshot([(0, 103, "jungle"), (1, 412, "")], [(5, 122, "top")])
+    diff = diff_snapshots(previous, current)
+    assert diff.changes == (
+        SnapshotChange(CHANGE_LANE, "allies", 0, "middle", "jungle"),
+        SnapshotChange(CHANGE_PICK, "allies", 1, 64, 412),
+    )
+    assert diff.slot_changes("allies") == list(diff.changes)
+    assert diff.slot_changes("enemies") == []
+    assert not diff.bans_changed()
+
+
+def test_added_and_removed_slots_change_order():
+    previous = _snapshot([(0, 103, ""), (1, 64, "")])
+    current = _snapshot([(0, 103, ""), (2, 412, "")])
+    diff = diff_snapshots(previous, current)
+    assert diff.changes == (
+        SnapshotChange(CHANGE_PICK, "allies", 2, None, 412),
+        SnapshotChange(CHANGE_PICK, "allies", 1, 64, None),
+        SnapshotChange(CHANGE_ORDER, "allies", None, (0, 1), (0, 2)),
+    )
+
+
+def test_reordered_slots_and_phase():
+    previous = _snapshot([(0, 103, ""), (1, 64, "")], phase="PLANNING")
+    current = _snapshot([(1, 64, ""), (0, 103, "")], phase="BAN_PICK")
+    diff = diff_snapshots(previous, current)
+    assert diff.changes == (
+        SnapshotChange(CHANGE_PHASE, previous="PLANNING", value="BAN_PICK"),
+        SnapshotChange(CHANGE_ORDER, "allies", None, (0, 1), (1, 0)),
+    )
+
+
+def test_phase_falls_back_to_timer():
+    previous = {"timer": {"phase": "BAN_PICK"}}
+    current = {"timer": {"phase": "FINALIZATION"}}
+    diff = diff_snapshots(previous, current)
+    assert diff.changes == (SnapshotChange(CHANGE_PHASE, previous="BAN_PICK", value="FINALIZATION"),)
+    assert diff.slot_changes("allies") == diff.slot_changes("enemies") == []
+
+
+def test_ban_changes_count_duplicates():
+    diff = diff_snapshots(_snapshot(ally_bans=[1, 2]), _snapshot(ally_bans=[2, 3], enemy_bans=[3]))
+    assert diff.changes == (
+        SnapshotChange(CHANGE_BAN_ADDED, "allies", value=3),
+        SnapshotChange(CHANGE_BAN_REMOVED, "allies", previous=1),
+        SnapshotChange(CHANGE_BAN_ADDED, "enemies", value=3),
+    )
+    assert diff.bans_changed()
+
+
+def test_ban_ids_reads_legacy_bans_struct():
+    snapshot = {"bans": {"myTeamBans": [0, 7, "x"], "theirTeamBans": [9]}}
+    assert ban_ids(snapshot, "allies") == [7]
+    assert ban_ids(snapshot, "enemies") == [9]
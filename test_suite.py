@@ -24,9 +24,12 @@ from lobby_manager import (
     alias_variants,
     contains_hangul_syllable,
     load_alias_tables,
+    LcuLatencyStats,
+    LcuPollScheduler,
     LANES,
     BANPICK_DEFAULT_LANES
 )
+from snapshot_diff import diff_snapshots
 
 
 @pytest.fixture
@@ -129,6 +132,53 @@ class TestHangulDetection:
         assert contains_hangul_syllable("") == False
 
 
+class TestLcuLatencyStats:
+    """Test per-path LCU latency statistics."""
+
+    def test_records_per_path(self):
+        stats = LcuLatencyStats()
+        stats.session_opened()
+        stats.record("/lol-champ-select/v1/session", 0.004)
+        stats.record("/lol-champ-select/v1/session", 0.002)
+        stats.record("/lol-champ-select/v1/all-grid-champions", 0.010)
+
+        snapshot = stats.snapshot()
+        session = snapshot["/lol-champ-select/v1/session"]
+        assert session["count"] == 2
+        assert session["avg_ms"] == pytest.approx(3.0)
+        assert session["max_ms"] == pytest.approx(4.0)
+        assert session["last_ms"] == pytest.approx(2.0)
+        assert snapshot["/lol-champ-select/v1/all-grid-champions"]["count"] == 1
+        assert stats.sessions == 1
+
+    def test_summary_lists_paths(self):
+        stats = LcuLatencyStats()
+        assert stats.summary() == "LCU 세션 생성 0회"
+        stats.record("/a", 0.001)
+        assert stats.summary().splitlines()[1].startswith("/a: 1회 평균 1.0ms")
+
+
+class TestLcuPollScheduler:
+    """Test adaptive polling intervals."""
+
+    def test_backs_off_without_session(self):
+        scheduler = LcuPollScheduler(base_interval=2.0, idle_max_interval=8.0)
+        assert [scheduler.next_interval(None) for _ in range(5)] == [2.0, 4.0, 8.0, 8.0, 8.0]
+        # 세션이 보이면 다시 기본 간격부터
+        scheduler.next_interval({"phase": "FINALIZATION"})
+        assert scheduler.next_interval(None) == 2.0
+
+    def test_polls_fast_during_pick_and_ban(self):
+        scheduler = LcuPollScheduler(base_interval=2.0, active_interval=0.5)
+        assert scheduler.next_interval({"timer": {"phase": "BAN_PICK", "adjustedTimeLeftInPhase": 25000}}) == 0.5
+        assert scheduler.next_interval({"phase": "FINALIZATION", "timer": {"adjustedTimeLeftInPhase": 30000}}) == 2.0
+
+    def test_wakes_at_phase_end(self):
+        scheduler = LcuPollScheduler(base_interval=2.0, min_interval=0.25)
+        assert scheduler.next_interval({"phase": "FINALIZATION", "timer": {"adjustedTimeLeftInPhase": 900}}) == pytest.approx(1.0)
+        assert scheduler.next_interval({"phase": "BAN_PICK", "timer": {"adjustedTimeLeftInPhase": 10}}) == 0.25
+
+
 class TestLCUDataNormalization:
     """Test LCU data normalization and processing."""
     
@@ -270,6 +320,86 @@ class TestSnapshotApplication:
                 app_instance._apply_client_snapshot(snapshot)
                 mock_update.assert_called_once()
 
+    def test_lane_assignment_deferred_until_data_ready(self, app_instance):
+        """Unpositioned picks are not assigned while data loads (no UI-thread wait) and are re-applied once it is ready."""
+        app_instance.data_store = MagicMock(is_ready=False)
+        entries = [{"canonical": "Viego", "assignedPosition": ""}]
+        assert app_instance._resolve_lane_conflicts_by_pick_rate("enemies", entries) == entries
+        assert entries[0]["assignedPosition"] == ""
+        assert app_instance._deferred_client_lane_sides == {"enemies"}
+
+        app_instance.last_client_snapshot = {"allies": [], "enemies": [{"name": "Viego", "championId": 234}]}
+        with patch.object(app_instance, '_populate_side_from_client', return_value=True) as mock_populate:
+            app_instance._run_deferred_lane_assignment()
+        assert [call.args[0] for call in mock_populate.call_args_list] == ["enemies"]
+        assert mock_populate.call_args.kwargs["force"] is True
+        assert app_instance._deferred_client_lane_sides == set()
+
+    def test_apply_client_snapshot_diff_touches_changed_side_only(self, app_instance):
+        """A watcher diff only repopulates the side whose slots changed and skips unchanged bans."""
+        previous = {"phase": "BAN_PICK", "allies": [{"cellId": 0, "championId": 86}], "enemies": [], "allyBans": [1]}
+        snapshot = {**previous, "enemies": [{"cellId": 5, "championId": 122}]}
+        diff = diff_snapshots(previous, snapshot)
+
+        with patch.object(app_instance, '_populate_side_from_client', return_value=True) as mock_populate:
+            with patch.object(app_instance, '_update_banned_champions_from_snapshot') as mock_bans:
+                with patch.object(app_instance, 'update_banpick_recommendations'):
+                    assert app_instance._apply_client_snapshot(snapshot, diff) is True
+        assert [call.args[0] for call in mock_populate.call_args_list] == ["enemies"]
+        mock_bans.assert_not_called()
+
+    def test_apply_client_snapshot_diff_updates_matching_slot_only(self, app_instance):
+        """A hover/lane change on a known cellId refills that slot and schedules the recompute instead of a full update."""
+        previous = {
+            "phase": "BAN_PICK",
+            "allies": [
+                {"cellId": 0, "championId": 86, "assignedPosition": "top"},
+                {"cellId": 1, "championId": 64, "assignedPosition": "jungle"},
+            ],
+            "enemies": [],
+        }
+        snapshot = {**previous, "allies": [previous["allies"][0], {"cellId": 1, "championId": 234, "assignedPosition": "jungle"}]}
+        diff = diff_snapshots(previous, snapshot)
+        slots = app_instance.banpick_slots["allies"]
+        slots[0]["client_cell_id"], slots[1]["client_cell_id"] = 1, 0
+
+        with patch.object(app_instance, '_normalize_client_entries', side_effect=lambda entries: [dict(e) for e in entries]) as mock_normalize:
+            with patch.object(app_instance, '_populate_slot_from_client', return_value=True) as mock_slot:
+                with patch.object(app_instance, '_populate_side_from_client') as mock_side:
+                    with patch.object(app_instance, 'update_banpick_recommendations') as mock_update:
+                        with patch.object(app_instance, 'schedule_recompute') as mock_schedule:
+                            assert app_instance._apply_client_snapshot(snapshot, diff) is True
+        mock_side.assert_not_called()
+        mock_update.assert_not_called()
+        mock_schedule.assert_called_once()
+        assert [len(call.args[0]) for call in mock_normalize.call_args_list] == [1]
+        assert mock_slot.call_count == 1
+        assert mock_slot.call_args.args[0] is slots[0]
+        assert mock_slot.call_args.args[1]["championId"] == 234
+
+
+class TestRecomputeScheduler:
+    """Test that dashboard invalidations coalesce into one recompute per idle cycle."""
+
+    def test_schedule_recompute_coalesces(self, app_instance, mock_root):
+        mock_root.update()
+        skipped = app_instance.recompute_skipped_count
+        with patch.object(app_instance, '_render_recommendations') as mock_render:
+            for _ in range(5):
+                app_instance.schedule_recompute()
+            mock_render.assert_not_called()
+            mock_root.update()
+            assert mock_render.call_count == 1
+        assert app_instance.recompute_skipped_count == skipped + 4
+
+    def test_direct_update_flushes_pending(self, app_instance, mock_root):
+        mock_root.update()
+        with patch.object(app_instance, '_render_recommendations') as mock_render:
+            app_instance.schedule_recompute()
+            app_instance.update_banpick_recommendations()
+            mock_root.update()
+            assert mock_render.call_count == 1
+
 
 class TestDuplicateLaneDetection:
     """Test detection of duplicate lanes in the same team."""
@@ -0,0 +1,21 @@
+from common import LANES
+from weight_settings_tab import LANE_WEIGHT_DEFAULT, build_lane_weight_matrices
+
+
+def test_lane_weight_matrices_prefer_saved_overrides():
+    settings = {
+        "counter": {"lane_weight_map": {"top": {"top": 1.0, "jungle": 0.7}}},
+        "synergy": {"lane_weight_map": {"bottom": {"support": 0.7}}},
+    }
+    overrides = {"top": {"counter": {"jungle": 0.25}}}
+    matrices = build_lane_weight_matrices(settings, overrides)
+
+    top, jungle, support, bottom = (LANES.index(lane) for lane in ("top", "jungle", "support", "bottom"))
+    counter = matrices["counter"]
+    assert len(counter) == len(LANES) and all(len(row) == len(LANES) for row in counter)
+    assert counter[top][top] == 1.0
+    assert counter[top][jungle] == 0.25
+    assert counter[jungle][top] == LANE_WEIGHT_DEFAULT
+    assert matrices["synergy"][bottom][support] == 0.7
+    # 저장값이 없으면 기본값 표는 그대로
+    assert build_lane_weight_matrices(settings)["counter"][top][jungle] == 0.7
@@ -157,6 +157,38 @@ def load_weight_settings():
     
     return default_weights
 
+def weight_settings_mtime():
+    """가중치 설정 파일의 수정 시각 (파일이 없으면 None). 캐시 무효화 판단용."""
+    try:
+        return os.path.getmtime(WEIGHT_SETTINGS_FILE)
+    except OSError:
+        return None
+
+def build_lane_weight_matrices(weight_settings, lane_overrides=None):
+    """
+    라인 가중치를 {"counter": 5×5, "synergy": 5×5} 행렬로 만듭니다.
+    matrix[나의 라인][상대/아군 라인] 순서이며 인덱스는 LANES 순서입니다.
+    lane_overrides(ui_settings["lane_weights"])에 저장된 값이 기본값보다 우선합니다.
+    """
+    lane_overrides = lane_overrides or {}
+    matrices = {}
+    for weight_type in ("counter", "synergy"):
+        lane_weight_map = weight_settings.get(weight_type, {}).get("lane_weight_map", {})
+        matrix = []
+        for target_lane in LANES:
+            mapping = lane_weight_map.get(target_lane, {})
+            saved = lane_overrides.get(target_lane, {}).get(weight_type, {})
+            row = []
+            for source_lane in LANES:
+                saved_weight = saved.get(source_lane)
+                if saved_weight is not None:
+                    row.append(float(saved_weight))
+                else:
+                    row.append(mapping.get(source_lane, LANE_WEIGHT_DEFAULT))
+            matrix.append(row)
+        matrices[weight_type] = matrix
+    return matrices
+
 class WeightSettingsTab:
     def __init__(self, notebook, app_context):
         self.notebook = notebook
@@ -295,11 +327,8 @@ class WeightSettingsTab:
         
         self.app.ui_settings["lane_weights"][target_lane][weight_type][source_lane] = round(weight_value, 2)
         self.app._save_ui_settings()
+        self.app.invalidate_lane_weights()
         
-        # 추천 업데이트
-        self.app.update_banpick_recommendations()
-        if hasattr(self.app, "update_team_total_scores"):
-            self.app.update_team_total_scores()
-        if hasattr(self.app, "_update_all_slot_scores"):
-            self.app._update_all_slot_scores()
+        # 추천/조합 점수/슬롯 점수 재계산 예약 (연속 입력은 한 번으로 합쳐짐)
+        self.app.schedule_recompute()
 